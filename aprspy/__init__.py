@@ -1,13 +1,17 @@
 #!/usr/bin/env python
 
-import re
 import logging
 
-from hashlib import md5
 from collections import namedtuple
 from datetime import datetime
+from typing import Callable, Iterable, Iterator, Tuple, Union
 
 from .exceptions import ParseError, UnsupportedError
+from .tokenizer import Raw, tokenize, decode_text, is_valid_destination
+from .dispatch import registry, Dispatch, BEACON_ADDRESSES, PacketRegistry
+from .checksum import Checksum, get_function as get_checksum_function, \
+    set_default as set_default_checksum
+from .components import Path
 from .packets.generic import GenericPacket
 from .packets.beacon import BeaconPacket
 from .packets.position import PositionPacket
@@ -25,22 +29,29 @@ __version__ = "0.3.3"
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Named tuple to hold original raw values
-Raw = namedtuple('Raw', ['source', 'destination', 'path', 'information'])
-
-BEACON_ADDRESSES = [
-    'AIR', 'ALL', 'AP', 'BEACON', 'CQ', 'GPS', 'DF', 'DGPS', 'DRILL', 'DX', 'ID', 'JAVA', 'MAIL',
-    'MICE', 'QST', 'QTH', 'RTCM', 'SKY', 'SPACE', 'SPC', 'SYM', 'TEL', 'TEST', 'TLM', 'WX', 'ZIP'
-]
+# Named tuple to hold a packet that could not be parsed, along with the exception raised
+ParseFailure = namedtuple('ParseFailure', ['packet', 'error'])
 
 
 def _handle_err(exception: Exception, packet: str, strict_mode: bool = True):
     if not strict_mode:
-        logger.warning("Returning generic packet for: {}".format(packet))
+        logger.warning("Returning generic packet for: %s", packet)
     else:
         raise exception
 
 
+def _rstrip_view(packet: memoryview) -> memoryview:
+    """
+    Strip trailing line endings from a packet given as a memoryview, without copying it.
+    """
+    end = len(packet)
+
+    while end and packet[end - 1] in (10, 13):
+        end -= 1
+
+    return packet[:end]
+
+
 class APRS:
     """
     Main APRS class.
@@ -50,42 +61,153 @@ class APRS:
     """
 
     @staticmethod
-    def parse(packet: str = None, timestamp: datetime = None,
-              strict_mode: bool = True) -> GenericPacket:
+    def parse(packet: Union[str, bytes, memoryview] = None, timestamp: datetime = None,
+              strict_mode: bool = True, lazy: bool = False,
+              checksum: Union[Checksum, str] = None) -> GenericPacket:
         """
         Parse an APRS packet, and return a subclass of :class:`APRSPacket` appropriate for the
         packet type.
 
-        :param str packet: a raw packet
+        :param str packet: a raw packet, as a string or as bytes (or a ``memoryview``)
         :param datetime timestamp: an (optional) timestamp indicating when the packet arrived
+        :param bool strict_mode: whether to raise errors (``True``) or return generic packets
+        :param bool lazy: whether to defer decoding the information field
+        :param Checksum checksum: the type of checksum to calculate (by default, the type set with
+            :func:`set_default_checksum` is used)
 
         Given a raw packet, this function will return a object that is a subclass of
         :class:`APRSPacket`.
+
+        If ``timestamp`` is given, it is also used as the reference time when decoding any
+        timestamp within the packet. A naive ``timestamp`` (without a timezone) is assumed to be
+        UTC.
+
+        If ``lazy`` is ``True``, the packet type is determined and the source, destination, path,
+        data type ID and checksum are set, but the rest of the information field (such as the
+        position, timestamp or comment) isn't decoded until one of the fields which depend on it is
+        first read. This avoids most of the work of parsing a packet when only the header fields are
+        needed. Since decoding is deferred, errors in the information field are raised (in strict
+        mode) when a decoded field is first read, rather than by this function.
+
+        Packets read from a socket or file can be given as bytes (or a ``memoryview`` of a buffer),
+        without decoding them first. They're decoded as UTF-8, or as Latin-1 (which some older
+        clients send) if they aren't valid UTF-8 - see :func:`aprspy.tokenizer.decode_text`.
+        """
+        return APRS._parse(packet, timestamp, strict_mode, logger.isEnabledFor(logging.DEBUG),
+                           lazy, get_checksum_function(checksum))
+
+    @staticmethod
+    def parse_many(packets: Iterable[Union[str, bytes, Tuple[str, datetime]]],
+                   timestamp: datetime = None, strict_mode: bool = True,
+                   on_error: Callable[[ParseFailure], object] = None,
+                   lazy: bool = False, checksum: Union[Checksum, str] = None) -> Iterator:
+        """
+        Parse a number of APRS packets, yielding a subclass of :class:`APRSPacket` for each.
+
+        :param iterable packets: an iterable of raw packets (such as a file or list), or of tuples
+            of a raw packet and the timestamp it arrived at, as strings or bytes (see :func:`parse`)
+        :param datetime timestamp: an (optional) timestamp to use for packets without one
+        :param bool strict_mode: whether to raise errors (``True``) or return generic packets
+        :param callable on_error: an (optional) callable, given a :class:`ParseFailure` for each
+            packet that could not be parsed
+        :param bool lazy: whether to defer decoding the information field of each packet (see
+            :func:`parse`)
+        :param Checksum checksum: the type of checksum to calculate (see :func:`parse`)
+
+        Unlike :func:`parse`, this never raises :class:`ParseError` or :class:`UnsupportedError`.
+        Instead, a :class:`ParseFailure` containing the raw packet and the exception is yielded in
+        place of the packet. If ``on_error`` is given, its return value is yielded instead, unless
+        it returns ``None`` - in which case nothing is yielded.
+
+        Trailing line endings are stripped from each packet, so a file (whether opened in text or
+        binary mode) can be passed directly.
+        """
+        # Check the logging level once, rather than for every packet
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        checksum_function = get_checksum_function(checksum)
+
+        for packet in packets:
+            if type(packet) is tuple:
+                (packet, packet_timestamp) = packet
+            else:
+                packet_timestamp = timestamp
+
+            if type(packet) is memoryview:
+                packet = _rstrip_view(packet)
+            else:
+                packet = packet.rstrip("\r\n" if type(packet) is str else b"\r\n")
+
+            try:
+                yield APRS._parse(packet, packet_timestamp, strict_mode, debug, lazy,
+                                  checksum_function)
+
+            except (ParseError, UnsupportedError) as e:
+                failure = ParseFailure(packet=packet, error=e)
+
+                if on_error is None:
+                    yield failure
+                else:
+                    result = on_error(failure)
+                    if result is not None:
+                        yield result
+
+    @staticmethod
+    def _parse(packet: Union[str, bytes, memoryview], timestamp: datetime, strict_mode: bool,
+               debug: bool, lazy: bool = False,
+               checksum_function: Callable = None) -> GenericPacket:
         """
+        Parse an APRS packet.
+
+        See :func:`parse`. ``debug`` indicates whether debug logging is enabled, and
+        ``checksum_function`` is the function used to calculate the checksum (if any).
+        """
+        if type(packet) is not str:
+            # Decode the whole packet at once, which is quicker than splitting the header on the
+            # bytes and decoding each field
+            packet = decode_text(packet)
 
         try:
             # Parse out the source, destination, path and information fields
-            (source, destination, path, data_type_id, info) = re.match(
-                r'([\w\d\-]+)>([\w\d\-]+),([\w\d\-\*\,]+):(.)(.*)',
-                packet
-            ).groups()
-        except AttributeError:
-            _handle_err(
-                ParseError("Could not parse packet details", packet),
-                packet,
-                strict_mode
-            )
-            p = GenericPacket()
+            (raw, data_type_id) = tokenize(packet)
+        except ParseError as e:
+            _handle_err(e, packet, strict_mode)
+
+            # Without the header fields there is nothing more we can do
+            return GenericPacket()
+
+        return APRS._parse_raw(raw, data_type_id, packet, timestamp, strict_mode, debug, lazy,
+                               checksum_function)
+
+    @staticmethod
+    def _parse_raw(raw: Raw, data_type_id: str, packet: object, timestamp: datetime,
+                   strict_mode: bool, debug: bool, lazy: bool = False,
+                   checksum_function: Callable = None, path: Path = None) -> GenericPacket:
+        """
+        Parse an APRS packet which has already been split into its fields.
+
+        See :func:`_parse`. ``packet`` is the packet as received, which is only used for logging and
+        errors. If ``path`` is given, it's used as the path of the packet in place of parsing the
+        path in ``raw`` (for example, by :mod:`aprspy.ax25`, which decodes the path directly).
+        """
+        (source, destination, raw_path, info) = raw
+
+        if path is None:
+            path = raw_path
 
         # Create a checksum, to provide a quick comparison against other packets
-        checksum = md5((source + info).encode()).hexdigest()
-        logger.debug("Packet checksum is {}".format(checksum))
+        if checksum_function is not None:
+            checksum = checksum_function(source, info)
+        else:
+            checksum = None
 
-        logger.debug("Raw packet: {}".format(packet))
+        if debug:
+            logger.debug("Packet checksum is %s", checksum)
+            logger.debug("Raw packet: %s", packet)
+            logger.debug("Destination length is %s", len(destination))
 
         # Do some basic sanity checking
         # The source and destination fields should be a maximum of 9 characters
-        logger.debug("Destination length is {}".format(len(destination)))
         if len(source) > 9:
             _handle_err(
                 ParseError("Source address is longer than 9 characters", packet),
@@ -103,7 +225,7 @@ class APRS:
             p = GenericPacket()
 
         # The destination field should be upper case
-        if not re.match(r'^[A-Z0-9]{1,6}(\-[0-9]{1,2})?$', destination):
+        if not is_valid_destination(destination):
             _handle_err(
                 ParseError("Destination address is invalid", packet),
                 packet,
@@ -111,132 +233,13 @@ class APRS:
             )
             p = GenericPacket()
 
-        # Check for common beacon destinations
-        if destination in BEACON_ADDRESSES:
-            logger.debug("Packet is a beacon packet")
-            p = BeaconPacket()
-
-        elif data_type_id in '!/=@':
-            logger.debug("Packet is a position packet")
-            p = PositionPacket()
-
-            if len(info) < 4:
-                # TODO - handle this properly
-                _handle_err(
-                    ParseError("Packet is too short."),
-                    packet,
-                    strict_mode
-                )
-                p = GenericPacket()
-
-        elif data_type_id in "`'":
-            logger.debug("Packet is a Mic-E packet")
-            p = MICEPacket()
-
-        elif data_type_id == ";":
-            logger.debug("Packet is an object packet")
-            p = ObjectPacket()
-
-        elif data_type_id == ")":
-            _handle_err(
-                UnsupportedError("Unsupported data type: '<' (Item Report) - C11 P57"),
-                packet,
-                strict_mode
-            )
-            p = GenericPacket()
-
-        # Check for the presence of PARM, UNIT, EQNS or BITS, indicating a message defining
-        # telemetry data. The APRS spec places a 67-character limit on the message field, but
-        # it's common to see telemetry definitions exceed this
-        elif re.search(r'::[A-Za-z0-9\-]+\s?:(PARM|UNIT|EQNS|BITS)\.', packet):
-            definition_type = re.search(
-                r'::[A-Za-z0-9\-]+\s?:(PARM|UNIT|EQNS|BITS)\.',
-                packet
-            ).groups()[0]
-
-            if definition_type == "PARM":
-                p = TelemetryParameterNamePacket()
-
-            elif definition_type == "UNIT":
-                p = TelemetryUnitLabelPacket()
-
-            elif definition_type == "EQNS":
-                p = TelemetryEquationCoefficientsPacket()
-
-            elif definition_type == "BITS":
-                p = TelemetryBitSenseProjectNamePacket()
-
-            else:
-                _handle_err(
-                    ParseError("Invalid telemetry definition type: {}".format(definition_type)),
-                    packet,
-                    strict_mode
-                )
-                p = GenericPacket()
-
-        elif data_type_id == ":":
-            logger.debug("Packet is a message packet")
-            p = MessagePacket()
-
-        elif data_type_id == "T":
-            logger.debug("Packet is a telemetry packet")
-            p = TelemetryPacket()
-
-        elif data_type_id == ">":
-            logger.debug("Packet is a status packet")
-            p = StatusPacket()
-
-        elif data_type_id == "<":
-            logger.debug("Packet is a station capability packet")
-            p = StationCapabilityPacket()
-
-        elif data_type_id == "$":
-            _handle_err(
-                UnsupportedError("Unsupported data type: '$' (Raw NMEA Position Report)"),
-                packet,
-                strict_mode
-            )
-            p = GenericPacket()
-
-        elif data_type_id == "_":
-            _handle_err(
-                UnsupportedError("Unsupported data type: '_' (Positionless Weather Report"),
-                packet,
-                strict_mode
-            )
-            p = GenericPacket()
-
-        elif data_type_id == "*":
-            _handle_err(
-                UnsupportedError("Unsupported data type: '*' (Complete Weather Report"),
-                packet,
-                strict_mode
-            )
-            p = GenericPacket()
-
-        elif 0 <= info.find('!') <= 40:
-            # As per APRS 1.01 C5 P18, position-without-timestamp packets may have the '!' located
-            # anywhere up to the 40th character in the information field. If we're here, test for
-            # that now.
-            logger.debug("Found ! in information field, parsing as position packet")
-            p = PositionPacket()
-
-            # Store the offset
-            p._offset = info.find('!')
-
-            # Because we normally assume the first character of the info field is the data type ID,
-            # update the info field to include it
-            info = data_type_id + info
+        # Determine the packet type
+        try:
+            (p, data_type_id, info) = registry.dispatch(destination, data_type_id, info)
 
-            # Set the data type ID
-            data_type_id = '!'
+        except UnsupportedError as e:
+            _handle_err(e, packet, strict_mode)
 
-        else:
-            _handle_err(
-                UnsupportedError("Unknown data type: {} (raw: {})".format(data_type_id, packet)),
-                packet,
-                strict_mode
-            )
             # Return a generic APRS Packet with the basic info
             p = GenericPacket()
 
@@ -250,8 +253,17 @@ class APRS:
         p.data_type_id = data_type_id
         p._ts = timestamp
 
-        # Add the raw values to the packet object
-        p._raw = Raw(source=source, destination=destination, path=path, information=info)
+        # Add the raw values to the packet object, reusing the tokenized values unless the
+        # information field has been changed
+        if info is not raw.information:
+            raw = raw._replace(information=info)
+
+        p._raw = raw
+
+        if lazy:
+            # Leave decoding the information field until one of the decoded fields is read
+            p._lazy = strict_mode
+            return p
 
         # Call the packet-specific parser
         try:
@@ -273,7 +285,46 @@ class APRS:
             p._ts = timestamp
 
             # Add the raw values to the packet object
-            p._raw = Raw(source=source, destination=destination, path=path, information=info)
+            p._raw = raw
 
         # Return the packet object
         return p
+
+    @staticmethod
+    def register_data_type(data_type_ids: str, packet_class: type):
+        """
+        Register a packet class for one or more data type IDs.
+
+        :param str data_type_ids: one or more data type ID characters
+        :param GenericPacket packet_class: a subclass of :class:`GenericPacket`
+
+        This allows packet types that aren't supported by aprspy (for example, weather reports) to
+        be parsed by :func:`parse`. See :class:`aprspy.dispatch.PacketRegistry`.
+        """
+        registry.register_data_type(data_type_ids, packet_class)
+
+    @staticmethod
+    def register_hook(hook, fallback: bool = False, index: int = None):
+        """
+        Register a hook for determining the packet type.
+
+        :param callable hook: a callable taking the destination, data type ID and information field
+            and returning either a :class:`aprspy.dispatch.Dispatch` or ``None``
+        :param bool fallback: if ``True``, only run the hook if there is no packet class registered
+            for the data type ID
+        :param int index: the position to insert the hook at (by default, it is appended)
+
+        See :class:`aprspy.dispatch.PacketRegistry`.
+        """
+        registry.register_hook(hook, fallback=fallback, index=index)
+
+    @staticmethod
+    def set_default_checksum(checksum: Union[Checksum, str]):
+        """
+        Set the type of checksum calculated when parsing packets, if one isn't given.
+
+        :param Checksum checksum: a :class:`aprspy.checksum.Checksum` (or its value)
+
+        By default, an MD5 checksum is calculated.
+        """
+        set_default_checksum(checksum)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+
+from datetime import datetime, UTC
+from typing import Optional
+
+from . import APRS, ParseFailure, __version__
+from .exceptions import ParseError, UnsupportedError
+from .tokenizer import decode_text
+from .utils import APRSUtils
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Sentinel placed on the queue when the connection is closed
+_CLOSED = object()
+
+
+class APRSISClient:
+    """
+    asyncio client for APRS-IS.
+
+    This connects to an APRS-IS server, logs in and yields parsed packets as they arrive::
+
+        async with APRSISClient("XX1XX", filter="r/51/-114/50") as client:
+            async for packet in client:
+                print(packet)
+
+    Lines are read and parsed in a background task, and placed on a bounded queue. If the consumer
+    falls behind and the queue fills up, the task stops reading from the connection until there is
+    space, so that the server (via TCP flow control) is slowed down rather than packets being
+    buffered without limit.
+
+    As with :func:`aprspy.APRS.parse_many`, packets that cannot be parsed are yielded as
+    :class:`aprspy.ParseFailure` records. If reading from the connection fails (for example, if it's
+    reset or a line is too long), the error is raised once the packets already received have been
+    yielded.
+    """
+
+    def __init__(self, callsign: str, passcode: str = None, host: str = "rotate.aprs2.net",
+                 port: int = 14580, filter: str = None, queue_size: int = 1000,
+                 strict_mode: bool = True, software: str = "aprspy", version: str = __version__):
+        """
+        Create a new APRS-IS client.
+
+        :param str callsign: the callsign to log in with
+        :param str passcode: the APRS-IS passcode (generated from the callsign if not given)
+        :param str host: the APRS-IS server to connect to
+        :param int port: the port to connect to
+        :param str filter: an (optional) server-side filter
+        :param int queue_size: the maximum number of parsed packets to buffer
+        :param bool strict_mode: whether to raise errors (``True``) or return generic packets
+        :param str software: the software name sent when logging in
+        :param str version: the software version sent when logging in
+        """
+        self.callsign = callsign
+        self.passcode = passcode if passcode is not None else APRSUtils.generate_passcode(callsign)
+        self.host = host
+        self.port = port
+        self.filter = filter
+        self.strict_mode = strict_mode
+        self.software = software
+        self.version = version
+
+        # Whether the server has verified our login
+        self.verified = False
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # Whether the connection has closed, and the error that closed it (if any)
+        self._closed = False
+        self._error: Optional[Exception] = None
+
+    @property
+    def login(self) -> str:
+        """Get the login line sent to the server"""
+        login = "user {} pass {} vers {} {}".format(
+            self.callsign, self.passcode, self.software, self.version
+        )
+
+        if self.filter:
+            login += " filter {}".format(self.filter)
+
+        return login
+
+    async def connect(self):
+        """
+        Connect to the server, log in and start reading packets.
+        """
+        logger.info("Connecting to %s:%s", self.host, self.port)
+        (self._reader, self._writer) = await asyncio.open_connection(self.host, self.port)
+
+        await self._send(self.login)
+
+        # Start with an empty queue, rather than anything left from a previous connection (such as
+        # the marker for it closing)
+        self._queue = asyncio.Queue(maxsize=self._queue.maxsize)
+
+        self._closed = False
+        self._error = None
+        self._task = asyncio.create_task(self._read())
+
+    async def close(self):
+        """
+        Close the connection to the server.
+        """
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+        if self._writer is not None:
+            self._writer.close()
+
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+
+            self._writer = None
+
+    async def send_filter(self, filter: str):
+        """
+        Change the server-side filter.
+
+        :param str filter: the new filter
+        """
+        self.filter = filter
+        await self._send("#filter {}".format(filter))
+
+    async def _send(self, line: str):
+        if self._writer is None:
+            raise ConnectionError("Not connected")
+
+        self._writer.write("{}\r\n".format(line).encode())
+        await self._writer.drain()
+
+    async def _read(self):
+        """
+        Read lines from the server, parse them and place them on the queue.
+        """
+        try:
+            while True:
+                try:
+                    line = await self._reader.readline()
+
+                except (ConnectionError, ValueError) as e:
+                    # A reset connection or an overlong line, which ends the stream - the error is
+                    # passed on to the consumer once it has read the packets already queued
+                    logger.error("Error reading from %s:%s: %s", self.host, self.port, e)
+                    self._error = e
+                    break
+
+                if not line:
+                    # Connection closed
+                    break
+
+                # Packets are parsed from the bytes as received (see APRS.parse)
+                line = line.rstrip(b"\r\n")
+
+                if not line:
+                    continue
+
+                if line[0:1] == b"#":
+                    # Server comment (including the login response)
+                    line = decode_text(line)
+                    logger.debug("Server: %s", line)
+                    if line.startswith("# logresp") and " verified" in line \
+                            and " unverified" not in line:
+                        self.verified = True
+
+                    continue
+
+                try:
+                    packet = APRS.parse(line, timestamp=datetime.now(UTC),
+                                        strict_mode=self.strict_mode)
+                except (ParseError, UnsupportedError, ValueError) as e:
+                    packet = ParseFailure(packet=decode_text(line), error=e)
+
+                # This waits if the queue is full, which stops us reading from the connection
+                await self._queue.put(packet)
+
+        except Exception as e:
+            # Anything else is unexpected, but is still passed on to the consumer
+            logger.exception("Error reading from %s:%s", self.host, self.port)
+            self._error = e
+
+        finally:
+            self._closed = True
+
+            # Don't wait for space on the queue here, as this may be running after cancellation. If
+            # the queue is full, the consumer will find that the connection is closed once it has
+            # emptied the queue
+            if not self._queue.full():
+                self._queue.put_nowait(_CLOSED)
+
+    def _stop(self):
+        """
+        End the iteration, raising the error that closed the connection (if any).
+        """
+        (error, self._error) = (self._error, None)
+
+        if error is not None:
+            raise error
+
+        raise StopAsyncIteration
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._queue.empty() and (self._closed or self._task is None):
+            self._stop()
+
+        item = await self._queue.get()
+
+        if item is _CLOSED:
+            self._stop()
+
+        return item
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def __repr__(self):
+        return "<APRSISClient: {} -> {}:{}>".format(self.callsign, self.host, self.port)
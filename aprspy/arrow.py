@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+
+import logging
+
+from functools import lru_cache
+from os import PathLike
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Tuple, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from .packets.generic import GenericPacket
+from .packets.beacon import BeaconPacket
+from .packets.position import PositionPacket
+from .packets.status import StatusPacket
+from .packets.message import MessagePacket
+from .packets.telemetry import TelemetryPacket
+from .packets.station_capability import StationCapabilityPacket
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# The default number of rows in each row group
+ROW_GROUP_SIZE = 65536
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("The 'pyarrow' package is required for aprspy.arrow")
+
+
+def _str(value) -> str:
+    return None if value is None else str(value)
+
+
+def _analog(value) -> float:
+    return None if value is None or value.value is None else float(value.value)
+
+
+def _digital(value) -> int:
+    return None if value is None or value.value is None else value.value.uint
+
+
+def _capabilities(value) -> List[str]:
+    return None if value is None else ["=".join(c) for c in value]
+
+
+@lru_cache(maxsize=None)
+def _columns() -> Dict[type, List[Tuple[str, object, Callable]]]:
+    """
+    Build the columns for each packet class, as a list of the name, Arrow type and a function to
+    get the value from a packet.
+    """
+    common = [
+        ("received", pa.timestamp("us", tz="UTC"), lambda p: p._ts),
+        ("source", pa.string(), lambda p: _str(p.source)),
+        ("destination", pa.string(), lambda p: _str(p.destination)),
+        ("path", pa.string(), lambda p: _str(p.path)),
+        ("data_type_id", pa.string(), lambda p: p.data_type_id),
+    ]
+
+    timestamp = [
+        ("timestamp", pa.timestamp("us", tz="UTC"), lambda p: p.timestamp),
+    ]
+
+    return {
+        GenericPacket: common,
+        BeaconPacket: common + [
+            ("comment", pa.string(), lambda p: p.comment),
+        ],
+        PositionPacket: common + timestamp + [
+            ("symbol_table", pa.string(), lambda p: p.symbol_table),
+            ("symbol_id", pa.string(), lambda p: p.symbol_id),
+            ("latitude", pa.float64(), lambda p: p.latitude),
+            ("longitude", pa.float64(), lambda p: p.longitude),
+            ("altitude", pa.float64(), lambda p: p.altitude),
+            ("ambiguity", pa.int8(), lambda p: p.ambiguity),
+            ("course", pa.int16(), lambda p: p.course),
+            ("speed", pa.float64(), lambda p: p.speed),
+            ("radio_range", pa.float64(), lambda p: p.radio_range),
+            ("messaging", pa.bool_(), lambda p: p.messaging),
+            ("compressed", pa.bool_(), lambda p: p.compressed),
+            ("comment", pa.string(), lambda p: p.comment),
+        ],
+        StatusPacket: common + timestamp + [
+            ("status_message", pa.string(), lambda p: p.status_message),
+            ("maidenhead_locator", pa.string(), lambda p: p.maidenhead_locator),
+        ],
+        MessagePacket: common + [
+            ("addressee", pa.string(), lambda p: p.addressee),
+            ("message", pa.string(), lambda p: p.message),
+            ("message_id", pa.string(), lambda p: p.message_id),
+            ("bulletin_id", pa.int16(), lambda p: p.bulletin_id),
+            ("announcement_id", pa.string(), lambda p: p.announcement_id),
+            ("group_bulletin_name", pa.string(), lambda p: p.group_bulletin_name),
+        ],
+        TelemetryPacket: common + [
+            ("sequence_number", pa.string(), lambda p: _str(p.sequence_number)),
+            ("av1", pa.float64(), lambda p: _analog(p.av1)),
+            ("av2", pa.float64(), lambda p: _analog(p.av2)),
+            ("av3", pa.float64(), lambda p: _analog(p.av3)),
+            ("av4", pa.float64(), lambda p: _analog(p.av4)),
+            ("av5", pa.float64(), lambda p: _analog(p.av5)),
+            ("dv", pa.uint8(), lambda p: _digital(p.dv)),
+            ("comment", pa.string(), lambda p: p.comment),
+        ],
+        StationCapabilityPacket: common + [
+            ("capabilities", pa.list_(pa.string()), lambda p: _capabilities(p.capabilities)),
+        ],
+    }
+
+
+@lru_cache(maxsize=None)
+def schema(cls: type) -> Tuple:
+    """
+    Get the Arrow schema used for a packet class, along with the functions to get the value of
+    each column.
+
+    :param type cls: a subclass of :class:`aprspy.packets.generic.GenericPacket`
+
+    Subclasses without their own schema use that of the nearest base class which has one, so (for
+    example) :class:`aprspy.MICEPacket` uses the same columns as :class:`aprspy.PositionPacket`.
+    """
+    _require_pyarrow()
+
+    columns = _columns()
+
+    for c in cls.__mro__:
+        if c in columns:
+            return (
+                pa.schema([(name, arrow_type) for (name, arrow_type, _) in columns[c]]),
+                tuple(getter for (_, _, getter) in columns[c])
+            )
+
+    raise TypeError("Not a packet class: {}".format(cls))
+
+
+class ParquetSink:
+    """
+    Write parsed packets to Parquet files, with a file for each type of packet.
+
+    Packets are gathered into columns for each packet class (see :func:`schema`), and a record
+    batch is written as a row group each time ``row_group_size`` packets of the same class have been
+    written. At most one row group per class is held in memory, so the sink can be used for long
+    runs::
+
+        with ParquetSink("output") as sink:
+            sink.write_many(APRS.parse_many(lines))
+
+    Each class is written to a file named after it in the output directory (for example,
+    ``PositionPacket.parquet``), which is created as soon as the first packet of that class is
+    written. Files which already exist are overwritten.
+    """
+
+    def __init__(self, directory: Union[str, PathLike], row_group_size: int = ROW_GROUP_SIZE,
+                 compression: str = "snappy"):
+        """
+        Create a new Parquet sink.
+
+        :param str directory: the directory to write the files to (which is created if needed)
+        :param int row_group_size: the number of packets in each row group
+        :param str compression: the compression codec to use (see
+            :class:`pyarrow.parquet.ParquetWriter`)
+        """
+        _require_pyarrow()
+
+        if row_group_size < 1:
+            raise ValueError("Row group size must be at least 1 ({} given)".format(row_group_size))
+
+        self.directory = Path(directory)
+        self.row_group_size = row_group_size
+        self.compression = compression
+
+        self.rows = {}
+
+        self._columns = {}
+        self._writers = {}
+
+    def write(self, packet: GenericPacket) -> bool:
+        """
+        Write a packet.
+
+        :param GenericPacket packet: a parsed packet
+
+        Anything other than a packet (such as a :class:`aprspy.ParseFailure`) is ignored, in which
+        case ``False`` is returned.
+        """
+        if not isinstance(packet, GenericPacket):
+            return False
+
+        cls = type(packet)
+        (_, getters) = schema(cls)
+
+        try:
+            columns = self._columns[cls]
+        except KeyError:
+            columns = self._columns[cls] = [[] for _ in getters]
+
+        for (column, getter) in zip(columns, getters):
+            column.append(getter(packet))
+
+        if len(columns[0]) >= self.row_group_size:
+            self._flush(cls)
+
+        return True
+
+    def write_many(self, packets: Iterable) -> int:
+        """
+        Write a number of packets, returning how many were written.
+
+        :param iterable packets: an iterable of packets, such as from :func:`aprspy.APRS.parse_many`
+        """
+        return sum(self.write(packet) for packet in packets)
+
+    def _flush(self, cls: type):
+        """
+        Write the packets gathered for a class as a row group.
+        """
+        columns = self._columns.get(cls)
+
+        if not columns or not columns[0]:
+            return
+
+        (arrow_schema, _) = schema(cls)
+
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(column, type=field.type) for (column, field) in zip(columns, arrow_schema)],
+            schema=arrow_schema
+        )
+
+        try:
+            writer = self._writers[cls]
+        except KeyError:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+            path = self.directory / "{}.parquet".format(cls.__name__)
+            logger.debug("Writing %s to %s", cls.__name__, path)
+
+            writer = self._writers[cls] = pq.ParquetWriter(
+                path, arrow_schema, compression=self.compression
+            )
+
+        writer.write_batch(batch, row_group_size=self.row_group_size)
+        self.rows[cls.__name__] = self.rows.get(cls.__name__, 0) + batch.num_rows
+
+        for column in columns:
+            column.clear()
+
+    def flush(self):
+        """
+        Write any packets which haven't yet been written, even if their row groups aren't full.
+        """
+        for cls in list(self._columns):
+            self._flush(cls)
+
+    def close(self):
+        """
+        Write any remaining packets and close the files.
+        """
+        self.flush()
+
+        for writer in self._writers.values():
+            writer.close()
+
+        self._writers.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return "<ParquetSink: {}>".format(self.directory)
@@ -0,0 +1,383 @@
+#!/usr/bin/env python
+
+import logging
+
+from collections import namedtuple
+from functools import lru_cache
+from datetime import datetime, UTC
+from typing import BinaryIO, Callable, Iterator, List, Union
+
+from . import APRS, ParseFailure
+from .checksum import Checksum, get_function as get_checksum_function
+from .components import Station, PathHop, Path, INTERN_SIZE
+from .exceptions import ParseError, UnsupportedError
+from .packets.generic import GenericPacket
+from .tokenizer import Raw, decode_text
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# KISS special characters
+FEND = 0xc0
+FESC = 0xdb
+TFEND = 0xdc
+TFESC = 0xdd
+
+# The KISS command for a data frame (the upper four bits are the port)
+KISS_DATA = 0x00
+
+# The AX.25 control field for a UI frame (ignoring the poll/final bit), and the protocol ID for no
+# layer 3 protocol, which are used by all APRS packets
+UI_CONTROL = 0x03
+NO_LAYER_3 = 0xf0
+
+# The length of an address, and the maximum number of digipeaters in a path
+ADDRESS_LENGTH = 7
+MAX_DIGIPEATERS = 8
+
+# The maximum length of the information field of an AX.25 frame
+MAX_INFO_LENGTH = 256
+
+# The maximum size of a KISS frame (with every byte escaped), beyond which data is discarded rather
+# than buffered while waiting for the end of the frame
+MAX_FRAME_SIZE = 2 * (1 + ADDRESS_LENGTH * (MAX_DIGIPEATERS + 2) + 2 + MAX_INFO_LENGTH)
+
+# The default size of each read from a stream
+BUFFER_SIZE = 4096
+
+# Table to shift each byte of an address right by one bit, since AX.25 addresses are shifted left
+_SHIFT = bytes(b >> 1 for b in range(256))
+
+# Named tuple to hold a decoded AX.25 frame, along with the KISS port it was received on
+Frame = namedtuple('Frame', ['source', 'destination', 'path', 'info', 'port'])
+
+
+@lru_cache(maxsize=INTERN_SIZE)
+def _station(address: bytes) -> Station:
+    """
+    Decode an address into a (shared) station.
+    """
+    callsign = address[0:6].translate(_SHIFT).rstrip(b" ")
+
+    try:
+        return Station(callsign.decode("ascii"), (address[6] >> 1) & 0x0f)
+    except (UnicodeDecodeError, ValueError):
+        raise ParseError("Invalid address: {}".format(callsign), address)
+
+
+@lru_cache(maxsize=INTERN_SIZE)
+def _path_hop(address: bytes, used: bool) -> PathHop:
+    """
+    Decode a digipeater address into a (shared) path hop.
+    """
+    return PathHop(_station(address), used=used)
+
+
+def decode_ax25(frame: bytes, port: int = 0) -> Frame:
+    """
+    Decode an AX.25 UI frame.
+
+    :param bytes frame: an AX.25 frame, without the flags or frame check sequence (as received from
+        a KISS TNC)
+    :param int port: the KISS port the frame was received on
+
+    Each address is made up of six characters (shifted left by one bit and padded with spaces) and
+    a byte holding the SSID, with the lowest bit set on the last address. The destination comes
+    first, followed by the source and up to 8 digipeaters. A digipeater which has repeated the
+    frame has its highest bit (the H bit) set. As in TNC2 format, only the last of these is marked
+    as used (see :attr:`PathHop.used`).
+
+    This returns a :class:`Frame`, with the source and destination as :class:`Station` objects, the
+    path as a :class:`Path` and the information field as bytes. A :class:`ParseError` is raised for
+    anything other than a UI frame with no layer 3 protocol (which is what APRS uses).
+    """
+    frame = bytes(frame)
+
+    # Find the end of the address field
+    end = ADDRESS_LENGTH
+
+    while end <= len(frame) and not frame[end - 1] & 0x01:
+        end += ADDRESS_LENGTH
+
+    if end < ADDRESS_LENGTH * 2 or end + 2 > len(frame):
+        raise ParseError("Frame is too short", frame)
+
+    if end > ADDRESS_LENGTH * (MAX_DIGIPEATERS + 2):
+        raise ParseError("Frame has more than {} digipeaters".format(MAX_DIGIPEATERS), frame)
+
+    if frame[end] & 0xef != UI_CONTROL or frame[end + 1] != NO_LAYER_3:
+        raise ParseError("Not an APRS (UI) frame", frame)
+
+    # Addresses are decoded through the intern pools (see Station.intern), since the same
+    # callsigns and aliases appear in most frames
+    destination = _station(frame[0:ADDRESS_LENGTH])
+    source = _station(frame[ADDRESS_LENGTH:ADDRESS_LENGTH * 2])
+
+    offsets = range(ADDRESS_LENGTH * 2, end, ADDRESS_LENGTH)
+    last = max((offset for offset in offsets if frame[offset + 6] & 0x80), default=None)
+
+    path = Path([
+        _path_hop(frame[offset:offset + ADDRESS_LENGTH], offset == last) for offset in offsets
+    ])
+
+    return Frame(source, destination, path, frame[end + 2:], port)
+
+
+def unescape(data: bytes) -> bytes:
+    """
+    Replace the escaped ``FEND`` and ``FESC`` characters in a KISS frame.
+    """
+    if FESC not in data:
+        return data
+
+    # FEND must be replaced first, so that an escaped FESC followed by TFEND is left alone
+    return data.replace(bytes((FESC, TFEND)), bytes((FEND,))) \
+        .replace(bytes((FESC, TFESC)), bytes((FESC,)))
+
+
+def decode_kiss(data: bytes) -> Frame:
+    """
+    Decode a KISS frame containing an AX.25 UI frame.
+
+    :param bytes data: a KISS frame, with or without the surrounding ``FEND`` characters
+
+    See :func:`decode_ax25`. A :class:`ParseError` is raised if the frame isn't a data frame (for
+    example, a command to set the TX delay).
+    """
+    data = bytes(data).strip(bytes((FEND,)))
+
+    if not data:
+        raise ParseError("Frame is empty", data)
+
+    if data[0] & 0x0f != KISS_DATA:
+        raise ParseError("Not a KISS data frame (command {})".format(data[0] & 0x0f), data)
+
+    return decode_ax25(unescape(data[1:]), data[0] >> 4)
+
+
+class KISSDecoder:
+    """
+    Decode KISS frames from a stream of bytes.
+
+    Data can be fed to the decoder as it's received, in chunks of any size, and each complete frame
+    is decoded and returned. Frames which can't be decoded (such as those which aren't APRS
+    packets, or which were only partly received) are skipped and counted in ``skipped``::
+
+        decoder = KISSDecoder()
+
+        while True:
+            for frame in decoder.feed(sock.recv(4096)):
+                print(ax25.parse(frame))
+
+    At most ``max_frame_size`` bytes of an incomplete frame are buffered. Anything longer (such as
+    noise on a serial line, or a stream which isn't KISS) is discarded up to the next ``FEND``, and
+    counted as a skipped frame.
+    """
+
+    def __init__(self, max_frame_size: int = MAX_FRAME_SIZE):
+        """
+        Create a new KISS decoder.
+
+        :param int max_frame_size: the maximum size of a frame, in bytes
+        """
+        if max_frame_size < 1:
+            raise ValueError("Maximum frame size must be at least 1 ({} given)".format(
+                max_frame_size
+            ))
+
+        self.max_frame_size = max_frame_size
+        self.skipped = 0
+
+        self._buffer = bytearray()
+
+        # Whether the rest of the current frame is being discarded
+        self._discarding = False
+
+    def _overflow(self):
+        """
+        Discard the frame being received, since it's too long.
+        """
+        logger.debug("Skipping frame longer than %s bytes", self.max_frame_size)
+        self.skipped += 1
+
+        self._buffer.clear()
+        self._discarding = True
+
+    def _decode(self, chunk: Union[bytes, bytearray], frames: List[Frame]):
+        """
+        Decode a complete frame, adding it to a list of frames.
+        """
+        # Frames are separated by one or more FENDs
+        if not chunk:
+            return
+
+        if len(chunk) > self.max_frame_size:
+            logger.debug("Skipping frame longer than %s bytes", self.max_frame_size)
+            self.skipped += 1
+            return
+
+        try:
+            frames.append(decode_kiss(chunk))
+
+        except ParseError as e:
+            logger.debug("Skipping frame: %s", e)
+            self.skipped += 1
+
+    def feed(self, data: bytes) -> List[Frame]:
+        """
+        Add received data, returning a list of the frames it completes.
+
+        :param bytes data: the data received
+        """
+        if type(data) is not bytes:
+            data = bytes(data)
+
+        first = data.find(FEND)
+
+        if first < 0:
+            # The data is all part of the frame being received
+            if not self._discarding:
+                self._buffer += data
+
+                if len(self._buffer) > self.max_frame_size:
+                    self._overflow()
+
+            return []
+
+        frames = []
+
+        # The data up to the first FEND completes the frame being received
+        if self._discarding:
+            self._discarding = False
+        else:
+            self._buffer += data[0:first]
+            self._decode(self._buffer, frames)
+
+        # Everything after the last FEND is the start of a frame which hasn't been received yet
+        last = data.rfind(FEND)
+
+        for chunk in data[first + 1:last].split(bytes((FEND,))):
+            self._decode(chunk, frames)
+
+        self._buffer = bytearray(data[last + 1:])
+
+        if len(self._buffer) > self.max_frame_size:
+            self._overflow()
+
+        return frames
+
+    def __repr__(self):
+        return "<KISSDecoder: {} bytes buffered>".format(len(self._buffer))
+
+
+def read_frames(file: BinaryIO, buffer_size: int = BUFFER_SIZE) -> Iterator[Frame]:
+    """
+    Read and decode the KISS frames from a stream, such as a serial port or a capture file.
+
+    :param file: a file (or file-like object) opened in binary mode
+    :param int buffer_size: the maximum size of each read
+
+    Frames are yielded as soon as they have been read, until the end of the stream. See
+    :class:`KISSDecoder`.
+    """
+    decoder = KISSDecoder()
+
+    # Use read1 where possible, so that frames aren't held back waiting for a full buffer. Serial
+    # ports (from pyserial) don't have read1, and read blocks until the full size has been read
+    # (if no timeout is set), so only read what is waiting (or block for a single byte)
+    read1 = getattr(file, "read1", None)
+    serial = read1 is None and hasattr(file, "in_waiting")
+
+    while True:
+        if read1 is not None:
+            data = read1(buffer_size)
+        elif serial:
+            data = file.read(min(file.in_waiting or 1, buffer_size))
+        else:
+            data = file.read(buffer_size)
+
+        if not data:
+            break
+
+        yield from decoder.feed(data)
+
+
+def _parse(frame: Frame, timestamp: datetime, strict_mode: bool, debug: bool, lazy: bool,
+           checksum_function: Callable) -> GenericPacket:
+    """
+    Parse a decoded frame.
+    """
+    info = decode_text(frame.info)
+
+    if not info:
+        if strict_mode:
+            raise ParseError("Frame has no information field", frame)
+
+        logger.warning("Returning generic packet for: %s", frame)
+        return GenericPacket()
+
+    raw = Raw(str(frame.source), str(frame.destination), str(frame.path), info[1:])
+
+    return APRS._parse_raw(raw, info[0], frame, timestamp, strict_mode, debug, lazy,
+                           checksum_function, path=frame.path)
+
+
+def parse(frame: Union[Frame, bytes], timestamp: datetime = None, strict_mode: bool = True,
+          lazy: bool = False, checksum: Union[Checksum, str] = None) -> GenericPacket:
+    """
+    Parse an APRS packet from an AX.25 frame.
+
+    :param Frame frame: a decoded :class:`Frame`, or a KISS frame (see :func:`decode_kiss`)
+    :param datetime timestamp: an (optional) timestamp indicating when the packet arrived
+    :param bool strict_mode: whether to raise errors (``True``) or return generic packets
+    :param bool lazy: whether to defer decoding the information field
+    :param Checksum checksum: the type of checksum to calculate
+
+    This is the same as :func:`aprspy.APRS.parse`, except that the addresses and path are taken
+    from the frame as they were decoded, rather than from a packet in TNC2 format. The path of the
+    packet is the :class:`Path` from the frame.
+    """
+    if type(frame) is not Frame:
+        frame = decode_kiss(frame)
+
+    return _parse(frame, timestamp, strict_mode, logger.isEnabledFor(logging.DEBUG), lazy,
+                  get_checksum_function(checksum))
+
+
+def parse_stream(file: BinaryIO, strict_mode: bool = True,
+                 on_error: Callable[[ParseFailure], object] = None, lazy: bool = False,
+                 checksum: Union[Checksum, str] = None,
+                 buffer_size: int = BUFFER_SIZE) -> Iterator[Union[GenericPacket, ParseFailure]]:
+    """
+    Parse the APRS packets from a stream of KISS frames.
+
+    :param file: a file (or file-like object) opened in binary mode
+    :param bool strict_mode: whether to raise errors (``True``) or return generic packets
+    :param callable on_error: an (optional) callable, given a :class:`aprspy.ParseFailure` for each
+        packet that could not be parsed
+    :param bool lazy: whether to defer decoding the information field of each packet
+    :param Checksum checksum: the type of checksum to calculate
+    :param int buffer_size: the maximum size of each read
+
+    Each packet is given the time it was read as its timestamp. As with
+    :func:`aprspy.APRS.parse_many`, errors aren't raised - a :class:`aprspy.ParseFailure` holding
+    the :class:`Frame` is yielded in place of the packet (or passed to ``on_error``). Frames which
+    aren't APRS packets are skipped (see :func:`read_frames`).
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    checksum_function = get_checksum_function(checksum)
+
+    for frame in read_frames(file, buffer_size):
+        try:
+            yield _parse(frame, datetime.now(UTC), strict_mode, debug, lazy,
+                         checksum_function)
+
+        except (ParseError, UnsupportedError) as e:
+            failure = ParseFailure(packet=frame, error=e)
+
+            if on_error is None:
+                yield failure
+            else:
+                result = on_error(failure)
+                if result is not None:
+                    yield result
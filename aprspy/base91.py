@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+
+import logging
+
+from array import array
+from collections import namedtuple
+from typing import Iterable, Union
+
+from .exceptions import ParseError
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Base-91 digits are the printable ASCII characters from '!' (0) to '{' (90)
+DIGITS = "".join(chr(c + 33) for c in range(91))
+
+# Lookup tables giving the value of each digit in each position of a 4-digit base-91 number (most
+# significant first), so that decoding a number is just four lookups and additions
+_POWERS = (91 ** 3, 91 ** 2, 91, 1)
+(_P3, _P2, _P1, _P0) = [{d: n * p for (n, d) in enumerate(DIGITS)} for p in _POWERS]
+
+# Compressed latitudes and longitudes are scaled by these values (APRS 1.01 C9 P38)
+LATITUDE_SCALE = 380926
+LONGITUDE_SCALE = 190463
+
+# Named tuple to hold a decoded 13-character compressed position block. c, s and t are the values of
+# the course/speed, altitude or range bytes and the compression type byte (the ASCII value minus 33,
+# so a space is -1)
+CompressedPosition = namedtuple('CompressedPosition', [
+    'symbol_table', 'latitude', 'longitude', 'symbol_id', 'c', 's', 't'
+])
+
+# Named tuple to hold a batch of decoded compressed position blocks, with an array for each field
+# and a str holding each of the symbol tables and symbol IDs
+CompressedPositions = namedtuple('CompressedPositions', [
+    'symbol_table', 'latitude', 'longitude', 'symbol_id', 'c', 's', 't'
+])
+
+
+def decode(value: str) -> int:
+    """
+    Decode a base-91 number.
+
+    :param str value: a base-91 number, of any length
+
+    A :class:`ParseError` is raised if the number contains any characters which aren't base-91
+    digits.
+    """
+    if len(value) == 4:
+        try:
+            return _P3[value[0]] + _P2[value[1]] + _P1[value[2]] + _P0[value[3]]
+        except KeyError:
+            raise ParseError("Invalid base-91 number: {}".format(value))
+
+    n = 0
+    for digit in value:
+        try:
+            n = n * 91 + _P0[digit]
+        except KeyError:
+            raise ParseError("Invalid base-91 number: {}".format(value))
+
+    return n
+
+
+def encode(value: int, length: int = 4) -> str:
+    """
+    Encode a number in base-91.
+
+    :param int value: a non-negative number
+    :param int length: the number of digits to encode it as
+    """
+    if value < 0 or value >= 91 ** length:
+        raise ValueError("Value cannot be encoded in {} base-91 digits ({} given)".format(
+            length, value
+        ))
+
+    digits = []
+    for _ in range(length):
+        (value, digit) = divmod(value, 91)
+        digits.append(DIGITS[digit])
+
+    return "".join(reversed(digits))
+
+
+def _latitude(n: int) -> float:
+    lat = round(90 - n / LATITUDE_SCALE, 6)
+
+    if lat > 90 or lat < -90:
+        raise ParseError("Invalid compressed latitude (greater than 90 or less than -90)")
+
+    return lat
+
+
+def _longitude(n: int) -> float:
+    lng = round(-180 + n / LONGITUDE_SCALE, 6)
+
+    if lng > 180 or lng < -180:
+        raise ParseError("Invalid compressed longitude (greater than 180 or less than -180)")
+
+    return lng
+
+
+def decode_latitude(latitude: str) -> float:
+    """
+    Decode a compressed latitude.
+
+    :param str latitude: a 4-character compressed latitude
+
+    See APRS 1.01 C9 P38.
+    """
+    return _latitude(decode(latitude))
+
+
+def decode_longitude(longitude: str) -> float:
+    """
+    Decode a compressed longitude.
+
+    :param str longitude: a 4-character compressed longitude
+
+    See APRS 1.01 C9 P38.
+    """
+    return _longitude(decode(longitude))
+
+
+def encode_latitude(latitude: Union[float, int]) -> str:
+    """
+    Encode a latitude in compressed format.
+
+    :param float/int latitude: a latitude, between -90 and 90
+
+    See APRS 1.01 C9 P38.
+    """
+    return encode(int(LATITUDE_SCALE * (90 - latitude)))
+
+
+def encode_longitude(longitude: Union[float, int]) -> str:
+    """
+    Encode a longitude in compressed format.
+
+    :param float/int longitude: a longitude, between -180 and 180
+
+    See APRS 1.01 C9 P38.
+    """
+    return encode(int(LONGITUDE_SCALE * (180 + longitude)))
+
+
+# The length of a compressed position block
+BLOCK_LENGTH = 13
+
+
+def _text(block: Union[str, bytes, bytearray, memoryview]) -> str:
+    """
+    Get a block given as bytes as a str, with each byte as a single character.
+    """
+    if type(block) is str:
+        return block
+
+    # Bytes outside the range of base-91 digits become characters which aren't digits either
+    return bytes(block).decode("latin-1")
+
+
+def decode_block(block: Union[str, bytes, bytearray, memoryview]) -> CompressedPosition:
+    """
+    Decode a compressed position block.
+
+    :param str/bytes block: a 13-character compressed position block
+
+    The block has the format /YYYYXXXX$csT, where / is the symbol table, YYYY and XXXX are the
+    compressed latitude and longitude, $ is the symbol ID, cs is the course/speed, altitude or
+    range and T is the compression type. The latitude and longitude are decoded, and the values of
+    c, s and T are returned without any further interpretation (see APRS 1.01 C9 P37-P41).
+
+    A :class:`ParseError` is raised if the latitude or longitude contains any characters which
+    aren't base-91 digits (``!`` to ``{``).
+    """
+    block = _text(block)
+
+    if len(block) != BLOCK_LENGTH:
+        raise ParseError("Compressed position block must be 13 characters ({} given)".format(
+            len(block)
+        ))
+
+    try:
+        lat = _P3[block[1]] + _P2[block[2]] + _P1[block[3]] + _P0[block[4]]
+        lng = _P3[block[5]] + _P2[block[6]] + _P1[block[7]] + _P0[block[8]]
+    except KeyError:
+        raise ParseError("Invalid compressed position: {}".format(block[1:9]))
+
+    return CompressedPosition(
+        block[0], _latitude(lat), _longitude(lng), block[9],
+        ord(block[10]) - 33, ord(block[11]) - 33, ord(block[12]) - 33
+    )
+
+
+def decode_blocks(blocks: Union[Iterable[Union[str, bytes]], bytes, bytearray,
+                                 memoryview]) -> CompressedPositions:
+    """
+    Decode a batch of compressed position blocks.
+
+    :param iterable blocks: an iterable of 13-character compressed position blocks (as strs or
+        bytes), or a bytes-like object holding a number of 13-byte blocks one after another
+
+    This returns a :class:`CompressedPositions`, holding arrays of the latitudes, longitudes and
+    c, s and T values, and strs of the symbol tables and symbol IDs, such that index ``i`` of each
+    is taken from the ``i``-th block (see :func:`decode_block`).
+
+    Unlike :func:`decode_block`, the latitudes and longitudes aren't rounded. Rather than failing
+    the whole batch, the latitude and longitude of any block which can't be decoded are set to NaN.
+    A :class:`ParseError` is raised if any block isn't 13 characters long.
+    """
+    if isinstance(blocks, (bytes, bytearray, memoryview)):
+        data = _text(blocks)
+
+        if len(data) % BLOCK_LENGTH:
+            raise ParseError("Compressed position blocks must be 13 bytes each ({} given)".format(
+                len(data)
+            ))
+
+        blocks = [data[i:i + BLOCK_LENGTH] for i in range(0, len(data), BLOCK_LENGTH)]
+
+    symbol_tables = []
+    symbol_ids = []
+    latitudes = array('d')
+    longitudes = array('d')
+    # Blocks given as strs can hold any character, so these must be wide enough for any code point
+    cs = array('i')
+    ss = array('i')
+    ts = array('i')
+
+    nan = float("nan")
+
+    for block in blocks:
+        if type(block) is not str:
+            block = _text(block)
+
+        if len(block) != BLOCK_LENGTH:
+            raise ParseError("Compressed position block must be 13 characters ({} given)".format(
+                len(block)
+            ))
+
+        try:
+            lat = 90 - (_P3[block[1]] + _P2[block[2]] + _P1[block[3]] + _P0[block[4]]) / \
+                LATITUDE_SCALE
+            lng = -180 + (_P3[block[5]] + _P2[block[6]] + _P1[block[7]] + _P0[block[8]]) / \
+                LONGITUDE_SCALE
+
+            if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+                (lat, lng) = (nan, nan)
+
+        except KeyError:
+            (lat, lng) = (nan, nan)
+
+        symbol_tables.append(block[0])
+        symbol_ids.append(block[9])
+        latitudes.append(lat)
+        longitudes.append(lng)
+        cs.append(ord(block[10]) - 33)
+        ss.append(ord(block[11]) - 33)
+        ts.append(ord(block[12]) - 33)
+
+    return CompressedPositions(
+        "".join(symbol_tables), latitudes, longitudes, "".join(symbol_ids), cs, ss, ts
+    )
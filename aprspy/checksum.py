@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+import logging
+
+from enum import Enum
+from hashlib import md5, blake2b
+from typing import Callable, Optional, Union
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class Checksum(Enum):
+    """
+    Enum for specifying how packet checksums are calculated.
+
+    Checksums are calculated over the source address and information field, and can be used to
+    quickly compare packets (for example, to find duplicates).
+
+    * ``NONE`` - no checksum is calculated
+    * ``MD5`` - the hex digest of an MD5 hash (the default, for compatibility)
+    * ``BLAKE2B`` - a 64-bit BLAKE2b hash, as an ``int``
+    * ``XXH64`` - a 64-bit xxHash hash, as an ``int`` (requires the ``xxhash`` package)
+    * ``HASH`` - Python's built-in :func:`hash`, as an ``int``
+
+    ``HASH`` is the fastest, but since Python randomizes string hashes for each process, the
+    checksums can only be compared within the same process (unless ``PYTHONHASHSEED`` is set).
+    """
+    NONE = "none"
+    MD5 = "md5"
+    BLAKE2B = "blake2b"
+    XXH64 = "xxh64"
+    HASH = "hash"
+
+
+def _md5(source: str, info: str) -> str:
+    return md5((source + info).encode()).hexdigest()
+
+
+def _blake2b(source: str, info: str) -> int:
+    return int.from_bytes(blake2b((source + info).encode(), digest_size=8).digest(), "big")
+
+
+def _xxh64(source: str, info: str) -> int:
+    return xxhash.xxh64_intdigest((source + info).encode())
+
+
+def _hash(source: str, info: str) -> int:
+    return hash((source, info))
+
+
+_FUNCTIONS = {
+    Checksum.NONE: None,
+    Checksum.MD5: _md5,
+    Checksum.BLAKE2B: _blake2b,
+    Checksum.XXH64: _xxh64,
+    Checksum.HASH: _hash,
+}
+
+# The checksum used when one isn't given
+_default = Checksum.MD5
+
+
+def _checksum(checksum: Union[Checksum, str]) -> Checksum:
+    """
+    Convert (and check) a checksum type.
+    """
+    if type(checksum) is not Checksum:
+        try:
+            checksum = Checksum(checksum)
+        except ValueError:
+            raise ValueError("Invalid checksum type: {}".format(checksum))
+
+    if checksum is Checksum.XXH64 and xxhash is None:
+        raise ImportError("The 'xxhash' package is required for XXH64 checksums")
+
+    return checksum
+
+
+def get_default() -> Checksum:
+    """
+    Get the checksum type used when one isn't given.
+    """
+    return _default
+
+
+def set_default(checksum: Union[Checksum, str]):
+    """
+    Set the checksum type used when one isn't given.
+
+    :param Checksum checksum: a :class:`Checksum` (or its value)
+    """
+    global _default
+    _default = _checksum(checksum)
+
+
+def get_function(checksum: Union[Checksum, str] = None) -> Optional[Callable[[str, str],
+                                                                           Union[str, int]]]:
+    """
+    Get the function used to calculate a checksum.
+
+    :param Checksum checksum: a :class:`Checksum` (or its value), or ``None`` for the default
+
+    The function is given the source address and the information field, and returns the checksum.
+    ``None`` is returned if no checksum should be calculated.
+    """
+    if checksum is None:
+        return _FUNCTIONS[_default]
+
+    return _FUNCTIONS[_checksum(checksum)]
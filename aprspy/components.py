@@ -3,6 +3,7 @@
 import logging
 import re
 
+from functools import lru_cache
 from typing import List, Optional, Union
 from enum import Enum
 
@@ -11,6 +12,13 @@ from .exceptions import ParseError
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# The maximum number of stations and path hops kept by the intern pools
+INTERN_SIZE = 65536
+
+CALLSIGN_SSID_REGEX = re.compile(r'[A-Za-z0-9]+-[A-Za-z0-9]{1,2}')
+CALLSIGN_ONLY_REGEX = re.compile(r'[A-Za-z0-9]+')
+SSID_REGEX = re.compile(r'[A-Za-z0-9]{1,2}')
+
 
 class QConstruct(Enum):
     """
@@ -28,11 +36,30 @@ class QConstruct(Enum):
     qAI = "qAI"
 
 
+# The q constructs added to packets gated from RF (see http://www.aprs-is.net/q.aspx)
+_RF_Q_CONSTRUCTS = {QConstruct.qAR, QConstruct.qAr, QConstruct.qAO, QConstruct.qAo}
+
+_Q_CONSTRUCTS = {q_construct.value: q_construct for q_construct in QConstruct}
+
+# A q construct is always a whole hop, and is followed by the igate (if any)
+Q_CONSTRUCT_REGEX = re.compile(r'(?:^|,)(qA[^,]*)(?:,([^,]*))?')
+
+# A path hop is either a q construct, or a station (which can't start with "qA") which may have
+# been used
+_PATH_HOP = r'(?:{}|(?!qA)[A-Za-z0-9]+(?:-[A-Za-z0-9]{{1,2}})?\*?)'.format(
+    "|".join(q_construct.value for q_construct in QConstruct)
+)
+PATH_REGEX = re.compile(r'{0}(?:,{0})*'.format(_PATH_HOP))
+
+
 class Station:
     """
     Class for describing a station, with an optional SSID
+
+    Stations are immutable, and can be compared with each other and used as dictionary keys. The
+    string form and hash are calculated once, when the station is created.
     """
-    _callsign = None
+    __slots__ = ('_callsign', '_ssid', '_str', '_hash')
 
     def __init__(self, callsign: str, ssid: Union[str, int] = None):
         """
@@ -51,76 +78,60 @@ class Station:
         cannot be used over AX.25.
         """
 
-        # 'ssid' must be set first, since it can be updated if we're passed a callsign with an SSID
-        self.ssid = ssid
-        self.callsign = callsign
+        # 'ssid' must be checked first, since it's replaced if we're passed a callsign with an SSID
+        ssid = Station._parse_ssid(ssid)
 
-    @property
-    def callsign(self) -> str:
-        """Get the callsign of the station"""
-        return self._callsign
-
-    @callsign.setter
-    def callsign(self, value: str):
-        """Set the callsign of the station (with or without an SSID)"""
-        logger.debug(value)
         # Ensure we're being given a str
-        if type(value) is not str:
-            raise TypeError("Callsign must be of type 'str' ({} given)".format(type(value)))
-
-        callsign_ssid_regex = '^[A-Za-z0-9]+-[A-Za-z0-9]{1,2}$'
-        callsign_only_regex = '^[A-Za-z0-9]+$'
+        if type(callsign) is not str:
+            raise TypeError("Callsign must be of type 'str' ({} given)".format(type(callsign)))
 
-        if re.match(callsign_ssid_regex, value):
+        if CALLSIGN_SSID_REGEX.fullmatch(callsign):
             # We have been given a callsign and an SSID
-            (self._callsign, self.ssid) = value.split("-")
-
-        elif re.match(callsign_only_regex, value):
-            # We have only been given a callsign
-            self._callsign = value
+            (callsign, ssid) = callsign.split("-")
+            ssid = Station._parse_ssid(ssid)
 
-        else:
+        elif not CALLSIGN_ONLY_REGEX.fullmatch(callsign):
             raise ValueError("Callsign is invalid")
 
-    @property
-    def ssid(self) -> str:
-        """Get the SSID of the station"""
-        return self._ssid
+        self._callsign = callsign
+        self._ssid = ssid
+        self._str = f"{callsign}-{ssid}" if ssid else callsign
+        self._hash = hash(self._str)
 
-    @ssid.setter
-    def ssid(self, value: Union[str, int]):
-        """Set the SSID of the station"""
+    @staticmethod
+    def _parse_ssid(value: Union[str, int]) -> Union[str, int]:
+        """Check an SSID, converting it to an int if it's in the range 1-15"""
         # Allow None
         if value is None:
-            self._ssid = None
+            return None
 
         # Ensure we're being given a str or an int
         elif type(value) is str:
-            if re.match(r'^[A-Za-z0-9]{1,2}$', value):
+            if SSID_REGEX.fullmatch(value):
                 # Valid SSID
-                if re.match(r'^[0-9]{1,2}', value):
+                if value[0].isdigit():
                     # Can we convert it to an int?
                     try:
                         if int(value) == 0:
-                            self._ssid = None
+                            return None
                         elif int(value) <= 15:
-                            self._ssid = int(value)
+                            return int(value)
                         else:
-                            self._ssid = value
+                            return value
 
                     except ValueError:
                         # Not an integer
-                        self._ssid = value
+                        return value
                 else:
-                    self._ssid = value
+                    return value
             else:
                 raise ValueError("SSID is invalid")
 
         elif type(value) is int:
             if value == 0:
-                self._ssid = None
+                return None
             elif 1 <= value <= 15:
-                self._ssid = value
+                return value
             else:
                 raise ValueError("SSID is invalid")
 
@@ -129,6 +140,30 @@ class Station:
                 type(value)
             ))
 
+    @staticmethod
+    @lru_cache(maxsize=INTERN_SIZE)
+    def intern(callsign: str) -> "Station":
+        """
+        Get a shared :class:`Station` for a callsign (with or without an SSID).
+
+        :param str callsign: a callsign, with or without an SSID
+
+        The same few thousand callsigns (and aliases such as ``WIDE1-1``) appear in most packets, so
+        rather than creating a new station each time, stations are kept in a pool of up to
+        ``INTERN_SIZE`` of the most recently used callsigns.
+        """
+        return Station(callsign)
+
+    @property
+    def callsign(self) -> str:
+        """Get the callsign of the station"""
+        return self._callsign
+
+    @property
+    def ssid(self) -> Union[str, int]:
+        """Get the SSID of the station"""
+        return self._ssid
+
     @property
     def is_valid_ax25(self) -> bool:
         """Get whether this station is a valid AX.25 address"""
@@ -143,11 +178,21 @@ class Station:
         else:
             return False
 
+    def __eq__(self, other) -> bool:
+        if type(other) is not Station:
+            return NotImplemented
+
+        return self is other or self._str == other._str
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        # The hash of a string differs between processes, so it must be calculated again
+        return (Station, (self._str,))
+
     def __str__(self) -> str:
-        if self.ssid:
-            return f"{self.callsign}-{self.ssid}"
-        else:
-            return self.callsign
+        return self._str
 
     def __repr__(self) -> str:
         return "<Station: {}>".format(
@@ -158,7 +203,11 @@ class Station:
 class PathHop:
     """
     Class for describing a single path hop.
+
+    Path hops are immutable and hashable, in the same way as :class:`Station`.
     """
+    __slots__ = ('_hop', '_used', '_str', '_hash')
+
     def __init__(self, hop: Union[str, Station, QConstruct], used: bool = False):
         """
         Create a new path hop.
@@ -174,75 +223,81 @@ class PathHop:
         a ``*`` to the end of the station, or by setting ``used`` to ``True``. Both ways are handled
         the same internally.
         """
+        if type(used) is not bool:
+            raise TypeError(
+                "Used status must be of type 'bool' ({} given)".format(type(used))
+            )
 
-        # 'used' must be set first, since it can be updated if we're only passed a station with a
-        # '*'
-        self.used = used
-        self.hop = hop
-
-    @property
-    def hop(self) -> Union[Station, QConstruct]:
-        """Get the hop"""
-        return self._hop
-
-    @hop.setter
-    def hop(self, value: Union[str, Station, QConstruct]):
-        """Set the hop"""
-        # Check for a Station object
-        if type(value) is Station:
-            self._hop = value
-
-        # Check for QConstruct object
-        elif type(value) is QConstruct:
-            self._hop = value
+        # Check for a Station or QConstruct object
+        if type(hop) is Station or type(hop) is QConstruct:
+            pass
 
         # Parse the hop as a string
-        elif type(value) is str:
+        elif type(hop) is str:
             # Check for a q construct
-            if value[0:2] == "qA":
+            if hop[0:2] == "qA":
                 try:
-                    self._hop = QConstruct(value=value)
+                    hop = QConstruct(value=hop)
                 except (KeyError, ValueError):
-                    raise ParseError("Invalid q construct: {}".format(value))
+                    raise ParseError("Invalid q construct: {}".format(hop))
 
             # Check for a trailing *
-            elif value[-1] == "*":
-                self.used = True
-                self._hop = Station(callsign=value[:-1])
+            elif hop[-1] == "*":
+                used = True
+                hop = Station.intern(hop[:-1])
 
             else:
-                self.used = False
-                self._hop = Station(callsign=value)
+                hop = Station.intern(hop)
         else:
             raise TypeError(
                 "Station must be of type 'str', 'Hop' or 'QConstruct' ({} given)".format(
-                    type(value)
+                    type(hop)
                 )
             )
 
+        self._hop = hop
+        self._used = used
+
+        hop = hop.value if type(hop) is QConstruct else str(hop)
+        self._str = "{}*".format(hop) if used else hop
+        self._hash = hash(self._str)
+
+    @staticmethod
+    @lru_cache(maxsize=INTERN_SIZE)
+    def intern(hop: str) -> "PathHop":
+        """
+        Get a shared :class:`PathHop` for a path hop given as a string.
+
+        :param str hop: a path hop, with or without a trailing ``*``
+
+        See :func:`Station.intern`.
+        """
+        return PathHop(hop)
+
+    @property
+    def hop(self) -> Union[Station, QConstruct]:
+        """Get the hop"""
+        return self._hop
+
     @property
     def used(self) -> bool:
         """Get whether the hop has been used or not"""
         return self._used
 
-    @used.setter
-    def used(self, value: bool):
-        """Set whether the hop has been used or not"""
-        if type(value) is bool:
-            self._used = value
-        else:
-            raise TypeError(
-                "Used status must be of type 'bool' ({} given)".format(type(value))
-            )
+    def __eq__(self, other) -> bool:
+        if type(other) is not PathHop:
+            return NotImplemented
+
+        return self is other or self._str == other._str
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return (PathHop, (self._str,))
 
     def __str__(self) -> str:
-        if self.used:
-            return "{}*".format(str(self.hop))
-        else:
-            if type(self.hop) is QConstruct:
-                return str(self.hop.value)
-            else:
-                return str(self.hop)
+        return self._str
 
     def __repr__(self) -> str:
         return "<PathHop: {}>".format(str(self))
@@ -251,36 +306,137 @@ class PathHop:
 class Path:
     """
     Class for describing a path.
+
+    Paths are immutable and hashable, in the same way as :class:`Station`. Two paths are equal if
+    their string forms are.
+
+    A path given as a string keeps that string, and only splits it into :class:`PathHop` objects
+    when :attr:`hops` is first read. The most commonly needed details of a path - whether the packet
+    was heard over RF, the q construct and the igate - are found by scanning the string, without
+    creating any hops.
     """
+    __slots__ = ('_path_hops', '_str', '_hash', '_scan')
+
     def __init__(self, path: Optional[Union[str, List[PathHop]]]):
         """
         Create a new path.
 
         :param str/List[PathHop] path: either a string representing a path, or a :term:`list` of
             :class:`PathHop` objects
+
+        A path given as a string keeps that string as its string form. A :class:`ParseError` is
+        raised if it isn't a valid path.
         """
-        self._path_hops = []
-        if path:
-            self.path = path
+        self._scan = None
+
+        if not path:
+            self._path_hops = ()
+            self._str = ""
+
+        elif type(path) is str:
+            # The path is only checked here, and is split when the hops are first needed
+            if not PATH_REGEX.fullmatch(path):
+                raise ParseError("Invalid path: {}".format(path))
+
+            self._path_hops = None
+            self._str = path
+
+        elif type(path) is list or type(path) is tuple:
+            self._path_hops = tuple(path)
+            self._str = ",".join([str(path_hop) for path_hop in path])
+
+        else:
+            raise TypeError("Path must be of type 'str' or 'list' ({} given)".format(type(path)))
+
+        self._hash = hash(self._str)
 
     @property
     def path(self) -> str:
-        return ",".join([str(path_hop) for path_hop in self._path_hops])
+        return self._str
 
-    @path.setter
-    def path(self, value: str):
-        if type(value) is str:
+    @property
+    def hops(self) -> tuple:
+        """Get the hops of the path"""
+        if self._path_hops is None:
             # Split the path
-            self._path_hops = [PathHop(hop=path_hop) for path_hop in value.split(",")]
-        else:
-            raise TypeError("Path must be of type 'str' ({} given)".format(type(value)))
+            self._path_hops = tuple(PathHop.intern(path_hop) for path_hop in self._str.split(","))
 
-    @property
-    def hops(self) -> list:
         return self._path_hops
 
+    @property
+    def hop_count(self) -> int:
+        """Get the number of hops in the path (including any q construct and igate)"""
+        if not self._str:
+            return 0
+
+        return self._str.count(",") + 1
+
+    def _find(self) -> tuple:
+        """
+        Scan the path for the q construct and the igate, and whether the packet was heard over RF,
+        returning a tuple of the three.
+        """
+        if self._scan is None:
+            path = self._str
+            match = Q_CONSTRUCT_REGEX.search(path)
+
+            if match is None:
+                self._scan = (None, None, "TCPIP" not in path and "TCPXX" not in path)
+
+            else:
+                q_construct = _Q_CONSTRUCTS.get(match.group(1))
+
+                # Packets which have been through the internet have TCPIP or TCPXX before the q
+                # construct
+                before = path[0:match.start()]
+
+                self._scan = (
+                    q_construct, match.group(2) or None,
+                    q_construct in _RF_Q_CONSTRUCTS and "TCPIP" not in before
+                    and "TCPXX" not in before
+                )
+
+        return self._scan
+
+    @property
+    def q_construct(self) -> Optional[QConstruct]:
+        """Get the q construct added by APRS-IS, or ``None`` if there isn't one"""
+        return self._find()[0]
+
+    @property
+    def igate(self) -> Optional[str]:
+        """
+        Get the callsign following the q construct, which is the igate (or server) that passed the
+        packet to APRS-IS, or ``None`` if there is no q construct
+        """
+        return self._find()[1]
+
+    @property
+    def is_rf(self) -> bool:
+        """
+        Get whether the packet was heard over RF.
+
+        This is the case when the path doesn't include ``TCPIP`` or ``TCPXX``, and either the q
+        construct shows that it was gated from RF (``qAR``, ``qAr``, ``qAO`` or ``qAo``), or there
+        is no q construct at all (for example, packets received directly from a TNC).
+        """
+        return self._find()[2]
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not Path:
+            return NotImplemented
+
+        return self is other or self._str == other._str
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        # Pickle paths as their string form, which is far more compact than pickling each hop
+        return (Path, (self._str,))
+
     def __str__(self) -> str:
-        return self.path
+        return self._str
 
     def __repr__(self) -> str:
         return "<Path: {}>".format(str(self))
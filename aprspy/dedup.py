@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+
+import time
+import logging
+
+from collections import deque
+from typing import Hashable, Iterable, Iterator, Union
+
+from .packets.generic import GenericPacket
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class DuplicateFilter:
+    """
+    Filter for suppressing duplicate packets.
+
+    The same packet is often received several times within a few seconds, via different paths or
+    igates. APRS-IS considers a packet to be a duplicate if one with the same source and information
+    field has been seen in the last 30 seconds, and this does the same using the packet checksum
+    (see :mod:`aprspy.checksum`)::
+
+        dupes = DuplicateFilter()
+
+        for packet in dupes.filter(APRS.parse_many(lines)):
+            ...
+
+    Each checksum is kept until the window since it was first seen has passed. Checksums are held in
+    a set (for constant-time lookups) along with a queue in the order they were seen, so that
+    expired checksums can be removed from the front of the queue as new packets arrive. Memory use
+    is therefore bounded by the number of packets in the window, and can be further limited with
+    ``max_size``, in which case the oldest checksums are dropped first.
+
+    The time each packet was received is taken from its timestamp, where it has one, so packets
+    replayed from an archive (with :func:`aprspy.io.parse`, for example) are compared by when they
+    were originally received rather than when they were replayed.
+    """
+
+    def __init__(self, window: float = 30, max_size: int = None):
+        """
+        Create a new duplicate filter.
+
+        :param float window: the number of seconds a packet is considered a duplicate for
+        :param int max_size: an (optional) maximum number of checksums to keep
+        """
+        if window <= 0:
+            raise ValueError("Window must be greater than 0 ({} given)".format(window))
+
+        if max_size is not None and max_size < 1:
+            raise ValueError("Maximum size must be at least 1 ({} given)".format(max_size))
+
+        self.window = window
+        self.max_size = max_size
+
+        self._seen = set()
+        self._queue = deque()
+
+        # The latest time a packet was seen, which the queue never goes back before
+        self._latest = None
+
+    @staticmethod
+    def _key(packet: Union[GenericPacket, Hashable]) -> Hashable:
+        if isinstance(packet, GenericPacket):
+            if packet.checksum is None:
+                raise ValueError("Packet has no checksum (see aprspy.checksum)")
+
+            return packet.checksum
+
+        return packet
+
+    def _expire(self, now: float):
+        """
+        Remove any checksums which have been seen for longer than the window.
+        """
+        cutoff = now - self.window
+
+        while self._queue and self._queue[0][0] <= cutoff:
+            self._seen.discard(self._queue.popleft()[1])
+
+    @staticmethod
+    def _now(packet: Union[GenericPacket, Hashable]) -> float:
+        if isinstance(packet, GenericPacket) and packet._ts is not None:
+            return packet._ts.timestamp()
+
+        return time.time()
+
+    def is_duplicate(self, packet: Union[GenericPacket, Hashable], now: float = None) -> bool:
+        """
+        Check whether a packet is a duplicate, and record it if it isn't.
+
+        :param GenericPacket packet: a packet (or a packet checksum)
+        :param float now: the (optional) time the packet was received, in seconds
+
+        If ``now`` isn't given, the packet's timestamp (as given to :func:`aprspy.APRS.parse`) is
+        used, so archives can be replayed - or the current time if it has none.
+
+        The queue of checksums is kept in the order they were seen, so a packet received out of
+        order (older than the latest packet checked) counts as being seen at the latest time.
+        """
+        key = self._key(packet)
+
+        if now is None:
+            now = self._now(packet)
+
+        if self._latest is None or now > self._latest:
+            self._latest = now
+        else:
+            now = self._latest
+
+        self._expire(now)
+
+        if key in self._seen:
+            return True
+
+        self._seen.add(key)
+        self._queue.append((now, key))
+
+        if self.max_size is not None and len(self._queue) > self.max_size:
+            self._seen.discard(self._queue.popleft()[1])
+
+        return False
+
+    def filter(self, packets: Iterable) -> Iterator:
+        """
+        Yield only the packets which aren't duplicates.
+
+        :param iterable packets: an iterable of packets, such as from
+            :func:`aprspy.APRS.parse_many`
+
+        Anything other than a packet (such as a :class:`aprspy.ParseFailure`) is passed through.
+        """
+        for packet in packets:
+            if not isinstance(packet, GenericPacket) or not self.is_duplicate(packet):
+                yield packet
+
+    def clear(self):
+        """
+        Forget all the packets seen so far.
+        """
+        self._seen.clear()
+        self._queue.clear()
+        self._latest = None
+
+    def __contains__(self, packet: Union[GenericPacket, Hashable]) -> bool:
+        # Checksums are only expired when a packet is checked, so this may include packets seen
+        # longer than the window ago
+        return self._key(packet) in self._seen
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __repr__(self):
+        return "<DuplicateFilter: {} packets, {}s window>".format(len(self), self.window)
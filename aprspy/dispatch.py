@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+
+import re
+import logging
+
+from collections import namedtuple
+from typing import Callable, Dict, List, Optional, Type
+
+from .exceptions import UnsupportedError
+from .packets.generic import GenericPacket
+from .packets.beacon import BeaconPacket
+from .packets.position import PositionPacket
+from .packets.status import StatusPacket
+from .packets.mice import MICEPacket
+from .packets.object import ObjectPacket
+from .packets.message import MessagePacket
+from .packets.telemetry import TelemetryPacket
+from .packets.telemetry_definition import TelemetryParameterNamePacket, TelemetryUnitLabelPacket,\
+    TelemetryEquationCoefficientsPacket, TelemetryBitSenseProjectNamePacket
+from .packets.station_capability import StationCapabilityPacket
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Named tuple to hold the result of dispatching a packet - the (unparsed) packet object, and the
+# data type ID and information field it should be parsed with
+Dispatch = namedtuple('Dispatch', ['packet', 'data_type_id', 'info'])
+
+# Hooks are given the destination, data type ID and information field, and return a Dispatch (or
+# None if they don't apply)
+Hook = Callable[[str, str, str], Optional[Dispatch]]
+
+BEACON_ADDRESSES = {
+    'AIR', 'ALL', 'AP', 'BEACON', 'CQ', 'GPS', 'DF', 'DGPS', 'DRILL', 'DX', 'ID', 'JAVA', 'MAIL',
+    'MICE', 'QST', 'QTH', 'RTCM', 'SKY', 'SPACE', 'SPC', 'SYM', 'TEL', 'TEST', 'TLM', 'WX', 'ZIP'
+}
+
+# Messages defining telemetry data have PARM, UNIT, EQNS or BITS immediately after the addressee.
+# The APRS spec places a 67-character limit on the message field, but it's common to see telemetry
+# definitions exceed this
+TELEMETRY_DEFINITION_REGEX = re.compile(r'[A-Za-z0-9\-]+\s?:(PARM|UNIT|EQNS|BITS)\.')
+
+TELEMETRY_DEFINITION_TYPES = {
+    'PARM': TelemetryParameterNamePacket,
+    'UNIT': TelemetryUnitLabelPacket,
+    'EQNS': TelemetryEquationCoefficientsPacket,
+    'BITS': TelemetryBitSenseProjectNamePacket
+}
+
+
+def beacon_hook(destination: str, data_type_id: str, info: str) -> Optional[Dispatch]:
+    """
+    Check for common beacon destinations.
+
+    See APRS 1.01 C4 P12.
+    """
+    if destination in BEACON_ADDRESSES:
+        logger.debug("Packet is a beacon packet")
+        return Dispatch(BeaconPacket(), data_type_id, info)
+
+
+def telemetry_definition_hook(destination: str, data_type_id: str,
+                              info: str) -> Optional[Dispatch]:
+    """
+    Check for messages which define telemetry parameters, units, equations or bit senses.
+
+    See APRS 1.01 C13 P68.
+    """
+    if data_type_id == ":":
+        definition = TELEMETRY_DEFINITION_REGEX.match(info)
+        if definition:
+            logger.debug("Packet is a telemetry definition packet")
+            return Dispatch(TELEMETRY_DEFINITION_TYPES[definition.group(1)](), data_type_id, info)
+
+
+def offset_position_hook(destination: str, data_type_id: str, info: str) -> Optional[Dispatch]:
+    """
+    Check for a position packet with the ``!`` located further into the information field.
+
+    As per APRS 1.01 C5 P18, position-without-timestamp packets may have the ``!`` located anywhere
+    up to the 40th character in the information field.
+    """
+    offset = info.find('!')
+
+    if 0 <= offset <= 40:
+        logger.debug("Found ! in information field, parsing as position packet")
+        p = PositionPacket()
+
+        # Store the offset
+        p._offset = offset
+
+        # Because we normally assume the first character of the info field is the data type ID,
+        # update the info field to include it, and set the data type ID
+        return Dispatch(p, '!', data_type_id + info)
+
+
+class PacketRegistry:
+    """
+    Registry mapping data type IDs to packet classes.
+
+    Packets are dispatched by first running each hook in order, then looking up the data type ID in
+    a table of packet classes, and finally (if there is no entry for the data type ID) running each
+    fallback hook in order.
+    """
+
+    def __init__(self):
+        self._data_types: Dict[str, Type[GenericPacket]] = {}
+        self._unsupported: Dict[str, str] = {}
+        self._hooks: List[Hook] = []
+        self._fallbacks: List[Hook] = []
+
+    def register_data_type(self, data_type_ids: str, packet_class: Type[GenericPacket]):
+        """
+        Register a packet class for one or more data type IDs.
+
+        :param str data_type_ids: one or more data type ID characters
+        :param GenericPacket packet_class: a subclass of :class:`GenericPacket`
+
+        Any existing class registered for the data type IDs is replaced.
+        """
+        if not (isinstance(packet_class, type) and issubclass(packet_class, GenericPacket)):
+            raise TypeError("Packet class must be a subclass of 'GenericPacket' ({} given)".format(
+                packet_class
+            ))
+
+        for data_type_id in data_type_ids:
+            self._data_types[data_type_id] = packet_class
+            self._unsupported.pop(data_type_id, None)
+
+    def register_unsupported(self, data_type_ids: str, description: str):
+        """
+        Mark one or more data type IDs as known, but unsupported.
+
+        :param str data_type_ids: one or more data type ID characters
+        :param str description: a description of the data type
+        """
+        for data_type_id in data_type_ids:
+            self._data_types.pop(data_type_id, None)
+            self._unsupported[data_type_id] = description
+
+    def register_hook(self, hook: Hook, fallback: bool = False, index: int = None):
+        """
+        Register a hook.
+
+        :param callable hook: a callable taking the destination, data type ID and information field
+            and returning either a :class:`Dispatch` or ``None``
+        :param bool fallback: if ``True``, only run the hook if there is no packet class registered
+            for the data type ID
+        :param int index: the position to insert the hook at (by default, it is appended)
+        """
+        hooks = self._fallbacks if fallback else self._hooks
+
+        if index is None:
+            hooks.append(hook)
+        else:
+            hooks.insert(index, hook)
+
+    def unregister_hook(self, hook: Hook):
+        """
+        Remove a previously-registered hook.
+
+        :param callable hook: the hook to remove
+        """
+        if hook in self._hooks:
+            self._hooks.remove(hook)
+        elif hook in self._fallbacks:
+            self._fallbacks.remove(hook)
+        else:
+            raise ValueError("Hook is not registered: {}".format(hook))
+
+    def dispatch(self, destination: str, data_type_id: str, info: str) -> Dispatch:
+        """
+        Determine the packet class for a packet.
+
+        :param str destination: the destination address
+        :param str data_type_id: the data type ID
+        :param str info: the information field, minus the data type ID
+
+        Returns a :class:`Dispatch` containing a new (unparsed) packet object, along with the data
+        type ID and information field it should be parsed with. An :class:`UnsupportedError` is
+        raised if the packet is of an unsupported or unknown type.
+        """
+        for hook in self._hooks:
+            dispatch = hook(destination, data_type_id, info)
+            if dispatch is not None:
+                return dispatch
+
+        packet_class = self._data_types.get(data_type_id)
+        if packet_class is not None:
+            logger.debug("Packet is a %s", packet_class.__name__)
+            return Dispatch(packet_class(), data_type_id, info)
+
+        if data_type_id in self._unsupported:
+            raise UnsupportedError("Unsupported data type: '{}' ({})".format(
+                data_type_id, self._unsupported[data_type_id]
+            ))
+
+        for hook in self._fallbacks:
+            dispatch = hook(destination, data_type_id, info)
+            if dispatch is not None:
+                return dispatch
+
+        raise UnsupportedError("Unknown data type: {}".format(data_type_id))
+
+
+# The default registry, used by :func:`aprspy.APRS.parse`
+registry = PacketRegistry()
+
+registry.register_hook(beacon_hook)
+registry.register_hook(telemetry_definition_hook)
+registry.register_data_type('!/=@', PositionPacket)
+registry.register_data_type("`'", MICEPacket)
+registry.register_data_type(';', ObjectPacket)
+registry.register_data_type(':', MessagePacket)
+registry.register_data_type('T', TelemetryPacket)
+registry.register_data_type('>', StatusPacket)
+registry.register_data_type('<', StationCapabilityPacket)
+registry.register_unsupported(')', "Item Report - C11 P57")
+registry.register_unsupported('$', "Raw NMEA Position Report")
+registry.register_unsupported('_', "Positionless Weather Report")
+registry.register_unsupported('*', "Complete Weather Report")
+registry.register_hook(offset_position_hook, fallback=True)
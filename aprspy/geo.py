@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+
+import logging
+
+from math import asin, cos, degrees, floor, pi, radians, sin, sqrt
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# The mean radius of the Earth, in kilometres
+EARTH_RADIUS = 6371.0088
+
+# The default size of each grid cell, in degrees
+CELL_SIZE = 0.5
+
+
+def distance(latitude1: float, longitude1: float, latitude2: float, longitude2: float) -> float:
+    """
+    Calculate the great-circle distance between two points, in kilometres.
+
+    :param float latitude1: the latitude of the first point
+    :param float longitude1: the longitude of the first point
+    :param float latitude2: the latitude of the second point
+    :param float longitude2: the longitude of the second point
+
+    This uses the haversine formula, which is accurate to within about 0.5% (since the Earth isn't
+    quite a sphere), and is much quicker than :func:`geopy.distance.geodesic`.
+    """
+    p1 = radians(latitude1)
+    p2 = radians(latitude2)
+
+    a = sin((p2 - p1) / 2) ** 2 + cos(p1) * cos(p2) * sin(radians(longitude2 - longitude1) / 2) ** 2
+
+    return 2 * EARTH_RADIUS * asin(min(1.0, sqrt(a)))
+
+
+class GridIndex:
+    """
+    Spatial index of the positions of stations (or anything else), for finding those within a
+    distance of a point or inside a bounding box.
+
+    The world is divided into a grid of cells ``cell_size`` degrees square, and each position is
+    kept in the cell it falls in. A query only needs to check the positions in the cells which
+    overlap the area being searched, so queries over a small area take about the same time however
+    many positions are indexed::
+
+        index = GridIndex()
+
+        index.update("XX1XX-9", 50.508333, -100.338333)
+        index.within_radius(50.5, -100.3, 10)
+
+    Positions can be updated as stations move (which only moves them between cells when they cross
+    into a new one) and removed as they expire, both in constant time. An index can also be kept
+    up to date by a :class:`aprspy.store.StationStore`.
+
+    The cell size should be around the size of the typical query - the default of half a degree is
+    about 55 km north to south.
+    """
+
+    def __init__(self, cell_size: float = CELL_SIZE):
+        """
+        Create a new grid index.
+
+        :param float cell_size: the size of each cell, in degrees
+        """
+        if not 0 < cell_size <= 90:
+            raise ValueError("Cell size must be between 0 and 90 degrees ({} given)".format(
+                cell_size
+            ))
+
+        self.cell_size = cell_size
+
+        # The number of columns of cells around the world
+        self._columns = int(-(-360 // cell_size))
+
+        # The positions in each cell, and the position and cell of each key
+        self._cells = {}
+        self._positions = {}
+
+    def _cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        return (
+            floor((latitude + 90) / self.cell_size),
+            floor((longitude + 180) / self.cell_size) % self._columns
+        )
+
+    def update(self, key: Hashable, latitude: float, longitude: float):
+        """
+        Add a position to the index, or update it if the key is already in the index.
+
+        :param key: the key for the position, such as a callsign
+        :param float latitude: the latitude
+        :param float longitude: the longitude
+        """
+        if not -90 <= latitude <= 90:
+            raise ValueError("Latitude must be between -90 and 90 ({} given)".format(latitude))
+
+        if not -180 <= longitude <= 180:
+            raise ValueError("Longitude must be between -180 and 180 ({} given)".format(longitude))
+
+        cell = self._cell(latitude, longitude)
+        previous = self._positions.get(key)
+
+        if previous is not None and previous[2] != cell:
+            self._remove_from_cell(key, previous[2])
+
+        try:
+            self._cells[cell][key] = (latitude, longitude)
+        except KeyError:
+            self._cells[cell] = {key: (latitude, longitude)}
+
+        self._positions[key] = (latitude, longitude, cell)
+
+    def _remove_from_cell(self, key: Hashable, cell: Tuple[int, int]):
+        keys = self._cells[cell]
+        del keys[key]
+
+        # Don't keep empty cells, so that large queries only visit cells with positions in them
+        if not keys:
+            del self._cells[cell]
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Remove a position from the index, returning whether it was in the index.
+
+        :param key: the key for the position
+        """
+        previous = self._positions.pop(key, None)
+
+        if previous is None:
+            return False
+
+        self._remove_from_cell(key, previous[2])
+
+        return True
+
+    def get(self, key: Hashable) -> Optional[Tuple[float, float]]:
+        """
+        Get the position for a key as a tuple of the latitude and longitude, or ``None`` if it isn't
+        in the index.
+
+        :param key: the key for the position
+        """
+        position = self._positions.get(key)
+
+        return None if position is None else position[0:2]
+
+    def _candidates(self, south: float, west: float, north: float,
+                    east: float) -> Iterator[Dict[Hashable, Tuple[float, float]]]:
+        """
+        Get the cells which overlap an area, where ``west`` is greater than ``east`` if the area
+        crosses the antimeridian.
+        """
+        first_row = floor((max(south, -90) + 90) / self.cell_size)
+        last_row = floor((min(north, 90) + 90) / self.cell_size)
+
+        first_column = floor((west + 180) / self.cell_size)
+        last_column = floor((east + 180) / self.cell_size)
+
+        if west > east:
+            last_column += self._columns
+
+        columns = min(last_column - first_column + 1, self._columns)
+
+        if (last_row - first_row + 1) * columns > len(self._cells):
+            # It's quicker to check each cell with positions in it than each cell in the area
+            for ((row, column), keys) in self._cells.items():
+                if first_row <= row <= last_row \
+                        and (column - first_column) % self._columns < columns:
+                    yield keys
+
+        else:
+            for row in range(first_row, last_row + 1):
+                for column in range(first_column, first_column + columns):
+                    keys = self._cells.get((row, column % self._columns))
+
+                    if keys is not None:
+                        yield keys
+
+    def within_bbox(self, south: float, west: float, north: float, east: float) -> List[Hashable]:
+        """
+        Get the keys of the positions inside a bounding box.
+
+        :param float south: the southern edge of the box
+        :param float west: the western edge of the box
+        :param float north: the northern edge of the box
+        :param float east: the eastern edge of the box
+
+        Boxes which cross the antimeridian (180 degrees longitude) have ``west`` greater than
+        ``east``, as with map tiles.
+        """
+        found = []
+        wraps = west > east
+
+        for keys in self._candidates(south, west, north, east):
+            for (key, (latitude, longitude)) in keys.items():
+                if south <= latitude <= north and (
+                    (west <= longitude or longitude <= east) if wraps
+                    else (west <= longitude <= east)
+                ):
+                    found.append(key)
+
+        return found
+
+    def within_radius(self, latitude: float, longitude: float,
+                      radius: float) -> List[Tuple[Hashable, float]]:
+        """
+        Get the keys of the positions within a distance of a point, along with their distances (in
+        kilometres), nearest first.
+
+        :param float latitude: the latitude of the point
+        :param float longitude: the longitude of the point
+        :param float radius: the distance from the point, in kilometres
+
+        See :func:`distance`.
+        """
+        angle = radius / EARTH_RADIUS
+        span = degrees(angle)
+
+        south = latitude - span
+        north = latitude + span
+
+        if north >= 90 or south <= -90 or angle >= pi / 2 or sin(angle) >= cos(radians(latitude)):
+            # The circle includes a pole, so covers all longitudes
+            (west, east) = (-180, 180)
+
+        else:
+            width = degrees(asin(sin(angle) / cos(radians(latitude))))
+            west = longitude - width
+            east = longitude + width
+
+            # Wrap the longitudes if the circle crosses the antimeridian
+            if west < -180:
+                west += 360
+            if east > 180:
+                east -= 360
+
+        # Calculate the distances inline, since this is the slowest part of a query
+        p1 = radians(latitude)
+        cos_p1 = cos(p1)
+        limit = sin(min(angle, pi) / 2) ** 2
+
+        found = []
+
+        for keys in self._candidates(south, west, north, east):
+            for (key, (lat, lng)) in keys.items():
+                p2 = radians(lat)
+                a = sin((p2 - p1) / 2) ** 2 \
+                    + cos_p1 * cos(p2) * sin(radians(lng - longitude) / 2) ** 2
+
+                if a <= limit:
+                    found.append((key, 2 * EARTH_RADIUS * asin(min(1.0, sqrt(a)))))
+
+        found.sort(key=lambda item: item[1])
+
+        return found
+
+    def clear(self):
+        """
+        Remove all the positions.
+        """
+        self._cells.clear()
+        self._positions.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __repr__(self):
+        return "<GridIndex: {} positions in {} cells>".format(len(self), len(self._cells))
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+
+import io
+import re
+import gzip
+import mmap
+import logging
+
+from datetime import datetime, UTC
+from os import PathLike
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from . import APRS
+from .tokenizer import decode_text
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# The magic numbers at the start of compressed files
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# The default size of each read from a compressed file
+BUFFER_SIZE = 1024 * 1024
+
+# Timestamps added to the start of each line by loggers, either a Unix timestamp (such as
+# ``1570713845.123``) or an ISO 8601 date and time (such as ``2019-10-10T13:24:05Z`` or
+# ``2019-10-10 13:24:05.123456+00:00``), followed by a space or a colon
+_UNIX_PREFIX = re.compile(r'(\d{9,10}(?:\.\d+)?):?\s')
+_ISO_PREFIX = re.compile(
+    r'(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?):?\s'
+)
+
+
+def _open(file: Union[str, PathLike, BinaryIO], use_mmap: bool, buffer_size: int
+          ) -> Tuple[Iterator[bytes], list]:
+    """
+    Open a file, returning an iterator over its lines along with anything which needs closing
+    afterwards.
+    """
+    closeables = []
+
+    if isinstance(file, (str, PathLike)):
+        f = open(file, "rb")
+        closeables.append(f)
+    else:
+        f = file
+
+    # Check the first few bytes for the magic number of a compressed file. Buffered files can be
+    # peeked at, but anything else must be read and the bytes put back
+    if hasattr(f, "peek"):
+        magic = f.peek(4)[0:4]
+    else:
+        magic = f.read(4)
+        f = io.BufferedReader(_Prepend(magic, f), buffer_size=buffer_size)
+
+    if magic.startswith(GZIP_MAGIC):
+        logger.debug("Reading gzip-compressed file")
+        f = io.BufferedReader(gzip.GzipFile(fileobj=f, mode="rb"), buffer_size=buffer_size)
+        closeables.insert(0, f)
+
+    elif magic.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise ImportError("The 'zstandard' package is required for zstd-compressed files")
+
+        logger.debug("Reading zstd-compressed file")
+        f = io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(f, read_size=buffer_size, closefd=False),
+            buffer_size=buffer_size
+        )
+        closeables.insert(0, f)
+
+    elif use_mmap and magic:
+        try:
+            fileno = f.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            fileno = None
+
+        if fileno is not None:
+            # Plain files are mapped into memory, so that the OS can page them in as they're read
+            try:
+                m = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+            except (ValueError, OSError) as e:
+                # Pipes and other streams can't be mapped, so fall back to reading them
+                logger.debug("Couldn't use mmap (%s)", e)
+
+            else:
+                logger.debug("Reading plain file with mmap")
+                m.seek(f.tell())
+                closeables.insert(0, m)
+
+                return (iter(m.readline, b""), closeables)
+
+    logger.debug("Reading plain file")
+    return (iter(f), closeables)
+
+
+class _Prepend(io.RawIOBase):
+    """
+    Raw stream which returns the given bytes before reading the rest of a file.
+    """
+
+    def __init__(self, data: bytes, file: BinaryIO):
+        self.data = data
+        self.file = file
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if self.data:
+            n = min(len(b), len(self.data))
+            b[0:n] = self.data[0:n]
+            self.data = self.data[n:]
+            return n
+
+        data = self.file.read(len(b))
+        b[0:len(data)] = data
+        return len(data)
+
+
+def read_lines(file: Union[str, PathLike, BinaryIO], use_mmap: bool = True,
+               buffer_size: int = BUFFER_SIZE) -> Iterator[bytes]:
+    """
+    Read the lines of a (possibly compressed) file.
+
+    :param str file: the path to a file, or a file opened in binary mode
+    :param bool use_mmap: whether to use ``mmap`` to read plain files
+    :param int buffer_size: the size of each read from a compressed file
+
+    Files compressed with gzip or zstd (which requires the ``zstandard`` package) are detected
+    from their contents, and decompressed as they're read. Plain files are read with ``mmap``,
+    unless ``use_mmap`` is ``False``. Either way, only part of the file is held in memory at once.
+
+    Each line is yielded as bytes, including any line ending.
+    """
+    (lines, closeables) = _open(file, use_mmap, buffer_size)
+
+    try:
+        yield from lines
+
+    finally:
+        for closeable in closeables:
+            closeable.close()
+
+
+def _timestamp(value: str, unix: bool) -> Optional[datetime]:
+    """
+    Convert a logger timestamp to a datetime, assuming UTC if it has no time zone.
+    """
+    try:
+        if unix:
+            return datetime.fromtimestamp(float(value), UTC)
+
+        timestamp = datetime.fromisoformat(value.replace(",", "."))
+
+    except (ValueError, OverflowError, OSError):
+        return None
+
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+
+    return timestamp
+
+
+def split_prefix(line: str) -> Tuple[str, Optional[datetime]]:
+    """
+    Split the timestamp added by a logger from the start of a line.
+
+    :param str line: a line from an archive
+
+    This returns a tuple of the rest of the line and the timestamp, or ``None`` if the line doesn't
+    start with a timestamp. Unix timestamps and ISO 8601 dates and times (assumed to be UTC if no
+    time zone is given) are recognised.
+    """
+    if line[0:1].isdigit():
+        match = _UNIX_PREFIX.match(line)
+        unix = match is not None
+
+        if not unix:
+            match = _ISO_PREFIX.match(line)
+
+        if match is not None:
+            timestamp = _timestamp(match.group(1), unix)
+
+            if timestamp is not None:
+                return (line[match.end():].lstrip(), timestamp)
+
+    return (line, None)
+
+
+def read(file: Union[str, PathLike, BinaryIO], use_mmap: bool = True,
+         buffer_size: int = BUFFER_SIZE) -> Iterator[Tuple[str, Optional[datetime]]]:
+    """
+    Read the packets from an APRS-IS archive.
+
+    :param str file: the path to a file, or a file opened in binary mode
+    :param bool use_mmap: whether to use ``mmap`` to read plain files
+    :param int buffer_size: the size of each read from a compressed file
+
+    This yields a tuple of each raw packet and the timestamp it arrived at (see
+    :func:`split_prefix`), which can be given to :func:`aprspy.APRS.parse_many`. Blank lines and
+    APRS-IS comment lines (starting with ``#``) are skipped. See :func:`read_lines`.
+    """
+    for line in read_lines(file, use_mmap, buffer_size):
+        (packet, timestamp) = split_prefix(decode_text(line).rstrip("\r\n"))
+
+        if not packet or packet[0] == "#":
+            continue
+
+        yield (packet, timestamp)
+
+
+def parse(file: Union[str, PathLike, BinaryIO], use_mmap: bool = True,
+          buffer_size: int = BUFFER_SIZE, **kwargs) -> Iterator:
+    """
+    Parse the packets from an APRS-IS archive.
+
+    :param str file: the path to a file, or a file opened in binary mode
+    :param bool use_mmap: whether to use ``mmap`` to read plain files
+    :param int buffer_size: the size of each read from a compressed file
+
+    Any other keyword arguments are passed to :func:`aprspy.APRS.parse_many`, which is given the
+    packets and their timestamps from :func:`read`.
+    """
+    return APRS.parse_many(read(file, use_mmap, buffer_size), **kwargs)
@@ -4,7 +4,7 @@ import logging
 
 from ..exceptions import ParseError
 from ..utils import APRSUtils
-from .generic import GenericPacket
+from .generic import GenericPacket, decoded
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -17,11 +17,14 @@ class BeaconPacket(GenericPacket):
     See APRS 1.01 C4 P12
     """
 
+    __slots__ = ('_comment',)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._comment = None
 
     @property
+    @decoded
     def comment(self) -> str:
         """Get the comment"""
         return self._comment
@@ -37,7 +40,7 @@ class BeaconPacket(GenericPacket):
         """
 
         self._comment = self._info
-        logger.debug("Beacon packet comment is {}".format(self._comment))
+        logger.debug("Beacon packet comment is %s", self._comment)
 
         return True
 
@@ -3,47 +3,198 @@
 import logging
 import json
 import enum
-import re
 
+from functools import lru_cache, wraps
 from typing import Union
 from geopy.point import Point
 from datetime import datetime
 from bitstring import Bits
 
 from ..components import Path, Station
-from ..exceptions import GenerateError
+from ..exceptions import GenerateError, ParseError
+from ..tokenizer import Raw
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 
-class PacketJSONEncoder(json.JSONEncoder):
-    def default(self, o):
+def decoded(getter):
+    """
+    Decorator for properties which are set by decoding the information field.
+
+    If the packet was parsed lazily and hasn't been decoded yet, it is decoded before the property
+    is read.
+    """
+    @wraps(getter)
+    def wrapper(self):
+        if self._lazy is not None:
+            self._decode()
+
+        return getter(self)
+
+    return wrapper
+
+
+def _slots(cls: type) -> tuple:
+    """
+    Get the names of all slots defined by a class and its base classes.
+    """
+    slots = []
+    for c in reversed(cls.__mro__):
+        s = c.__dict__.get('__slots__', ())
+        slots.extend((s,) if isinstance(s, str) else s)
+
+    return tuple(slots)
+
+
+# Slots which hold internal state, rather than anything decoded from the packet
+_INTERNAL_SLOTS = frozenset(['_lazy'])
+
+# Slots which are set from the header of the packet, rather than by decoding the information field
+_HEADER_SLOTS = frozenset([
+    '_path_hops', '_raw', '_source', '_destination', '_path', '_data_type_id', '_info', 'checksum',
+    '_ts', '_lazy'
+])
+
+
+@lru_cache(maxsize=None)
+def _fields(cls: type) -> tuple:
+    """
+    Get the fields serialized for a class, as a tuple of the name and the slot they're stored in.
+    """
+    return tuple(
+        (slot[1:] if slot.startswith('_') else slot, slot)
+        for slot in _slots(cls) if slot not in _INTERNAL_SLOTS
+    )
+
+
+def _attributes(o):
+    """
+    Get the (set) attributes of an object, whether they are stored in slots or in ``__dict__``.
+    """
+    for (_, a) in _fields(type(o)):
         try:
-            if type(o) is datetime:
-               return o.strftime('%c')
-            elif type(o) is Bits:
-                return o.bin
-            else:
-                j = {}
-                for a, v in o.__dict__.items():
-                    name = re.sub(r'^_', '', a)
-                    if type(v) is Point:
-                        j[name] = {
-                            "latitude": v.latitude,
-                            "longitude": v.longitude,
-                            "altitude": v.altitude
-                        }
-                    elif type(v) is not enum.EnumMeta:
-                        j[name] = v
-
-                return j
-
-        except:
-            breakpoint()
-            raise
+            yield (a, getattr(o, a))
+        except AttributeError:
+            # Slot hasn't been set
+            pass
+
+    if hasattr(o, '__dict__'):
+        yield from o.__dict__.items()
+
+
+def _point(p: Point) -> dict:
+    return {"latitude": p.latitude, "longitude": p.longitude, "altitude": p.altitude}
+
+
+# Types which are serialized as-is
+_PRIMITIVES = frozenset([str, int, float, bool, type(None)])
+
+# Functions for serializing other types, by type
+_CONVERTERS = {
+    datetime: datetime.isoformat,
+    Station: str,
+    Path: str,
+    Point: _point,
+    Bits: lambda b: b.bin,
+    Raw: list,
+}
+
+
+def _serialize(v):
+    """
+    Convert a value to something which can be serialized as JSON.
+    """
+    t = type(v)
+
+    if t in _PRIMITIVES:
+        return v
+
+    converter = _CONVERTERS.get(t)
+    if converter is not None:
+        return converter(v)
+
+    if isinstance(v, enum.Enum):
+        return v.name
+
+    if isinstance(v, (list, tuple)):
+        return [_serialize(i) for i in v]
+
+    if isinstance(v, dict):
+        return {k: _serialize(i) for (k, i) in v.items()}
+
+    # Anything else (such as a telemetry value) is serialized as its attributes
+    return {
+        (a[1:] if a.startswith('_') else a): _serialize(i) for (a, i) in _attributes(v)
+        if not isinstance(i, enum.EnumMeta)
+    }
+
+
+def _to_dict(o) -> dict:
+    """
+    Convert a packet to a dict, using the precomputed fields for its class.
+    """
+    d = {}
+    unset = _to_dict
+
+    for (name, slot) in _fields(type(o)):
+        v = getattr(o, slot, unset)
+
+        if v is unset:
+            # Slot hasn't been set
+            continue
+
+        d[name] = v if type(v) in _PRIMITIVES else _serialize(v)
+
+    if hasattr(o, '__dict__'):
+        for (a, v) in o.__dict__.items():
+            d[a[1:] if a.startswith('_') else a] = _serialize(v)
+
+    return d
+
+
+def _dumps(d: dict) -> str:
+    """
+    Serialize a dict as compact JSON, using ``orjson`` if it's installed.
+
+    The output from ``orjson`` and the :mod:`json` module differs in a couple of ways:
+
+    - floats written with an exponent are formatted differently (for example, ``1e16`` rather than
+      ``1e+16``, and ``1e-7`` rather than ``1e-07``), though they parse to the same value
+    - ``NaN`` and infinite floats are written as ``null`` by ``orjson``, rather than as ``NaN`` and
+      ``Infinity`` (which aren't valid JSON)
+
+    ``orjson`` can't serialize ints wider than 64 bits (which a malformed telemetry value can
+    hold), so the :mod:`json` module is used for those instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(d).decode()
+        except orjson.JSONEncodeError:
             pass
 
+    return json.dumps(d, separators=(',', ':'), ensure_ascii=False)
+
+
+class PacketJSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder for packets.
+
+    Packets are serialized as an object holding each of their fields, as listed in ``__slots__``.
+    Timestamps are serialized in ISO 8601 format, stations and paths as strings, and enums as their
+    names.
+    """
+    def default(self, o):
+        if isinstance(o, GenericPacket):
+            return _to_dict(o)
+
+        return _serialize(o)
+
 
 class GenericPacket:
     """
@@ -51,8 +202,16 @@ class GenericPacket:
 
     This is the base class for representing an APRS packet. Anything that is common to all packets
     is defined in here.
+
+    Packets use ``__slots__`` rather than an instance ``__dict__`` to reduce the memory used by each
+    packet. Subclasses which don't define ``__slots__`` will still have a ``__dict__``.
     """
 
+    __slots__ = (
+        '_path_hops', '_raw', '_source', '_destination', '_path', '_data_type_id', '_symbol_table',
+        '_symbol', '_info', 'checksum', '_timestamp', '_timestamp_type', '_ts', '_lazy'
+    )
+
     def __init__(self, source: str = None, destination: str = None, path: str = None,
                  data_type_id: str = None, info: str = None, symbol_table: str = None,
                  symbol_id: str = None):
@@ -76,6 +235,13 @@ class GenericPacket:
         self.timestamp = None
         self.timestamp_type = None
 
+        # The time the packet arrived (if known)
+        self._ts = None
+
+        # If the packet was parsed lazily, whether strict mode should be used when it is decoded
+        # (or None if there is nothing left to decode)
+        self._lazy = None
+
     @property
     def source(self) -> Station:
         """Get the source address of the packet"""
@@ -142,6 +308,7 @@ class GenericPacket:
             raise TypeError("Path must be of type 'str' or 'Path' ({} given)".format(type(value)))
 
     @property
+    @decoded
     def info(self) -> str:
         """Get the info field of the packet"""
         return self._info
@@ -152,6 +319,7 @@ class GenericPacket:
         self._info = value
 
     @property
+    @decoded
     def timestamp(self) -> str:
         """Get the timestamp of the packet"""
         return self._timestamp
@@ -162,6 +330,7 @@ class GenericPacket:
         self._timestamp = value
 
     @property
+    @decoded
     def timestamp_type(self) -> str:
         """Get the timestamp type of the packet"""
         return self._timestamp_type
@@ -182,6 +351,7 @@ class GenericPacket:
         self._data_type_id = value
 
     @property
+    @decoded
     def symbol_table(self) -> str:
         """Get the symbol table of the packet"""
         return self._symbol_table
@@ -192,6 +362,7 @@ class GenericPacket:
         self._symbol_table = value
 
     @property
+    @decoded
     def symbol_id(self) -> str:
         """Get the symbol ID of the packet"""
         return self._symbol
@@ -211,6 +382,37 @@ class GenericPacket:
     def _parse(self) -> bool:
         return True
 
+    def _decode(self):
+        """
+        Decode the information field of a lazily-parsed packet.
+
+        In strict mode, a :class:`ParseError` is raised if the information field can't be decoded.
+        Otherwise the error is logged, and all the decoded fields are set to ``None`` - so that,
+        as when a packet which can't be decoded is parsed eagerly (and a :class:`GenericPacket` is
+        returned), only the fields from the header of the packet are set.
+        """
+        strict_mode = self._lazy
+
+        # Clear this first, so that reading properties while decoding doesn't decode again
+        self._lazy = None
+
+        try:
+            self._parse()
+
+        except ParseError as e:
+            if strict_mode:
+                raise
+
+            logger.warning("Error decoding packet: %s", e)
+
+            # Don't leave any fields half-decoded, or with the defaults set by the constructor
+            for slot in _slots(type(self)):
+                if slot not in _HEADER_SLOTS:
+                    setattr(self, slot, None)
+
+            if hasattr(self, '__dict__'):
+                self.__dict__.update(dict.fromkeys(self.__dict__))
+
     def generate(self):
         """
         Generate an APRS packet based on the current object's properties.
@@ -245,10 +447,26 @@ class GenericPacket:
 
         return output
 
-    def to_json(self):
-        j = PacketJSONEncoder().encode(self)
+    def to_dict(self) -> dict:
+        """
+        Get the fields of the packet as a dict, which can be serialized as JSON.
 
-        return j
+        See :class:`PacketJSONEncoder`.
+        """
+        if self._lazy is not None:
+            self._decode()
+
+        return _to_dict(self)
+
+    def to_json(self) -> str:
+        """
+        Serialize the packet as JSON.
+
+        The ``orjson`` package is used if it's installed. This gives the same values as the standard
+        :mod:`json` module, though floats with an exponent are formatted differently, and ``NaN``
+        and infinite floats are written as ``null``. See :class:`PacketJSONEncoder`.
+        """
+        return _dumps(self.to_dict())
 
     def __repr__(self):
         if self.source:
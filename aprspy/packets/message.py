@@ -4,7 +4,7 @@ import re
 import logging
 
 from ..exceptions import ParseError, GenerateError
-from .generic import GenericPacket
+from .generic import GenericPacket, decoded
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -20,6 +20,11 @@ class MessagePacket(GenericPacket):
     See also APRS 1.01 C14 P71
     """
 
+    __slots__ = (
+        '_addressee', '_message', '_message_id', '_bulletin_id', '_announcement_id',
+        '_group_bulletin_name'
+    )
+
     def __init__(self, addressee: str = None, message: str = None, message_id: str = None,
                  bulletin_id: int = None, announcement_id: str = None,
                  group_bulletin_name: str = None, *args, **kwargs):
@@ -45,6 +50,7 @@ class MessagePacket(GenericPacket):
         self.data_type_id = ":"
 
     @property
+    @decoded
     def addressee(self) -> str:
         """Get the addressee of the message"""
         return self._addressee
@@ -69,6 +75,7 @@ class MessagePacket(GenericPacket):
             raise TypeError("Addressee must be of type 'str' ({} given)".format(type(value)))
 
     @property
+    @decoded
     def message(self) -> str:
         """Get the message"""
         return self._message
@@ -83,15 +90,14 @@ class MessagePacket(GenericPacket):
             if len(value) > 67:
                 # The maximum length of a message is 67 characters (C14 P71)
                 logger.warning(
-                    "Message length should not be longer than 67 characters ({} given)".format(
-                        len(value)
-                    )
+                    "Message length should not be longer than 67 characters (%s given)", len(value)
                 )
             self._message = value
         else:
             raise TypeError("Message must be of type 'str' ({} given)".format(type(value)))
 
     @property
+    @decoded
     def message_id(self) -> str:
         """Get the message ID"""
         return self._message_id
@@ -116,6 +122,7 @@ class MessagePacket(GenericPacket):
             raise TypeError("Message ID must be of type 'str' ({} given)".format(type(value)))
 
     @property
+    @decoded
     def bulletin_id(self) -> int:
         """Get the bulletin ID"""
         return self._bulletin_id
@@ -140,6 +147,7 @@ class MessagePacket(GenericPacket):
             raise TypeError("Bulletin ID must be of type 'int' ({} given)".format(type(value)))
 
     @property
+    @decoded
     def announcement_id(self) -> str:
         """Get the announcement ID"""
         return self._announcement_id
@@ -161,6 +169,7 @@ class MessagePacket(GenericPacket):
             raise TypeError("Announcement ID must be of type 'str' ({} given)".format(type(value)))
 
     @property
+    @decoded
     def group_bulletin_name(self) -> str:
         """Get the group bulletin name"""
         return self._group_bulletin_name
@@ -206,7 +215,7 @@ class MessagePacket(GenericPacket):
         self.addressee = addressee.rstrip()
         message = self._info[10:]
 
-        logger.debug("Message is addressed to {}, message is {}".format(addressee, message))
+        logger.debug("Message is addressed to %s, message is %s", addressee, message)
 
         # Is this a bulletin/announcement?
         if addressee[0:3] == "BLN":
@@ -218,22 +227,22 @@ class MessagePacket(GenericPacket):
                 if addressee[4:9] == "     ":
                     # Bulletin
                     self.bulletin_id = int(addressee[3])
-                    logger.debug("Bulletin {}".format(self.bulletin_id))
+                    logger.debug("Bulletin %s", self.bulletin_id)
                 else:
                     # Group bulletin
                     self.group_bulletin_name = addressee[4:9].rstrip()
                     self.bulletin_id = int(addressee[3])
 
-                    logger.debug("Group bulletin {} ({})".format(
-                        self.group_bulletin_name, self.bulletin_id
-                    ))
+                    logger.debug(
+                        "Group bulletin %s (%s)", self.group_bulletin_name, self.bulletin_id
+                    )
 
             elif re.match("[A-Z]", addressee[3]):
                 # Announcements have the format BLNa, where a is a character between A and Z
                 if addressee[4:9] == "     ":
                     # Announcement
                     self.announcement_id = addressee[3]
-                    logger.debug("Announcement {}".format(self.announcement_id))
+                    logger.debug("Announcement %s", self.announcement_id)
                 else:
                     # Incorrectly-formatted bulletin
                     raise ParseError(
@@ -247,7 +256,7 @@ class MessagePacket(GenericPacket):
         if '{' in message:
             # Check for a message ID
             message, message_id = message.split("{")
-            logger.debug("Message has message ID {}".format(message_id))
+            logger.debug("Message has message ID %s", message_id)
 
             # Message IDs must not be longer than 5 characters (C14 P71)
             if len(message_id) > 5:
@@ -2,6 +2,7 @@
 
 import logging
 
+from functools import lru_cache
 from typing import Tuple
 
 from ..exceptions import ParseError
@@ -11,6 +12,28 @@ from .position import PositionPacket
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Each character of a Mic-E destination field encodes a latitude digit (or a space, for ambiguity)
+# and whether it's from the first (0-9, L), second (A-K) or third (P-Z) set of characters
+# See APRS 1.01 C10 P44
+_DESTINATION_CHARACTERS = dict(
+    [(chr(48 + n), (n, 1)) for n in range(10)] +
+    [(chr(65 + n), (n, 2)) for n in range(10)] +
+    [(chr(80 + n), (n, 3)) for n in range(10)] +
+    [("K", (None, 2)), ("L", (None, 1)), ("Z", (None, 3))]
+)
+
+# Tables for each of the 6 characters of the destination field, mapping the character to its digit
+# and the bit it sets. The first 3 characters set the message bits (which are custom when from the
+# second set), and the others set south/north, the longitude offset and west/east, respectively
+_DESTINATION_TABLES = tuple(
+    [{c: (digit, int(enc_set > 1), enc_set == 2)
+      for (c, (digit, enc_set)) in _DESTINATION_CHARACTERS.items()}] * 3 +
+    [{c: (digit, enc_set == 1, False)
+      for (c, (digit, enc_set)) in _DESTINATION_CHARACTERS.items()}] +
+    [{c: (digit, enc_set > 1, False)
+      for (c, (digit, enc_set)) in _DESTINATION_CHARACTERS.items()}] * 2
+)
+
 
 class MICEPacket(PositionPacket):
     """
@@ -20,6 +43,8 @@ class MICEPacket(PositionPacket):
     a large amount of information to be conveyed in a single packet.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -34,114 +59,64 @@ class MICEPacket(PositionPacket):
         east/west, longitude offset and message identifier. In addition, the SSID can be used to
         denote a generic APRS digipeater path.
 
-        For more information, seeee APRS 1.01 C10 P43.
+        For more information, see APRS 1.01 C10 P43.
         """
-
-        latitude = ""
-        north_south = ""
-        east_west = ""
-        # TODO - handle status types
-        message_a = ""
-        message_b = ""
-        message_c = ""
-        message_custom = False
-        lng_offset = False
-
-        # Iterate over each character of the destination address
-        # TODO - A-K not used for 4-6
-        count = 0
-        for i in destination[0:6]:
-            count += 1
-            if 48 <= ord(i) <= 57:
-                # 0-9 are used as-is
-                latitude += i
-                enc_set = 1
-            elif 65 <= ord(i) <= 74:
-                latitude += str((ord(i) - 65))
-                enc_set = 2
-            elif 80 <= ord(i) <= 89:
-                latitude += str((ord(i) - 80))
-                enc_set = 3
-            elif i in "KLZ":
-                latitude += " "
-                if i == "K":
-                    enc_set = 2
-                elif i == "L":
-                    enc_set = 1
-                elif i == "Z":
-                    enc_set = 3
-            else:
-                raise ParseError("Unexpected character in Mic-E destination field")
-
-            if count == 1:
-                # The first field is changed depending on the message a-bit
-                if enc_set == 1:
-                    message_a = 0
-                elif enc_set == 2:
-                    message_a = 1
-                    message_custom = True
-                elif enc_set == 3:
-                    message_a = 1
-            elif count == 2:
-                # The second field is changed depending on the message b-bit
-                if enc_set == 1:
-                    message_b = 0
-                elif enc_set == 2:
-                    message_b = 1
-                    message_custom = True
-                elif enc_set == 3:
-                    message_b = 1
-            elif count == 3:
-                # The third field is changed depending on the message c-bit
-                if enc_set == 1:
-                    message_c = 0
-                elif enc_set == 2:
-                    message_c = 1
-                    message_custom = True
-                elif enc_set == 3:
-                    message_c = 1
-            elif count == 4:
-                # The fourth field is changed to denote north/south
-                if enc_set == 1:
-                    north_south = "S"
-                else:
-                    north_south = "N"
-
-                # Append a . to the latitude here, too
-                latitude += "."
-            elif count == 5:
-                # The fifth field is changed to denote the longitude offset
-                if enc_set == 1:
-                    lng_offset = False
-                else:
-                    lng_offset = True
-            elif count == 6:
-                # The sixth field is changed to denote east/west
-                if enc_set == 1:
-                    east_west = "E"
-                else:
-                    east_west = "W"
-
         # TODO
         if len(destination) > 6:
-            logger.debug("Mic-E destination has SSID: {}".format(destination.split('-')[1]))
+            logger.debug("Mic-E destination has SSID: %s", destination.split('-')[1])
+
+        # Trackers tend to send the same destination for long periods, so the decoded values are
+        # cached
+        return MICEPacket._decode_destination(destination[0:6])
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _decode_destination(destination: str) -> Tuple[float, int, bool, str, int, int, int, bool]:
+        """
+        Decode the first 6 characters of the destination field.
 
-        # Now that we have an uncompressed latitude, we can decode it like a standard uncompressed
-        # packet
+        See :func:`_decode_latitude`.
+        """
+        if len(destination) != 6:
+            raise ParseError("Mic-E destination field must be at least 6 characters")
+
+        # Look up the digit and bit encoded by each character
         try:
-            decoded_latitude, ambiguity = APRSUtils.decode_uncompressed_latitude(
-                "{}{}".format(latitude, north_south)
-            )
+            ((d1, message_a, custom_a), (d2, message_b, custom_b), (d3, message_c, custom_c),
+             (d4, south, _), (d5, lng_offset, _), (d6, west, _)) = [
+                table[c] for (table, c) in zip(_DESTINATION_TABLES, destination)
+            ]
+        except KeyError:
+            raise ParseError("Unexpected character in Mic-E destination field")
 
-        except ValueError as e:
-            raise ParseError(e)
+        # TODO - handle status types
+        message_custom = custom_a or custom_b or custom_c
+        north_south = "S" if south else "N"
+        east_west = "W" if west else "E"
+
+        # The degrees can't be ambiguous (see APRS 1.01 C6 P24)
+        if d1 is None or d2 is None:
+            raise ParseError("Invalid latitude: {}".format(destination))
+
+        degrees = d1 * 10 + d2
+        if degrees > 90:
+            raise ParseError("Invalid degrees: {}".format(degrees))
+
+        # Any ambiguous digits of the minutes are treated as zeroes, as with a standard uncompressed
+        # latitude
+        minutes = (d3 or 0) * 1000 + (d4 or 0) * 100 + (d5 or 0) * 10 + (d6 or 0)
+        ambiguity = (d3, d4, d5, d6).count(None)
+
+        decoded_latitude = degrees + round((minutes / 100) / 60, 6)
+        if south:
+            decoded_latitude *= -1
 
         logger.debug(
-            "After destination field decoding, latitude is {}{} ({} - {}), longitude offset is {}, "
-            "direction is {}, msg a/b/c is {}/{}/{}, msg custom is {}".format(
-                latitude, north_south, decoded_latitude, ambiguity, lng_offset, east_west,
-                message_a, message_b, message_c, message_custom
-            ))
+            "After destination field decoding, latitude is %s (%s), longitude offset is %s, "
+            "direction is %s, msg a/b/c is %s/%s/%s, msg custom is %s",
+            decoded_latitude, ambiguity, lng_offset, east_west, message_a, message_b, message_c,
+            message_custom
+        )
 
         # Return the decoded latitude, ambiguity, longitude offset, east/west direction and message
         # bits
@@ -164,7 +139,7 @@ class MICEPacket(PositionPacket):
         See also APRS 1.01 C10 P47.
         """
 
-        logger.debug("Info input: {}".format(info))
+        logger.debug("Info input: %s", info)
         # The degrees, minutes and hundreths of minutes are obtained by subtracting 28 from the
         # ASCII values of the 3 characters
 
@@ -204,9 +179,7 @@ class MICEPacket(PositionPacket):
         except ValueError as e:
             raise ParseError(e)
 
-        logger.debug(
-            "Longitude is {} {} {} ({})".format(lng_deg, lng_min, lng_hmin, longitude)
-        )
+        logger.debug("Longitude is %s %s %s (%s)", lng_deg, lng_min, lng_hmin, longitude)
 
         return longitude
 
@@ -247,7 +220,7 @@ class MICEPacket(PositionPacket):
         if course >= 400:
             course -= 400
 
-        logger.debug("Speed is {} knots, course is {} degrees".format(speed, course))
+        logger.debug("Speed is %s knots, course is %s degrees", speed, course)
 
         return (speed, course)
 
@@ -273,13 +246,13 @@ class MICEPacket(PositionPacket):
         # Parse the symbol table and symbol from the info field
         try:
             self.symbol_id = self._info[6]
-            logger.debug("Symbol ID is {}".format(self.symbol_id))
+            logger.debug("Symbol ID is %s", self.symbol_id)
         except IndexError:
             raise ParseError("Missing symbol ID", self)
 
         try:
             self.symbol_table = self._info[7]
-            logger.debug("Symbol table is {}".format(self.symbol_table))
+            logger.debug("Symbol table is %s", self.symbol_table)
         except IndexError:
             raise ParseError("Missing symbol table", self)
 
@@ -307,11 +280,11 @@ class MICEPacket(PositionPacket):
                     ) - 10000
 
                     self.altitude = altitude
-                    logger.debug("Altitude is {}m".format(altitude))
+                    logger.debug("Altitude is %sm", altitude)
 
                     # The remainder is the comment
                     self.comment = status_text[4:]
-                    logger.debug("Comment is {}".format(self.comment))
+                    logger.debug("Comment is %s", self.comment)
 
                 else:
                     self.comment = status_text
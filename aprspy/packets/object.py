@@ -9,6 +9,7 @@ logger = logging.getLogger(__name__)
 
 
 class ObjectPacket(GenericPacket):
+    __slots__ = ()
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -9,9 +9,10 @@ from geopy.point import Point
 
 from typing import Tuple, Optional, Union
 
+from .. import base91
 from ..exceptions import ParseError, GenerateError
 from ..utils import APRSUtils
-from .generic import GenericPacket
+from .generic import GenericPacket, decoded
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -82,6 +83,13 @@ class PositionPacket(GenericPacket):
     This class represents packets which provide position information - including weather reports.
     """
 
+    __slots__ = (
+        '_point', '_ambiguity', '_course', '_speed', '_comment', '_messaging', '_power', '_height',
+        '_gain', '_directivity', '_radio_range', '_strength', '_bearing', '_number', '_df_range',
+        '_quality', '_compressed', '_compression_fix', '_compression_source', '_compression_origin',
+        '_offset'
+    )
+
     def __init__(self, latitude: float = 0.0, longitude: float = 0.0, ambiguity: int = 0,
                  course: int = None, speed: float = None, altitude: int = None, comment: str = None,
                  power: int = None, height: int = None, gain: int = None, directivity: int = None,
@@ -123,6 +131,7 @@ class PositionPacket(GenericPacket):
         self.compression_origin = compression_origin
 
     @property
+    @decoded
     def point(self) -> Point:
         """Get a point representing the latitude, longitude and optionally the altitude"""
         return self._point
@@ -133,26 +142,35 @@ class PositionPacket(GenericPacket):
         self._point = value
 
     @property
+    @decoded
     def latitude(self) -> float:
         """Get the latitude of the station"""
-        return round(self._point.latitude, 6)
+        return None if self._point is None else round(self._point.latitude, 6)
 
     @latitude.setter
     def latitude(self, value: float):
         """Set the latitude of the station"""
+        if self._point is None:
+            self._point = Point()
+
         self._point.latitude = value
 
     @property
+    @decoded
     def longitude(self) -> float:
         """Get the longitude of the station"""
-        return round(self._point.longitude, 6)
+        return None if self._point is None else round(self._point.longitude, 6)
 
     @longitude.setter
     def longitude(self, value: float):
         """Set the longitude of the station"""
+        if self._point is None:
+            self._point = Point()
+
         self._point.longitude = value
 
     @property
+    @decoded
     def ambiguity(self) -> int:
         """Get the ambiguity level of the packet"""
         return self._ambiguity
@@ -163,6 +181,7 @@ class PositionPacket(GenericPacket):
         self._ambiguity = value
 
     @property
+    @decoded
     def course(self) -> int:
         """Get the course of the station"""
         return self._course
@@ -173,6 +192,7 @@ class PositionPacket(GenericPacket):
         self._course = value
 
     @property
+    @decoded
     def speed(self) -> float:
         """Get the speed of the station"""
         return self._speed
@@ -183,16 +203,21 @@ class PositionPacket(GenericPacket):
         self._speed = value
 
     @property
+    @decoded
     def altitude(self) -> int:
         """Get the altitude of the station"""
-        return self._point.altitude
+        return None if self._point is None else self._point.altitude
 
     @altitude.setter
     def altitude(self, value: int):
         """Set the altitude of the station"""
+        if self._point is None:
+            self._point = Point()
+
         self._point.altitude = value
 
     @property
+    @decoded
     def comment(self) -> str:
         """Get the packet's comment"""
         return self._comment
@@ -203,6 +228,7 @@ class PositionPacket(GenericPacket):
         self._comment = value
 
     @property
+    @decoded
     def power(self) -> int:
         """Get the power (in watts)"""
         return self._power
@@ -213,6 +239,7 @@ class PositionPacket(GenericPacket):
         self._power = value
 
     @property
+    @decoded
     def height(self) -> int:
         """Get the antenna height above average terrain (in feet)"""
         return self._height
@@ -223,6 +250,7 @@ class PositionPacket(GenericPacket):
         self._height = value
 
     @property
+    @decoded
     def gain(self) -> int:
         """Get the antenna gain (in dB)"""
         return self._gain
@@ -233,6 +261,7 @@ class PositionPacket(GenericPacket):
         self._gain = value
 
     @property
+    @decoded
     def directivity(self) -> int:
         """Get the antenna directivity (in degrees)"""
         return self._directivity
@@ -243,6 +272,7 @@ class PositionPacket(GenericPacket):
         self._directivity = value
 
     @property
+    @decoded
     def radio_range(self) -> int:
         """Get the radio range (in miles)"""
         return self._radio_range
@@ -253,6 +283,7 @@ class PositionPacket(GenericPacket):
         self._radio_range = value
 
     @property
+    @decoded
     def strength(self) -> int:
         """Get the DF signal strength (in S-points)"""
         return self._strength
@@ -263,6 +294,7 @@ class PositionPacket(GenericPacket):
         self._strength = value
 
     @property
+    @decoded
     def bearing(self) -> int:
         """Get the DF signal bearing (in degrees)"""
         return self._bearing
@@ -273,6 +305,7 @@ class PositionPacket(GenericPacket):
         self._bearing = value
 
     @property
+    @decoded
     def number(self) -> float:
         """Get the DF hit ratio percentage"""
         return self._number
@@ -284,6 +317,7 @@ class PositionPacket(GenericPacket):
         self._number = value
 
     @property
+    @decoded
     def df_range(self) -> int:
         """Get the DF range (in miles)"""
         return self._df_range
@@ -294,6 +328,7 @@ class PositionPacket(GenericPacket):
         self._df_range = value
 
     @property
+    @decoded
     def quality(self) -> int:
         """Get the DF bearing accuracy (in degrees)"""
         return self._quality
@@ -305,6 +340,7 @@ class PositionPacket(GenericPacket):
         self._quality = value
 
     @property
+    @decoded
     def messaging(self) -> bool:
         """Get whether this station is message-capable or not"""
         return self._messaging
@@ -318,6 +354,7 @@ class PositionPacket(GenericPacket):
         self._messaging = value
 
     @property
+    @decoded
     def compressed(self) -> bool:
         """Get whether this packet is using compressed positions or not"""
         return self._compressed
@@ -331,6 +368,7 @@ class PositionPacket(GenericPacket):
         self._compressed = value
 
     @property
+    @decoded
     def compression_fix(self) -> CompressionFix:
         """Get the compression fix type."""
         return self._compression_fix
@@ -346,6 +384,7 @@ class PositionPacket(GenericPacket):
             ))
 
     @property
+    @decoded
     def compression_source(self) -> CompressionSource:
         """Get the compression source type."""
         return self._compression_source
@@ -363,6 +402,7 @@ class PositionPacket(GenericPacket):
             )
 
     @property
+    @decoded
     def compression_origin(self) -> CompressionOrigin:
         """Get the compression origin type."""
         return self._compression_origin
@@ -404,18 +444,16 @@ class PositionPacket(GenericPacket):
         except ValueError as e:
             raise ParseError("Invalid longitude: {}".format(e))
 
-        logger.debug("Latitude: {} ({}) Longitude: {}".format(
-            lat, ambiguity, lng
-        ))
+        logger.debug("Latitude: %s (%s) Longitude: %s", lat, ambiguity, lng)
 
         # Parse the symbol table
         symbol_table = data[8]
-        logger.debug("Symbol table: {}".format(symbol_table))
+        logger.debug("Symbol table: %s", symbol_table)
 
         try:
             # Parse the symbol ID
             symbol_id = data[18]
-            logger.debug("Symbol: {}".format(symbol_id))
+            logger.debug("Symbol: %s", symbol_id)
         except IndexError:
             raise ParseError("Missing symbol identifier")
 
@@ -477,20 +515,14 @@ class PositionPacket(GenericPacket):
         if len(data) < 13:
             raise ValueError("Compressed position data must be at least 13 character")
 
-        logger.debug("Compressed lat/lng is: {}".format(data))
-
-        # Parse the compressed latitude and longitude character from the packet
-        comp_lat = data[1:5]
-        comp_lng = data[5:9]
+        logger.debug("Compressed lat/lng is: %s", data)
 
-        # Decode the latitude and longitude
-        latitude = APRSUtils.decode_compressed_latitude(comp_lat)
-        longitude = APRSUtils.decode_compressed_longitude(comp_lng)
+        # Decode the latitude, longitude and the c, s and compression type bytes in one go
+        block = base91.decode_block(data[0:13])
+        latitude = block.latitude
+        longitude = block.longitude
 
-        logger.debug("Latitude: {} Longitude: {}".format(latitude, longitude))
-
-        # Decode the compression type, which determines what other data the packet provides.
-        comp_type = "{:0>8b}".format(ord(data[12])-33)[::-1]
+        logger.debug("Latitude: %s Longitude: %s", latitude, longitude)
 
         altitude = None
         course = None
@@ -507,44 +539,39 @@ class PositionPacket(GenericPacket):
 
             logger.debug("No course, speed or range data")
 
-        elif comp_type[3] == "0" and comp_type[4] == "1":
-            # The altitude is obtained by subtracting 33 from the ASCII value for the c and s
-            # characters, multiplying c by 91, adding s, and then raising 1.002 to the power of the
-            # result.
-            # See APRS 1.01 C9 P40
-            c = ord(data[10]) - 33
-            s = ord(data[11]) - 33
-            altitude = round((1.002 ** (c * 91 + s)), 2)
+        elif (block.t >> 3) & 3 == 2:
+            # If the GGA bits of the compression type are set, then the altitude is obtained by
+            # subtracting 33 from the ASCII value for the c and s characters, multiplying c by 91,
+            # adding s, and then raising 1.002 to the power of the result.
+            # See APRS 1.01 C9 P39-P40
+            altitude = round((1.002 ** (block.c * 91 + block.s)), 2)
 
             fix, source, origin = cls._parse_compressed_byte(data[12])
 
-            logger.debug("Altitude: {}".format(altitude))
+            logger.debug("Altitude: %s", altitude)
 
-        elif 0 <= (ord(data[10])-33) <= 89:
+        elif 0 <= block.c <= 89:
             # The course is obtained by subtracting 33 from the ASCII value of c and then
             # multiplying it by 4
-            c = ord(data[10]) - 33
-            course = c * 4
+            course = block.c * 4
 
             # The speed is obtained by subtracting 33 from the ASCII value of s and then raising
             # 1.08 to the power of the result, and finally subtracting 1.
             # We round the result to 1 decimal place.
-            s = ord(data[11]) - 33
-            speed = round((1.08 ** s) - 1, 1)
+            speed = round((1.08 ** block.s) - 1, 1)
 
             fix, source, origin = cls._parse_compressed_byte(data[12])
 
-            logger.debug("Course: {} Speed: {}".format(course, speed))
+            logger.debug("Course: %s Speed: %s", course, speed)
 
         elif data[10] == "{":
             # The radio range is obtained by subtracting 33 from the ASCII value of s, raising 1.08
             # to the power of the result, and finally multiplying it by 2.
-            s = ord(data[11]) - 33
-            radio_range = round(2 * (1.08 ** s), 2)
+            radio_range = round(2 * (1.08 ** block.s), 2)
 
             fix, source, origin = cls._parse_compressed_byte(data[12])
 
-            logger.debug("Radio range: {}".format(radio_range))
+            logger.debug("Radio range: %s", radio_range)
         else:
             raise ValueError("Invalid character when looking for course/speed or range: {}".format(
                 data[10]
@@ -573,13 +600,11 @@ class PositionPacket(GenericPacket):
         # Encode the longitude
         lng = APRSUtils.encode_uncompressed_longitude(longitude, ambiguity)
 
-        logger.debug("Latitude: {} ({}) Longitude: {}".format(
-            lat, ambiguity, lng
-        ))
+        logger.debug("Latitude: %s (%s) Longitude: %s", lat, ambiguity, lng)
 
         # Parse the symbol table
-        logger.debug("Symbol table: {}".format(symbol_table))
-        logger.debug("Symbol ID: {}".format(symbol_id))
+        logger.debug("Symbol table: %s", symbol_table)
+        logger.debug("Symbol ID: %s", symbol_id)
 
         info = f"{lat}{symbol_table}{lng}{symbol_id}"
 
@@ -715,26 +740,26 @@ class PositionPacket(GenericPacket):
         if re.match(r'^PHG[0-9]{4}', data[:7]):
             # Packet has a PHG (power, antenna height/gain/directivity) value
             phg = data[3:7]
-            logger.debug("PHG is {}".format(phg))
+            logger.debug("PHG is %s", phg)
             data = data[7:]
 
         elif re.match('^RNG[0-9]{4}', data[:7]):
             # Packet has an RNG (radio range) value
             rng = data[3:7]
-            logger.debug("RNG is {}".format(rng))
+            logger.debug("RNG is %s", rng)
             data = data[7:]
 
         elif re.match('^DFS[0-9]{4}', data[:7]):
             # Packet has a DFS (DF signal strength, antenna height/gain/directivity) value
             dfs = data[3:7]
-            logger.debug("DFS is {}".format(dfs))
+            logger.debug("DFS is %s", dfs)
             data = data[7:]
 
         elif re.match('^[0-9]{3}/[0-9]{3}', data[:7]):
             # Packet has course and speed values
             course = int(data[:3])
             speed = int(data[4:7])
-            logger.debug("Course is {}, speed is {}".format(course, speed))
+            logger.debug("Course is %s, speed is %s", course, speed)
             data = data[7:]
 
         # TODO - parse BRG/NRQ
@@ -748,14 +773,14 @@ class PositionPacket(GenericPacket):
             if has_altitude:
                 # TODO - fix altitude format
                 altitude = int(has_altitude.groups()[0])
-                logger.debug("Altitude is {} ft".format(altitude))
+                logger.debug("Altitude is %s ft", altitude)
 
                 # Strip out the altitude from the comment
                 data = re.sub(r'/A=[0-9]{6}', "", data)
 
             # Set the comment as the remainder of the information field
             comment = data
-            logger.debug("Comment is {}".format(comment))
+            logger.debug("Comment is %s", comment)
 
         return (phg, rng, dfs, course, speed, altitude, comment)
 
@@ -816,6 +841,10 @@ class PositionPacket(GenericPacket):
         The parsed and decoded values are stored in the current object.
         """
 
+        if len(self._info) < 4:
+            # TODO - handle this properly
+            raise ParseError("Packet is too short.")
+
         # First, check if this packet has a '!' at an offset position
         # This is allowed as per APRS 1.01 C5 P18
         if hasattr(self, '_offset'):
@@ -833,7 +862,9 @@ class PositionPacket(GenericPacket):
             self.messaging = False
 
             # Parse timestamp
-            (self.timestamp, self.timestamp_type) = APRSUtils.decode_timestamp(self._info[0:8])
+            (self.timestamp, self.timestamp_type) = APRSUtils.decode_timestamp(
+                self._info[0:8], reference=self._ts
+            )
 
         elif self.data_type_id == '=':
             # Packet has no timestamp, station has messaging capability
@@ -845,7 +876,9 @@ class PositionPacket(GenericPacket):
             self.messaging = True
 
             # Parse timestamp
-            (self.timestamp, self.timestamp_type) = APRSUtils.decode_timestamp(self._info[0:8])
+            (self.timestamp, self.timestamp_type) = APRSUtils.decode_timestamp(
+                self._info[0:8], reference=self._ts
+            )
 
         else:
             # This isn't a position packet
@@ -888,7 +921,7 @@ class PositionPacket(GenericPacket):
 
                     # Extract the bearing
                     self.bearing = int(comment[1:4])
-                    logger.debug(f"DF bearing is {self.bearing} degrees")
+                    logger.debug("DF bearing is %s degrees", self.bearing)
 
                     # Decode the NRQ value
                     (self.number, self.df_range, self.quality) = APRSUtils.decode_nrq(comment[5:8])
@@ -912,7 +945,7 @@ class PositionPacket(GenericPacket):
                 elif radio_range:
                     # The radio range is specified as 4 digits, which denote the range in miles
                     self.radio_range = int(radio_range)
-                    logger.debug(f"Radio range is {radio_range} miles")
+                    logger.debug("Radio range is %s miles", radio_range)
 
                     # The PHG value has already been stripped from the comment
                     self.comment = comment
@@ -954,7 +987,7 @@ class PositionPacket(GenericPacket):
             # TODO - parse altitude information
 
             self.comment = data[13:]
-            logger.debug("Comment is {}".format(self.comment))
+            logger.debug("Comment is %s", self.comment)
 
         # If we get this far, then we've parsed the packet
         return True
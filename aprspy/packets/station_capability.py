@@ -5,7 +5,7 @@ import logging
 
 from ..exceptions import ParseError
 from ..utils import APRSUtils
-from .generic import GenericPacket
+from .generic import GenericPacket, decoded
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -18,12 +18,25 @@ class StationCapabilityPacket(GenericPacket):
     See APRS 1.01 C15 P77
     """
 
+    __slots__ = ('_status_message', '_maidenhead_locator', '_capabilities')
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._status_message = None
         self._maidenhead_locator = None
         self.capabilities = []
 
+    @property
+    @decoded
+    def capabilities(self) -> list:
+        """Get the station's capabilities"""
+        return self._capabilities
+
+    @capabilities.setter
+    def capabilities(self, value: list):
+        """Set the station's capabilities"""
+        self._capabilities = value
+
     def _parse(self) -> bool:
         """ TODO """
         capabilities = self._info.split(",")
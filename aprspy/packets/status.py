@@ -5,7 +5,7 @@ import logging
 
 from ..exceptions import ParseError
 from ..utils import APRSUtils
-from .generic import GenericPacket
+from .generic import GenericPacket, decoded
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -21,12 +21,15 @@ class StatusPacket(GenericPacket):
     See APRS 1.01 C16 P80
     """
 
+    __slots__ = ('_status_message', '_maidenhead_locator')
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._status_message = None
         self._maidenhead_locator = None
 
     @property
+    @decoded
     def status_message(self) -> str:
         """Get the status message"""
         return self._status_message
@@ -37,6 +40,7 @@ class StatusPacket(GenericPacket):
         self._status_message = value
 
     @property
+    @decoded
     def maidenhead_locator(self) -> str:
         """Get the Maidenhead locator (if set)"""
         return self._maidenhead_locator
@@ -66,11 +70,11 @@ class StatusPacket(GenericPacket):
 
         if len(self._info) >= 6:
             mh_4 = self._info[0:6]
-            logger.debug("Considering as Maidenhead locator: {}".format(mh_4))
+            logger.debug("Considering as Maidenhead locator: %s", mh_4)
 
         if len(self._info) >= 8:
             mh_6 = self._info[0:8]
-            logger.debug("Considering as Maidenhead locator: {}".format(mh_6))
+            logger.debug("Considering as Maidenhead locator: %s", mh_6)
 
         if mh_6 is not None and re.match("[A-Z]{2}[0-9]{2}[A-Z]{2}[/\\\0-9A-Z].", mh_6):
             # Maidenhead locator (GGnngg)
@@ -79,9 +83,10 @@ class StatusPacket(GenericPacket):
             self.symbol_table = mh_6[6]
             self.symbol_id = mh_6[7]
 
-            logger.debug("Status with Maidenhead locator {}, symbol {} {}".format(
+            logger.debug(
+                "Status with Maidenhead locator %s, symbol %s %s",
                 self.maidenhead_locator, self.symbol_table, self.symbol_id
-            ))
+            )
 
             if len(self._info) != 8:
                 # First character of the text must be " " (C16 P82)
@@ -90,7 +95,7 @@ class StatusPacket(GenericPacket):
                     raise ParseError("Status message is invalid", self)
                 else:
                     self.status_message = self._info[9:]
-                    logger.debug("Status message is {}".format(self.status_message))
+                    logger.debug("Status message is %s", self.status_message)
             else:
                 logger.debug("No status message")
 
@@ -101,9 +106,10 @@ class StatusPacket(GenericPacket):
             self.symbol_table = mh_4[4]
             self.symbol_id = mh_4[5]
 
-            logger.debug("Status with Maidenhead locator {}, symbol {} {}".format(
+            logger.debug(
+                "Status with Maidenhead locator %s, symbol %s %s",
                 self.maidenhead_locator, self.symbol_table, self.symbol_id
-            ))
+            )
 
             if len(self._info) != 6:
 
@@ -113,7 +119,7 @@ class StatusPacket(GenericPacket):
                     raise ParseError("Status message is invalid", self)
                 else:
                     self.status_message = self._info[7:]
-                    logger.debug("Status message is {}".format(self.status_message))
+                    logger.debug("Status message is %s", self.status_message)
             else:
                 logger.debug("No status message")
 
@@ -121,29 +127,31 @@ class StatusPacket(GenericPacket):
             # Check for a timestamp
             if re.match("^[0-9]{6}z", self._info):
                 try:
-                    self.timestamp = APRSUtils.decode_timestamp(self._info[0:7])
+                    (self.timestamp, self.timestamp_type) = APRSUtils.decode_timestamp(
+                        self._info[0:7], reference=self._ts
+                    )
                     # TODO Sanity check the timestamp type - status reports can only use zulu
                     # or local, so if hms is used, throw an error.
                     # if timestamp_type == 'h' and data_type_id == '>':
                     #     logger.error("Timestamp type 'h' cannot be used for status reports")
                     #     raise ParseError("Timestamp type 'h' cannot be used for status reports")
-                    logger.debug("Status message timestamp is {}".format(self.timestamp))
+                    logger.debug("Status message timestamp is %s", self.timestamp)
 
                 except ParseError:
                     self.timestamp = None
 
                 self.status_message = self._info[7:]
-                logger.debug("Status message is {}".format(self.status_message))
+                logger.debug("Status message is %s", self.status_message)
 
             else:
                 self.status_message = self._info
                 logger.debug("No timestamp found")
-                logger.debug("Status message is {}".format(self.status_message))
+                logger.debug("Status message is %s", self.status_message)
 
         # Check for a beam heading and ERP
         # TODO - Parse and decode the beam and ERP values
         if self.status_message and re.match(r'[\^].{2}', self.status_message[-3:]):
-            logger.debug("Status message heading and power: {}".format(self.status_message[-2:]))
+            logger.debug("Status message heading and power: %s", self.status_message[-2:])
 
         return True
 
@@ -7,7 +7,7 @@ from bitstring import Bits
 
 from ..exceptions import ParseError
 from ..utils import APRSUtils
-from .generic import GenericPacket
+from .generic import GenericPacket, decoded
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -79,6 +79,8 @@ class TelemetryPacket(GenericPacket):
     See APRS 1.01 C13 P68
     """
 
+    __slots__ = ('_sequence_number', '_av1', '_av2', '_av3', '_av4', '_av5', '_dv', '_comment')
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -93,6 +95,7 @@ class TelemetryPacket(GenericPacket):
         self._comment = None
 
     @property
+    @decoded
     def sequence_number(self) -> str:
         return self._sequence_number
 
@@ -101,6 +104,7 @@ class TelemetryPacket(GenericPacket):
         self._sequence_number = value
 
     @property
+    @decoded
     def av1(self) -> TelemetryAnalogValue:
         return self._av1
 
@@ -112,6 +116,7 @@ class TelemetryPacket(GenericPacket):
             self._av1 = TelemetryAnalogValue(value)
 
     @property
+    @decoded
     def av2(self) -> TelemetryAnalogValue:
         return self._av2
 
@@ -123,6 +128,7 @@ class TelemetryPacket(GenericPacket):
             self._av2 = TelemetryAnalogValue(value)
 
     @property
+    @decoded
     def av3(self) -> TelemetryAnalogValue:
         return self._av3
 
@@ -134,6 +140,7 @@ class TelemetryPacket(GenericPacket):
             self._av3 = TelemetryAnalogValue(value)
 
     @property
+    @decoded
     def av4(self) -> TelemetryAnalogValue:
         return self._av4
 
@@ -145,6 +152,7 @@ class TelemetryPacket(GenericPacket):
             self._av4 = TelemetryAnalogValue(value)
 
     @property
+    @decoded
     def av5(self) -> TelemetryAnalogValue:
         return self._av5
 
@@ -156,6 +164,7 @@ class TelemetryPacket(GenericPacket):
             self._av5 = TelemetryAnalogValue(value)
 
     @property
+    @decoded
     def dv(self) -> TelemetryDigitalValue:
         return self._dv
 
@@ -167,6 +176,7 @@ class TelemetryPacket(GenericPacket):
             self._dv = TelemetryDigitalValue(value)
 
     @property
+    @decoded
     def comment(self) -> str:
         return self._comment
 
@@ -209,11 +219,11 @@ class TelemetryPacket(GenericPacket):
 
         except ValueError:
             # This is likely due to an invalid digital value
-            logger.warning("Invalid digital value in '{}', ignoring.".format(remainder))
+            logger.warning("Invalid digital value in '%s', ignoring.", remainder)
 
         except bitstring.CreationError:
             # Failed to add the digital value, so skip it
-            logger.warning("Invalid digital value in '{}', ignoring.".format(remainder))
+            logger.warning("Invalid digital value in '%s', ignoring.", remainder)
 
         return True
 
@@ -35,6 +35,17 @@ class TelemetryDefinitionPacket(GenericPacket):
     def _parse(self) -> bool:
         pass
 
+    def __getattr__(self, name: str):
+        # The fields are set dynamically when the packet is decoded, so if the packet was parsed
+        # lazily, decode it and try again
+        if name != '_lazy' and self._lazy is not None:
+            self._decode()
+            return getattr(self, name)
+
+        raise AttributeError("'{}' object has no attribute '{}'".format(
+            self.__class__.__name__, name
+        ))
+
     def __repr__(self):
         if self.source:
             return "<{}: {}>".format(self.__class__.__name__, self.source)
@@ -138,9 +149,9 @@ class TelemetryEquationCoefficientsPacket(TelemetryDefinitionPacket):
                 setattr(self, fields[field_number], value)
                 field_number += 1
         except IndexError:
-            logger.warning("Equation coefficient specifies too many fields ({} > {})".format(
-                len(values), len(fields)
-            ))
+            logger.warning(
+                "Equation coefficient specifies too many fields (%s > %s)", len(values), len(fields)
+            )
 
         return True
 
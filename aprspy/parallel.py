@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+import os
+import logging
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator, List, Union
+
+from . import APRS
+from .checksum import Checksum, get_default as get_default_checksum
+from .tokenizer import decode_text
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+def _chunks(packets: Iterable, chunk_size: int) -> Iterator[list]:
+    """
+    Split an iterable into lists of at most ``chunk_size`` items.
+    """
+    packets = iter(packets)
+
+    while True:
+        chunk = list(islice(packets, chunk_size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def parse_chunk(chunk: List[Union[str, bytes]], timestamp: datetime = None,
+                strict_mode: bool = True, lazy: bool = False,
+                checksum: Union[Checksum, str] = None) -> list:
+    """
+    Parse a chunk of packets.
+
+    :param list chunk: a list of raw packets as strings or bytes (or tuples of a raw packet and a
+        timestamp)
+    :param datetime timestamp: an (optional) timestamp to use for packets without one
+    :param bool strict_mode: whether to raise errors (``True``) or return generic packets
+    :param bool lazy: whether to defer decoding the information field of each packet
+    :param Checksum checksum: the type of checksum to calculate
+
+    This is run in the worker processes, and returns a list of packets and
+    :class:`aprspy.ParseFailure` records (see :func:`aprspy.APRS.parse_many`). Packets given as
+    bytes are decoded in the same way as :func:`aprspy.APRS.parse`, so that failures hold the
+    packet as a string.
+    """
+    chunk = [decode_text(packet) if type(packet) is bytes else packet for packet in chunk]
+
+    return list(APRS.parse_many(chunk, timestamp=timestamp, strict_mode=strict_mode, lazy=lazy,
+                                checksum=checksum))
+
+
+def parse_parallel(packets: Iterable[str], workers: int = None, chunk_size: int = 1000,
+                   ordered: bool = True, timestamp: datetime = None,
+                   strict_mode: bool = True, lazy: bool = False,
+                   checksum: Union[Checksum, str] = None) -> Iterator:
+    """
+    Parse packets across a number of worker processes.
+
+    :param iterable packets: an iterable of raw packets as strings or bytes (or tuples of a raw
+        packet and a timestamp)
+    :param int workers: the number of worker processes (defaults to the number of CPUs)
+    :param int chunk_size: the number of packets sent to a worker at a time
+    :param bool ordered: whether packets should be yielded in the same order as the input
+    :param datetime timestamp: an (optional) timestamp to use for packets without one
+    :param bool strict_mode: whether to raise errors (``True``) or return generic packets
+    :param bool lazy: whether to defer decoding the information field of each packet (see
+        :func:`aprspy.APRS.parse`)
+    :param Checksum checksum: the type of checksum to calculate (by default, the type set with
+        :func:`aprspy.APRS.set_default_checksum` in this process is used, rather than the one in
+        the workers)
+
+    Packets are sent to the workers in chunks, to amortize the cost of passing them between
+    processes. Only a limited number of chunks are queued at any one time, so memory use is bounded
+    regardless of the size of the input.
+
+    As with :func:`aprspy.APRS.parse_many`, packets that cannot be parsed are yielded as
+    :class:`aprspy.ParseFailure` records.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError("Workers must be at least 1 ({} given)".format(workers))
+
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1 ({} given)".format(chunk_size))
+
+    # The workers may not share this process's default checksum (for example, if they're spawned
+    # rather than forked), so it's passed to them
+    if checksum is None:
+        checksum = get_default_checksum()
+
+    options = (timestamp, strict_mode, lazy, checksum)
+
+    # Keep each worker busy while the results of the previous chunk are being consumed
+    max_pending = workers * 2
+
+    chunks = _chunks(packets, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if ordered:
+            pending = deque()
+
+            for chunk in chunks:
+                pending.append(executor.submit(parse_chunk, chunk, *options))
+
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+
+        else:
+            pending = set()
+
+            for chunk in chunks:
+                pending.add(executor.submit(parse_chunk, chunk, *options))
+
+                if len(pending) >= max_pending:
+                    (done, pending) = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+
+            while pending:
+                (done, pending) = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+
+def parse_file(path: Union[str, os.PathLike], **kwargs) -> Iterator:
+    """
+    Parse a file of packets (one per line) across a number of worker processes.
+
+    :param str path: the path to the file
+
+    Lines are read as bytes and decoded by the workers in the same way as
+    :func:`aprspy.APRS.parse` (as UTF-8, or Latin-1 if they aren't valid UTF-8). Any other keyword
+    arguments are passed to :func:`parse_parallel`.
+    """
+    with open(path, "rb") as f:
+        yield from parse_parallel(f, **kwargs)
@@ -0,0 +1,404 @@
+#!/usr/bin/env python
+
+import os
+import time
+import pickle
+import logging
+
+from collections import OrderedDict
+from os import PathLike
+from typing import Iterable, Iterator, Optional, Union
+
+from .components import Station
+from .exceptions import ParseError
+from .geo import GridIndex
+from .packets.generic import GenericPacket
+from .packets.position import PositionPacket
+from .packets.status import StatusPacket
+from .packets.telemetry import TelemetryPacket
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# The version of the snapshot format written by StationStore.save
+SNAPSHOT_VERSION = 1
+
+
+class StationRecord:
+    """
+    Class holding the latest known state of a station.
+
+    Rather than keeping the packets themselves, only the fields most often needed are kept, so that
+    each record is small. Each group of fields (position, status and telemetry) is updated when a
+    packet of that type is received from the station, along with the time it was received (in
+    seconds since the epoch). Fields which haven't been received are ``None``.
+    """
+    __slots__ = (
+        'station', 'last_heard', 'packets', 'path',
+        'latitude', 'longitude', 'altitude', 'course', 'speed', 'symbol_table', 'symbol_id',
+        'comment', 'position_heard',
+        'status', 'status_heard',
+        'telemetry', 'telemetry_heard',
+    )
+
+    def __init__(self, station: str):
+        self.station = station
+        self.last_heard = None
+        self.packets = 0
+        self.path = None
+
+        self.latitude = None
+        self.longitude = None
+        self.altitude = None
+        self.course = None
+        self.speed = None
+        self.symbol_table = None
+        self.symbol_id = None
+        self.comment = None
+        self.position_heard = None
+
+        self.status = None
+        self.status_heard = None
+
+        # A tuple of the five analog values and the digital value
+        self.telemetry = None
+        self.telemetry_heard = None
+
+    @staticmethod
+    def _read(packet: GenericPacket) -> tuple:
+        """
+        Read the fields kept from a packet, before any are stored.
+
+        This returns a tuple of the path, the group of fields the packet holds (``"position"``,
+        ``"status"``, ``"telemetry"`` or ``None``) and their values. Lazily-parsed packets are
+        decoded here, so that a :class:`ParseError` is raised before the record is changed.
+        """
+        path = None if packet.path is None else str(packet.path)
+
+        if isinstance(packet, PositionPacket):
+            # Packets which couldn't be decoded (when not in strict mode) have no position
+            if packet.latitude is None or packet.longitude is None:
+                return (path, None, None)
+
+            return (path, "position", (
+                packet.latitude, packet.longitude, packet.altitude, packet.course, packet.speed,
+                packet.symbol_table, packet.symbol_id, packet.comment
+            ))
+
+        elif isinstance(packet, StatusPacket):
+            return (path, "status", packet.status_message)
+
+        elif isinstance(packet, TelemetryPacket):
+            return (path, "telemetry", tuple(
+                None if value is None or value.value is None else float(value.value)
+                for value in (packet.av1, packet.av2, packet.av3, packet.av4, packet.av5)
+            ) + (None if packet.dv is None or packet.dv.value is None else packet.dv.value.uint,))
+
+        return (path, None, None)
+
+    def _update(self, fields: tuple, now: float) -> bool:
+        """
+        Update the record from the fields of a packet received from the station (see
+        :func:`_read`), returning whether the position was updated.
+
+        Each group of fields is only updated if the packet is at least as new as the one they were
+        last updated from, so a packet received out of order doesn't replace newer values.
+        ``last_heard`` is set by the store (see :func:`StationStore.update`).
+        """
+        (path, group, values) = fields
+
+        self.packets += 1
+        self.path = path
+
+        if group == "position":
+            if self.position_heard is not None and now < self.position_heard:
+                return False
+
+            (self.latitude, self.longitude, self.altitude, self.course, self.speed,
+             self.symbol_table, self.symbol_id, self.comment) = values
+            self.position_heard = now
+
+            return True
+
+        elif group == "status":
+            if self.status_heard is None or now >= self.status_heard:
+                self.status = values
+                self.status_heard = now
+
+        elif group == "telemetry":
+            if self.telemetry_heard is None or now >= self.telemetry_heard:
+                self.telemetry = values
+                self.telemetry_heard = now
+
+        return False
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for (name, value) in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return "<StationRecord: {}>".format(self.station)
+
+
+class StationStore:
+    """
+    Store of the latest known state of each station.
+
+    Parsed packets are given to the store as they're received, and the record for the station which
+    sent each packet (see :class:`StationRecord`) is updated::
+
+        store = StationStore(ttl=3600)
+        store.update_many(APRS.parse_many(lines))
+
+        record = store.get("XX1XX-9")
+
+    Records are kept in a dictionary ordered by when each station was last heard, so updates and
+    lookups take constant time. Stations which haven't been heard for ``ttl`` seconds are removed
+    from the front of the dictionary as packets arrive, and if ``max_stations`` is given, the
+    stations heard least recently are removed to keep the store within that size - which bounds the
+    memory it uses.
+
+    The time each packet was received is taken from its timestamp (as given to
+    :func:`aprspy.APRS.parse`), or the current time if it has none, so archives can be replayed.
+
+    Keeping the dictionary in order relies on ``last_heard`` never going backwards. A packet
+    received out of order (older than the latest packet given to the store) still updates the
+    record, with its own time as the time each field was heard - but the station is counted as last
+    heard at the latest time. Packets more than ``ttl`` seconds older than the latest are ignored,
+    since they would have already expired.
+
+    If an ``index`` is given, the position of each station is kept in it as stations move and are
+    removed, so that stations can be found by position (see :class:`aprspy.geo.GridIndex`)::
+
+        store = StationStore(ttl=3600, index=GridIndex())
+        ...
+
+        nearby = store.index.within_radius(50.5, -100.3, 25)
+    """
+
+    def __init__(self, ttl: float = None, max_stations: int = None, index: GridIndex = None):
+        """
+        Create a new station store.
+
+        :param float ttl: an (optional) number of seconds after which stations which haven't been
+            heard are removed
+        :param int max_stations: an (optional) maximum number of stations to keep
+        :param GridIndex index: an (optional) spatial index to keep the positions of stations in
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL must be greater than 0 ({} given)".format(ttl))
+
+        if max_stations is not None and max_stations < 1:
+            raise ValueError("Maximum stations must be at least 1 ({} given)".format(max_stations))
+
+        self.ttl = ttl
+        self.max_stations = max_stations
+        self.index = index
+
+        self._records = OrderedDict()
+
+        # The latest time a packet was received, which last_heard never goes back before
+        self._latest = None
+
+    @staticmethod
+    def _key(station: Union[str, Station]) -> str:
+        return station if type(station) is str else str(station)
+
+    def _evict(self):
+        """
+        Remove the station heard least recently.
+        """
+        (key, _) = self._records.popitem(last=False)
+
+        if self.index is not None:
+            self.index.remove(key)
+
+    @staticmethod
+    def _now(packet: GenericPacket) -> float:
+        return time.time() if packet._ts is None else packet._ts.timestamp()
+
+    def update(self, packet: GenericPacket, now: float = None) -> Optional[StationRecord]:
+        """
+        Update the record of the station which sent a packet, returning the record.
+
+        :param GenericPacket packet: a parsed packet
+        :param float now: the (optional) time the packet was received, in seconds since the epoch
+
+        Anything other than a packet (such as a :class:`aprspy.ParseFailure`) is ignored, in which
+        case ``None`` is returned, as are packets which have already expired and lazily-parsed
+        packets which can't be decoded.
+        """
+        if not isinstance(packet, GenericPacket) or packet.source is None:
+            return None
+
+        if now is None:
+            now = self._now(packet)
+
+        # Records are ordered by last_heard, so a packet received out of order counts as being
+        # heard at the latest time
+        latest = self._latest
+
+        if latest is None or now >= latest:
+            latest = self._latest = now
+
+        elif self.ttl is not None and now <= latest - self.ttl:
+            logger.debug("Ignoring expired packet from %s", packet.source)
+            return None
+
+        # Read the packet before changing anything, in case it can't be decoded
+        try:
+            fields = StationRecord._read(packet)
+
+        except ParseError as e:
+            logger.warning("Ignoring packet from %s which can't be decoded: %s", packet.source, e)
+            return None
+
+        key = self._key(packet.source)
+        records = self._records
+
+        record = records.get(key)
+
+        if record is None:
+            record = records[key] = StationRecord(key)
+
+            if self.max_stations is not None and len(records) > self.max_stations:
+                self._evict()
+        else:
+            records.move_to_end(key)
+
+        record.last_heard = latest
+
+        if record._update(fields, now) and self.index is not None:
+            self.index.update(key, record.latitude, record.longitude)
+
+        if self.ttl is not None:
+            self.expire(latest)
+
+        return record
+
+    def update_many(self, packets: Iterable) -> int:
+        """
+        Update the store from a number of packets, returning how many were used.
+
+        :param iterable packets: an iterable of packets, such as from :func:`aprspy.APRS.parse_many`
+        """
+        return sum(self.update(packet) is not None for packet in packets)
+
+    def expire(self, now: float = None) -> int:
+        """
+        Remove the stations which haven't been heard for ``ttl`` seconds, returning how many were
+        removed.
+
+        :param float now: the (optional) current time, in seconds since the epoch
+
+        This is done each time a packet is added, but can also be called when no packets are being
+        received.
+        """
+        if self.ttl is None:
+            return 0
+
+        if now is None:
+            now = time.time()
+
+        cutoff = now - self.ttl
+        records = self._records
+        removed = 0
+
+        while records:
+            record = next(iter(records.values()))
+
+            if record.last_heard > cutoff:
+                break
+
+            self._evict()
+            removed += 1
+
+        return removed
+
+    def get(self, station: Union[str, Station]) -> Optional[StationRecord]:
+        """
+        Get the record for a station, or ``None`` if it isn't in the store.
+
+        :param str station: a callsign (with an SSID, if it has one) or a :class:`Station`
+        """
+        return self._records.get(self._key(station))
+
+    def save(self, file: Union[str, PathLike]):
+        """
+        Save a snapshot of the store to a file.
+
+        :param str file: the path to the file
+
+        The snapshot is written to a temporary file which then replaces ``file``, so an existing
+        snapshot is never left partly written.
+        """
+        temporary = "{}.tmp".format(os.fspath(file))
+
+        with open(temporary, "wb") as f:
+            pickle.dump(
+                (SNAPSHOT_VERSION, self.ttl, self.max_stations, list(self._records.values())),
+                f, protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+        os.replace(temporary, file)
+        logger.debug("Saved %s stations to %s", len(self._records), file)
+
+    @staticmethod
+    def load(file: Union[str, PathLike], index: GridIndex = None) -> "StationStore":
+        """
+        Load a store from a snapshot saved with :func:`save`.
+
+        :param str file: the path to the file
+        :param GridIndex index: an (optional) spatial index, which is filled with the positions of
+            the stations in the snapshot
+
+        **Note**: snapshots are pickled, so should only be loaded from trusted sources.
+        """
+        with open(file, "rb") as f:
+            (version, ttl, max_stations, records) = pickle.load(f)
+
+        if version != SNAPSHOT_VERSION:
+            raise ValueError("Unsupported snapshot version: {}".format(version))
+
+        store = StationStore(ttl=ttl, max_stations=max_stations, index=index)
+        store._records.update((record.station, record) for record in records)
+
+        if records:
+            store._latest = records[-1].last_heard
+
+        if index is not None:
+            for record in records:
+                if record.latitude is not None and record.longitude is not None:
+                    index.update(record.station, record.latitude, record.longitude)
+
+        logger.debug("Loaded %s stations from %s", len(records), file)
+
+        return store
+
+    def clear(self):
+        """
+        Remove all the stations.
+        """
+        self._records.clear()
+        self._latest = None
+
+        if self.index is not None:
+            self.index.clear()
+
+    def __getitem__(self, station: Union[str, Station]) -> StationRecord:
+        return self._records[self._key(station)]
+
+    def __contains__(self, station: Union[str, Station]) -> bool:
+        return self._key(station) in self._records
+
+    def __iter__(self) -> Iterator[StationRecord]:
+        return iter(self._records.values())
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __repr__(self):
+        return "<StationStore: {} stations>".format(len(self))
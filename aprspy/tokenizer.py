@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+import re
+import logging
+
+from collections import namedtuple
+from typing import Tuple, Union
+
+from .exceptions import ParseError
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Named tuple to hold original raw values
+Raw = namedtuple('Raw', ['source', 'destination', 'path', 'information'])
+
+# A TNC2-formatted packet has the form SOURCE>DESTINATION,PATH:INFORMATION, where the first
+# character of the information field is the data type ID. Since none of the header fields can
+# contain a ':', the first ':' always separates the header from the information field.
+HEADER_REGEX = re.compile(r'([\w\-]+)>([\w\-]+),([\w\-\*\,]+):(.)(.*)')
+
+# The destination field should be upper case, with an optional numeric SSID
+DESTINATION_REGEX = re.compile(r'^[A-Z0-9]{1,6}(\-[0-9]{1,2})?$')
+
+
+def tokenize(packet: str) -> Tuple[Raw, str]:
+    """
+    Split a raw packet into its header fields, data type ID and information field.
+
+    :param str packet: a raw packet, in TNC2 format
+
+    This performs a single pass over the packet using a precompiled pattern, and returns a tuple
+    containing a :class:`Raw` named tuple (holding the source, destination, path and the information
+    field minus the data type ID) and the data type ID.
+
+    A :class:`ParseError` is raised if the packet cannot be split.
+    """
+    match = HEADER_REGEX.match(packet)
+
+    if match is None:
+        raise ParseError("Could not parse packet details", packet)
+
+    (source, destination, path, data_type_id, info) = match.groups()
+
+    return (Raw(source, destination, path, info), data_type_id)
+
+
+def decode_text(data: Union[bytes, memoryview]) -> str:
+    """
+    Decode text received as bytes.
+
+    :param bytes data: the text to decode
+
+    APRS doesn't specify a character set. Most packets are UTF-8 (of which ASCII is a subset), but
+    some older clients send Latin-1, so anything which isn't valid UTF-8 is decoded as Latin-1
+    instead. Since any sequence of bytes is valid Latin-1, this never fails.
+    """
+    try:
+        return str(data, "utf-8")
+    except UnicodeDecodeError:
+        return str(data, "latin-1")
+
+
+def is_valid_destination(destination: str) -> bool:
+    """
+    Check whether a destination address is valid.
+
+    :param str destination: a destination address
+    """
+    return DESTINATION_REGEX.match(destination) is not None
@@ -6,10 +6,18 @@ import math
 from datetime import datetime, timedelta, UTC
 from typing import Union, Tuple, Optional
 from .exceptions import ParseError
+from . import base91
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Decoded timestamps, keyed on the raw timestamp and the reference time (to the minute)
+_timestamp_cache = {}
+_TIMESTAMP_CACHE_SIZE = 4096
+
+# Valid timestamp type characters (APRS 1.01 specifies 'z' for zulu time, but some clients use 'Z')
+_TIMESTAMP_TYPES = frozenset(['z', 'Z', '/', 'h'])
+
 
 class APRSUtils:
     """
@@ -41,7 +49,7 @@ class APRSUtils:
 
         See also APRS 1.01 C6 P23.
         """
-        logger.debug("Input latitude: {}".format(latitude))
+        logger.debug("Input latitude: %s", latitude)
 
         # Regex match to catch any obviously-invalid latitudes
         if not re.match(r'^[0-9]{2}[\s0-9]{2}\.[\s0-9]{2}[NS]$', latitude):
@@ -51,7 +59,7 @@ class APRSUtils:
         # See C6 P24
         ambiguity = latitude.count(' ')
         latitude = latitude.replace(' ', '0')
-        logger.debug("Ambiguity: {}".format(ambiguity))
+        logger.debug("Ambiguity: %s", ambiguity)
 
         try:
             # Extract the number of degrees
@@ -59,16 +67,16 @@ class APRSUtils:
             if degrees > 90:
                 raise ValueError("Invalid degrees: {}".format(degrees))
 
-            logger.debug("Degrees: {}".format(degrees))
+            logger.debug("Degrees: %s", degrees)
 
             # Extract the number of minutes, convert it to a fraction of a degree,
             # and round it to 6 decimal places
             minutes = round(float(latitude[2:-1])/60, 6)
-            logger.debug("Minutes: {}".format(minutes))
+            logger.debug("Minutes: %s", minutes)
 
             # Extract the north/south
             direction = latitude[-1]
-            logger.debug("Direction: {}".format(direction))
+            logger.debug("Direction: %s", direction)
 
         except Exception as e:
             raise ParseError("Couldn't parse latitude {}: {}".format(
@@ -82,9 +90,7 @@ class APRSUtils:
         if direction == "S":
             lat *= -1
 
-        logger.debug("Output latitude: {}, ambiguity: {}".format(
-            lat, ambiguity
-        ))
+        logger.debug("Output latitude: %s, ambiguity: %s", lat, ambiguity)
         return (lat, ambiguity)
 
     @staticmethod
@@ -235,9 +241,7 @@ class APRSUtils:
         Positional ambiguity is handled by the latitude, and so should be
         honoured regardless of the precision of the longitude given (as per C6 P24).
         """
-        logger.debug("Input longitude: {}, ambiguity: {}".format(
-            longitude, ambiguity
-        ))
+        logger.debug("Input longitude: %s, ambiguity: %s", longitude, ambiguity)
 
         # Regex match to catch any obviously-invalid longitudes
         if not re.match(r'^[0-1][0-9]{2}[\s0-9]{2}\.[\s0-9]{2}[EW]$', longitude):
@@ -257,7 +261,7 @@ class APRSUtils:
         if degrees > 180:
             raise ValueError("Invalid degrees: {}".format(degrees))
 
-        logger.debug("Degrees: {}".format(degrees))
+        logger.debug("Degrees: %s", degrees)
 
         # Since we don't want to replace the '.', if the ambiguity is more than
         # 2, increment it by 1.
@@ -279,13 +283,13 @@ class APRSUtils:
             mins = longitude[3:-1]
 
         minutes = round(float(mins)/60, 6)
-        logger.debug("Ambiguity level: {}".format(ambiguity_level))
-        logger.debug("Minutes: {}".format(minutes))
+        logger.debug("Ambiguity level: %s", ambiguity_level)
+        logger.debug("Minutes: %s", minutes)
 
         # Extract the east/west
         direction = longitude[-1]
 
-        logger.debug("Direction: {}".format(direction))
+        logger.debug("Direction: %s", direction)
 
         # Add the degrees and minutes to give the longitude
         lng = degrees + minutes
@@ -294,7 +298,7 @@ class APRSUtils:
         if direction == "W":
             lng *= -1
 
-        logger.debug("Output longitude: {}".format(lng))
+        logger.debug("Output longitude: %s", lng)
         return lng
 
     @staticmethod
@@ -309,7 +313,7 @@ class APRSUtils:
 
         See also APRS 1.01 C9 P38.
         """
-        logger.debug("Input compressed latitude: {}".format(latitude))
+        logger.debug("Input compressed latitude: %s", latitude)
 
         # The compressed latitude string must be 4 characters
         if len(latitude) != 4:
@@ -320,19 +324,10 @@ class APRSUtils:
         # As per APRS 1.01, if the compressed latitude is y1y2y3y4, the latitude
         # can be determined with:-
         # 90 - ((y1-33) x 913 + (y2-33) x 912 + (y3-33) x 91 + y4-33) / 380926
-        lat = 90 - (
-            (ord(latitude[0])-33) * 91**3 +
-            (ord(latitude[1])-33) * 91**2 +
-            (ord(latitude[2])-33) * 91 +
-            (ord(latitude[3])-33)
-        ) / 380926
-        lat = round(lat, 6)
-
-        if lat > 90 or lat < -91:
-            raise ParseError("Invalid compressed latitude (greater than 90 or less than -90)")
+        lat = base91.decode_latitude(latitude)
 
         # Return latitude
-        logger.debug("Output latitude: {}".format(lat))
+        logger.debug("Output latitude: %s", lat)
         return lat
 
     @staticmethod
@@ -347,7 +342,7 @@ class APRSUtils:
 
         See also APRS 1.01 C9 P38
         """
-        logger.debug("Input compressed longitude: {}".format(longitude))
+        logger.debug("Input compressed longitude: %s", longitude)
 
         # The compressed longitude must be 4 characters
         if len(longitude) != 4:
@@ -358,19 +353,10 @@ class APRSUtils:
         # If the compressed longitude is x1x2x3x4, the longitude can be determined
         # with:-
         # -180 + ((x1-33) x 913 + (x2-33) x 912  + (x3-33) x 91 + x4-33) / 190463
-        lng = -180 + (
-            (ord(longitude[0])-33) * 91**3 +
-            (ord(longitude[1])-33) * 91**2 +
-            (ord(longitude[2])-33) * 91 +
-            (ord(longitude[3])-33)
-        ) / 190463
-        lng = round(lng, 6)
-
-        if lng > 180 or lng < -180:
-            raise ParseError("Invalid compressed longitude (greater than 180 or less than -180)")
+        lng = base91.decode_longitude(longitude)
 
         # Return longitude
-        logger.debug("Output longitude: {}".format(lng))
+        logger.debug("Output longitude: %s", lng)
         return lng
 
     @staticmethod
@@ -385,7 +371,7 @@ class APRSUtils:
 
         See also APRS 1.01 C9 P38.
         """
-        logger.debug("Input latitude: {}".format(latitude))
+        logger.debug("Input latitude: %s", latitude)
 
         # Ensure float or int, and between -90 and 90
         if type(latitude) is not float and type(latitude) is not int:
@@ -394,20 +380,10 @@ class APRSUtils:
         if latitude < -90 or latitude > 90:
             raise ValueError("Latitude must be between -90 and 90 ({} given)".format(latitude))
 
-        total = 380926 * (90 - latitude)
-        (a, remainder) = divmod(total, 91 ** 3)
-        (b, remainder) = divmod(remainder, 91 ** 2)
-        (c, d) = divmod(remainder, 91 ** 1)
-
-        lat = "{}{}{}{}".format(
-            chr(int(a)+33),
-            chr(int(b)+33),
-            chr(int(c)+33),
-            chr(int(d)+33)
-        )
+        lat = base91.encode_latitude(latitude)
 
         # Return latitude
-        logger.debug("Output latitude: {}".format(lat))
+        logger.debug("Output latitude: %s", lat)
         return lat
 
     @staticmethod
@@ -422,7 +398,7 @@ class APRSUtils:
 
         See also APRS 1.01 C9 P38
         """
-        logger.debug("Input longitude: {}".format(longitude))
+        logger.debug("Input longitude: %s", longitude)
 
         # Ensure float or int, and between -180 and 180
         if type(longitude) is not float and type(longitude) is not int:
@@ -433,36 +409,88 @@ class APRSUtils:
         if longitude < -180 or longitude > 180:
             raise ValueError("Longitude must be between -180 and 180 ({} given)".format(longitude))
 
-        total = 190463 * (180 + longitude)
-        (a, remainder) = divmod(total, 91 ** 3)
-        (b, remainder) = divmod(remainder, 91 ** 2)
-        (c, d) = divmod(remainder, 91 ** 1)
-
-        lng = "{}{}{}{}".format(
-            chr(int(a)+33),
-            chr(int(b)+33),
-            chr(int(c)+33),
-            chr(int(d)+33)
-        )
+        lng = base91.encode_longitude(longitude)
 
         # Return longitude
-        logger.debug("Output longitude: {}".format(lng))
+        logger.debug("Output longitude: %s", lng)
         return lng
 
     @staticmethod
-    def decode_timestamp(raw_timestamp: str) -> datetime:
+    def decode_timestamp(raw_timestamp: str, reference: datetime = None) -> datetime:
         """
         Decode a timestamp.
 
         :param str raw_timestamp: a string representing a timestamp
+        :param datetime reference: an (optional) reference time, such as the time the packet
+            arrived - if not given, the current time is used (and if naive, it's assumed to be UTC)
 
         Timestamps can take a number of different forms:-
          * Zulu, identified with a trailing 'z', which refers to zulu time
          * Local, identified with a trailing '/', which has no timezone information
          * A hour/minute/second timestamp without any date information
+
+        Since the same timestamps are seen in many packets, results are cached for each raw
+        timestamp and reference time (to the minute).
+        """
+        # Get the current UTC ('zulu') time for comparison, unless we've been given a reference
+        # time. Since timestamps in HHMMSS format have no date information, we need to
+        # determine if the timestamp is for today or yesterday
+        if reference is None:
+            utc = APRSUtils._get_utc()
+        elif reference.tzinfo is None:
+            # Assume naive reference times are UTC
+            utc = reference.replace(tzinfo=UTC)
+        else:
+            # Timestamps are decoded relative to the UTC date and time, so the cache must be too
+            utc = reference.astimezone(UTC)
+
+        # Only the first 7 characters make up the timestamp
+        raw_timestamp = raw_timestamp[0:7]
+
+        # These are checked before the cache, so that the warnings are logged for every packet
+        if len(raw_timestamp) == 7 and raw_timestamp[0:6].isdigit():
+            timestamp_type = raw_timestamp[6]
+
+            if timestamp_type not in _TIMESTAMP_TYPES:
+                # This is against spec, but as usual with APRS a lot of clients violate this - so
+                # assume they're zulu time
+                logger.warning("%s is an invalid timestamp type, assuming zulu", timestamp_type)
+
+            # Sometimes, 000000 is used to indicate no timestamp is available
+            if timestamp_type != 'h' and raw_timestamp[0:6] == "000000":
+                logger.warning("Timestamp specified but is set to all zeroes.")
+
+        # DHM timestamps have no seconds, so the result only depends on the minute of the reference
+        # time - and the same is true of HMS timestamps, unless they fall within that minute
+        if raw_timestamp[6:7] == 'h' and raw_timestamp[0:4] == "%02d%02d" % (utc.hour, utc.minute):
+            return APRSUtils._decode_timestamp(raw_timestamp, utc)
+
+        key = (raw_timestamp, utc.year, utc.month, utc.day, utc.hour, utc.minute)
+
+        try:
+            return _timestamp_cache[key]
+        except KeyError:
+            pass
+
+        result = APRSUtils._decode_timestamp(raw_timestamp, utc)
+
+        # Older entries are unlikely to be used again once the reference time has moved on, so
+        # rather than tracking usage, just start again once the cache is full
+        if len(_timestamp_cache) >= _TIMESTAMP_CACHE_SIZE:
+            _timestamp_cache.clear()
+
+        _timestamp_cache[key] = result
+
+        return result
+
+    @staticmethod
+    def _decode_timestamp(raw_timestamp: str, utc: datetime) -> Tuple[datetime, str]:
         """
+        Decode a timestamp, relative to a reference time.
 
-        logger.debug("Raw timestamp is {}".format(raw_timestamp))
+        See :func:`decode_timestamp`.
+        """
+        logger.debug("Raw timestamp is %s", raw_timestamp)
         ts = re.match(r'^(\d{6})(.)', raw_timestamp)
         if ts:
             timestamp, timestamp_type = ts.groups()
@@ -479,16 +507,9 @@ class APRSUtils:
                 timestamp_type = 'hms'
                 logger.debug("Timestamp is hhmmss time")
             else:
-                # This is against spec, but as usual with APRS a lot of clients violate this - so
-                # assume they're zulu time
-                logger.warning("{} is an invalid timestamp type, assuming zulu".format(timestamp_type))
+                # An invalid timestamp type, which has already been logged by decode_timestamp
                 timestamp_type = 'zulu'
 
-            # Get the current UTC ('zulu') time for comparison. Since timestamps in HHMMSS format
-            # have no date information, we need to determine if the timestamp is for today or
-            # yesterday
-            utc = APRSUtils._get_utc()
-
             if timestamp_type == 'hms':
                 # HHMMSS format
 
@@ -509,7 +530,7 @@ class APRSUtils:
                         tzinfo=UTC
                     )
                 except ValueError as e:
-                    logger.error("Error parsing timestamp '{}': {}".format(raw_timestamp, e))
+                    logger.error("Error parsing timestamp '%s': %s", raw_timestamp, e)
                     raise ParseError("Error parsing timestamp '{}': {}".format(raw_timestamp, e))
 
                 # Check it's not in the future
@@ -517,9 +538,8 @@ class APRSUtils:
                     # The timestamp is in the future, so go back a day
                     ts -= timedelta(days=1)
 
-                # Convert to seconds
-                timestamp = int(ts.timestamp())
-                logger.debug("Timestamp is {}".format(ts.strftime("%Y%m%d%H%M%S")))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Timestamp is %s", ts.strftime("%Y%m%d%H%M%S"))
 
             elif timestamp_type == 'zulu' or timestamp_type == 'local':
                 if timestamp_type == 'local':
@@ -530,9 +550,9 @@ class APRSUtils:
                     # air", so hopefully this shouldn't be a problem in reality.
                     logger.info("Local time specified in timestamp, assuming UTC.")
 
-                # Sometimes, 000000 is used to indicate no timestamp is available
+                # Sometimes, 000000 is used to indicate no timestamp is available (which has already
+                # been logged by decode_timestamp)
                 if timestamp[0:6] == "000000":
-                    logger.warning("Timestamp specified but is set to all zeroes.")
                     return None, timestamp_type
 
                 # DDHHMM
@@ -552,7 +572,7 @@ class APRSUtils:
                         tzinfo=UTC
                     )
                 except ValueError as e:
-                    logger.warning("Error parsing timestamp '{}': {}".format(timestamp, e))
+                    logger.warning("Error parsing timestamp '%s': %s", timestamp, e)
                     raise ParseError("Error parsing timestamp '{}': {}".format(timestamp, e))
 
                 # Check it's not in the future
@@ -586,7 +606,8 @@ class APRSUtils:
                         )
 
                 # Convert to seconds
-                logger.debug("Timestamp is {}".format(ts.strftime("%Y%m%d%H%M%S")))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Timestamp is %s", ts.strftime("%Y%m%d%H%M%S"))
 
             return ts, timestamp_type
 
@@ -658,28 +679,28 @@ class APRSUtils:
         # Decode the power value
         # To get this, we square the value
         power = int(phg[0])**2
-        logger.debug(f"Power is {power} watts")
+        logger.debug("Power is %s watts", power)
 
         # Decode the height value
         # To get this, we raise 2 to the power of the ASCII value of the character, minus 48, then
         # times it by 10
         height = (2 ** (ord(phg[1])-48)) * 10
-        logger.debug(f"Height is {height} feet")
+        logger.debug("Height is %s feet", height)
 
         # Decode the gain value
         # The gain is just the digit, in dB
         gain = int(phg[2])
-        logger.debug(f"Gain is {gain}dB")
+        logger.debug("Gain is %sdB", gain)
 
         # Decode the directivity
         # The directivity is 360 divided by 8, times the directivity value
         # A value of 0 implies an omnidirectional antenna
         if int(phg[3]) == 0:
             directivity = None
-            logger.debug(f"Directivity is omnidirectional")
+            logger.debug("Directivity is omnidirectional")
         else:
             directivity = int((360/8) * int(phg[3]))
-            logger.debug(f"Directivity is {directivity} degrees")
+            logger.debug("Directivity is %s degrees", directivity)
 
         return (power, height, gain, directivity)
 
@@ -707,7 +728,7 @@ class APRSUtils:
             ))
         else:
             p = int(math.sqrt(power))
-            logger.debug(f"Encoded power {power} is {p}")
+            logger.debug("Encoded power %s is %s", power, p)
 
         # Antenna height must be a value that is 2 raised to the power of the ASCII value higher
         # than or equal to '0' minus 48, then multiplied by 10
@@ -776,28 +797,28 @@ class APRSUtils:
         # Decode the strength value
         # This just the digit, in dB
         strength = int(dfs[0])
-        logger.debug(f"Strength is S{strength}")
+        logger.debug("Strength is S%s", strength)
 
         # Decode the height value
         # To get this, we raise 2 to the power of the ASCII value of the character, minus 48, then
         # times it by 10
         height = (2 ** (ord(dfs[1])-48)) * 10
-        logger.debug(f"Height is {height} feet")
+        logger.debug("Height is %s feet", height)
 
         # Decode the gain value
         # The gain is just the digit, in dB
         gain = int(dfs[2])
-        logger.debug(f"Gain is {gain}dB")
+        logger.debug("Gain is %sdB", gain)
 
         # Decode the directivity
         # The directivity is 360 divided by 8, times the directivity value
         # A value of 0 implies an omnidirectional antenna
         if int(dfs[3]) == 0:
             directivity = None
-            logger.debug(f"Directivity is omnidirectional")
+            logger.debug("Directivity is omnidirectional")
         else:
             directivity = (360/8) * int(dfs[3])
-            logger.debug(f"Directivity is {directivity} degrees")
+            logger.debug("Directivity is %s degrees", directivity)
 
         return (strength, height, gain, directivity)
 
@@ -901,14 +922,14 @@ class APRSUtils:
         else:
             if nrq[0] == "9":
                 number = "manual"
-                logger.debug(f"NRQ value is manually reported")
+                logger.debug("NRQ value is manually reported")
             else:
                 number = (100/8) * int(nrq[0])
-                logger.debug(f"Number of hits is {number}%")
+                logger.debug("Number of hits is %s%%", number)
 
             # The range is 2 to the power of the range value
             rng = 2 ** int(nrq[1])
-            logger.debug(f"Range is {rng} miles")
+            logger.debug("Range is %s miles", rng)
 
             # The quality is in degrees. 9 through 3 double the value each time, starting at 1.
             # 2 and 1 are 120 and 240 respectively. 0 implies a useless quality level.
@@ -922,7 +943,7 @@ class APRSUtils:
                 quality = None
 
             if quality:
-                logger.debug(f"Bearing accuracy is < {quality} degrees")
+                logger.debug("Bearing accuracy is < %s degrees", quality)
             else:
                 logger.debug("Bearing accuracy is useless")
 
@@ -0,0 +1,389 @@
+#!/usr/bin/env python
+
+import logging
+
+from collections import namedtuple
+from functools import lru_cache
+from typing import Iterable, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import base91
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Named tuple to hold a batch of decoded compressed positions. Each field is an array, where index
+# ``i`` holds the value for the information field at ``index[i]``
+CompressedPositionArrays = namedtuple('CompressedPositionArrays', [
+    'index', 'valid', 'symbol_table', 'symbol_id', 'latitude', 'longitude', 'altitude', 'course',
+    'speed', 'radio_range', 'compression_type'
+])
+
+# Named tuple to hold a batch of decoded uncompressed positions, in the same way as
+# CompressedPositionArrays
+UncompressedPositionArrays = namedtuple('UncompressedPositionArrays', [
+    'index', 'valid', 'symbol_table', 'symbol_id', 'latitude', 'longitude', 'ambiguity'
+])
+
+# Characters which can be used as the symbol table in a compressed position (APRS 1.01 C9 P38)
+_COMPRESSED_SYMBOL_TABLES = b"/\\ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghij"
+
+# The offset of the position data from the start of the information field, by data type ID. The
+# '/' and '@' data types have a 7-character timestamp before the position
+_POSITION_OFFSETS = {
+    ord("!"): 1,
+    ord("="): 1,
+    ord("/"): 8,
+    ord("@"): 8,
+}
+
+# The smallest value of c * 91 + s in a compressed altitude, when both c and s are NUL
+_ALTITUDE_MIN = -33 * 91 - 33
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("The 'numpy' package is required for aprspy.vector")
+
+
+@lru_cache(maxsize=None)
+def _offsets():
+    """
+    Build the lookup table for the offset of the position data, indexed by data type ID.
+    """
+    offsets = np.zeros(256, dtype=np.int64)
+    for (data_type_id, offset) in _POSITION_OFFSETS.items():
+        offsets[data_type_id] = offset
+
+    return offsets
+
+
+@lru_cache(maxsize=None)
+def _tables() -> Tuple:
+    """
+    Build the lookup tables for the altitude, speed and radio range, indexed by byte value.
+
+    These are calculated with Python floats, rather than NumPy, so that the values are identical to
+    those from :meth:`aprspy.packets.position.PositionPacket._parse_compressed_position`.
+    """
+    positions = np.zeros(256, dtype=bool)
+    positions[np.frombuffer(_COMPRESSED_SYMBOL_TABLES, dtype=np.uint8)] = True
+
+    altitudes = np.array([
+        round(1.002 ** n, 2) for n in range(_ALTITUDE_MIN, 222 * 91 + 222 + 1)
+    ])
+    speeds = np.array([round((1.08 ** (b - 33)) - 1, 1) for b in range(256)])
+    radio_ranges = np.array([round(2 * (1.08 ** (b - 33)), 2) for b in range(256)])
+
+    return (positions, altitudes, speeds, radio_ranges)
+
+
+@lru_cache(maxsize=None)
+def _minutes():
+    """
+    Build the lookup table for the fraction of a degree, indexed by hundredths of a minute.
+
+    As with :func:`_tables`, these are calculated with Python floats so that the values are
+    identical to those from :func:`aprspy.utils.APRSUtils.decode_uncompressed_latitude` and
+    :func:`aprspy.utils.APRSUtils.decode_uncompressed_longitude`.
+    """
+    return np.array([round((n / 100) / 60, 6) for n in range(10000)])
+
+
+def _lines(fields: Union[bytes, bytearray, memoryview, Iterable[Union[str, bytes]]]) -> Tuple:
+    """
+    Convert the information fields into a byte array, along with the start and end of each one.
+    """
+    if isinstance(fields, (bytes, bytearray, memoryview)):
+        data = fields
+    else:
+        data = b"\n".join(f.encode() if isinstance(f, str) else f for f in fields)
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buffer == 10)
+
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(buffer)]))
+
+    return (buffer, starts, ends)
+
+
+def _positions(fields: Union[bytes, bytearray, memoryview, Iterable[Union[str, bytes]]],
+               length: int) -> Tuple:
+    """
+    Find the position data in each information field with a position data type ID, and which is
+    long enough to hold ``length`` bytes of position data.
+
+    This returns the byte array, and the index of each of those information fields along with the
+    position of its position data in the byte array.
+    """
+    (buffer, starts, ends) = _lines(fields)
+
+    if not len(buffer):
+        return (buffer, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+    # Empty information fields at the end of the buffer start beyond its last byte, but are then
+    # excluded by their length
+    data_type_ids = buffer[np.minimum(starts, len(buffer) - 1)]
+    offset = _offsets()[data_type_ids]
+
+    index = np.flatnonzero((offset > 0) & (ends - starts >= offset + length))
+
+    return (buffer, index, starts[index] + offset[index])
+
+
+def _columns(buffer, positions, width: int):
+    """
+    Gather ``width`` bytes from each of the given positions in the buffer, as a 2D array.
+    """
+    return buffer[positions[:, np.newaxis] + np.arange(width)]
+
+
+def _fixed(columns, width: int):
+    """
+    Convert fixed-width columns to a 2D array of bytes, ``width`` bytes wide.
+    """
+    if isinstance(columns, np.ndarray):
+        columns = columns.astype(np.uint8, copy=False)
+    elif isinstance(columns, (bytes, bytearray, memoryview)):
+        columns = np.frombuffer(columns, dtype=np.uint8)
+    else:
+        columns = np.frombuffer(
+            b"".join(c.encode() if isinstance(c, str) else c for c in columns), dtype=np.uint8
+        )
+
+    if columns.ndim == 1:
+        if len(columns) % width:
+            raise ValueError("Columns must be a multiple of {} bytes ({} given)".format(
+                width, len(columns)
+            ))
+
+        columns = columns.reshape(-1, width)
+
+    if columns.shape[1] != width:
+        raise ValueError("Columns must be {} bytes wide ({} given)".format(
+            width, columns.shape[1]
+        ))
+
+    return columns
+
+
+def _digits(columns) -> Tuple:
+    """
+    Convert the bytes in each column to digits, returning the digits (with any non-digits as 0),
+    and whether each is a digit or a space.
+    """
+    digits = columns.astype(np.int64) - ord("0")
+    is_digit = (digits >= 0) & (digits <= 9)
+
+    return (np.where(is_digit, digits, 0), is_digit, columns == ord(" "))
+
+
+def decode_compressed(fields: Union[bytes, bytearray, memoryview, Iterable[Union[str, bytes]]]
+                      ) -> CompressedPositionArrays:
+    """
+    Decode the compressed positions in a batch of information fields.
+
+    :param iterable fields: an iterable of information fields (each a str or bytes), or a bytes
+        buffer of newline-separated information fields
+
+    The information fields are those of position packets without a timestamp (``!`` and ``=``) or
+    with one (``/`` and ``@``), including the data type ID. Those which contain a compressed
+    position (see APRS 1.01 C9 P38) are picked out, and the rest are ignored. The latitude,
+    longitude, altitude, course, speed and radio range are then calculated with NumPy, giving the
+    same values as :class:`aprspy.packets.position.PositionPacket`.
+
+    This returns a :class:`CompressedPositionArrays`, where ``index`` holds the index of each
+    compressed position's information field. The ``symbol_table`` and ``symbol_id`` are byte
+    values, and ``compression_type`` is the value of the compression type byte minus 33. Values
+    which aren't present (for example, the course of a position with an altitude) are NaN.
+
+    ``valid`` is ``False`` for any position which the packet parser would fail to parse, in which
+    case the latitude, longitude, altitude, course, speed and radio range are all NaN.
+    """
+    _require_numpy()
+
+    (positions, altitudes, speeds, radio_ranges) = _tables()
+
+    # Find the information fields which are long enough to hold a compressed position, and which
+    # have a position data type ID
+    (buffer, index, position) = _positions(fields, 13)
+
+    # Of those, the compressed positions start with a valid symbol table (an uncompressed
+    # position starts with a digit or a space)
+    compressed = positions[buffer[position]]
+
+    index = index[compressed]
+    blocks = _columns(buffer, position[compressed], 13)
+
+    # Decode the latitude and longitude, each of which are 4 base-91 digits
+    digits = blocks[:, 1:9].astype(np.int64) - 33
+    valid = ((digits >= 0) & (digits <= 90)).all(axis=1)
+
+    powers = np.array([91 ** 3, 91 ** 2, 91, 1], dtype=np.int64)
+    latitude = np.round(90 - (digits[:, 0:4] @ powers) / base91.LATITUDE_SCALE, 6)
+    longitude = np.round(-180 + (digits[:, 4:8] @ powers) / base91.LONGITUDE_SCALE, 6)
+
+    valid &= (latitude >= -90) & (latitude <= 90) & (longitude >= -180) & (longitude <= 180)
+
+    # Determine whether each position has an altitude, course and speed, or radio range, in the
+    # same order as the packet parser
+    c = blocks[:, 10].astype(np.int64) - 33
+    s = blocks[:, 11].astype(np.int64) - 33
+    t = blocks[:, 12].astype(np.int64) - 33
+
+    blank = blocks[:, 10] == ord(" ")
+    has_altitude = ~blank & (((t >> 3) & 3) == 2)
+    has_course = ~blank & ~has_altitude & (c >= 0) & (c <= 89)
+    has_range = ~blank & ~has_altitude & ~has_course & (blocks[:, 10] == ord("{"))
+
+    valid &= blank | has_altitude | has_course | has_range
+
+    nan = np.full(len(index), np.nan)
+
+    altitude = np.where(has_altitude & valid, altitudes[c * 91 + s - _ALTITUDE_MIN], nan)
+    course = np.where(has_course & valid, c * 4, nan)
+    speed = np.where(has_course & valid, speeds[blocks[:, 11]], nan)
+    radio_range = np.where(has_range & valid, radio_ranges[blocks[:, 11]], nan)
+
+    latitude[~valid] = np.nan
+    longitude[~valid] = np.nan
+
+    return CompressedPositionArrays(
+        index, valid, blocks[:, 0], blocks[:, 9], latitude, longitude, altitude, course, speed,
+        radio_range, t.astype(np.int16)
+    )
+
+
+def decode_uncompressed_latitude(columns) -> Tuple:
+    """
+    Decode a batch of uncompressed latitudes.
+
+    :param columns: the latitudes, each in the form ``DDMM.HHC``, as an ``(n, 8)`` array of bytes,
+        a bytes buffer of ``n * 8`` bytes, or an iterable of 8-byte strs or bytes
+
+    This returns a tuple of arrays of the latitudes, the ambiguity of each and whether each is
+    valid, with the same values as :func:`aprspy.utils.APRSUtils.decode_uncompressed_latitude`.
+    The latitude of any which aren't valid is NaN, and the ambiguity is 0.
+    """
+    _require_numpy()
+
+    columns = _fixed(columns, 8)
+    (digits, is_digit, is_space) = _digits(columns)
+
+    # Ambiguous latitudes have spaces in place of the minutes and hundredths (APRS 1.01 C6 P24)
+    minute_columns = [2, 3, 5, 6]
+    valid = (
+        is_digit[:, 0:2].all(axis=1) &
+        (is_digit | is_space)[:, minute_columns].all(axis=1) &
+        (columns[:, 4] == ord(".")) &
+        ((columns[:, 7] == ord("N")) | (columns[:, 7] == ord("S")))
+    )
+
+    degrees = digits[:, 0] * 10 + digits[:, 1]
+    valid &= degrees <= 90
+
+    hundredths = digits[:, 2] * 1000 + digits[:, 3] * 100 + digits[:, 5] * 10 + digits[:, 6]
+    latitude = degrees + _minutes()[hundredths]
+    latitude = np.where(columns[:, 7] == ord("S"), -latitude, latitude)
+
+    ambiguity = np.where(valid, is_space[:, minute_columns].sum(axis=1), 0).astype(np.int8)
+    latitude[~valid] = np.nan
+
+    return (latitude, ambiguity, valid)
+
+
+def decode_uncompressed_longitude(columns, ambiguity=0) -> Tuple:
+    """
+    Decode a batch of uncompressed longitudes.
+
+    :param columns: the longitudes, each in the form ``DDDMM.HHC``, as an ``(n, 9)`` array of
+        bytes, a bytes buffer of ``n * 9`` bytes, or an iterable of 9-byte strs or bytes
+    :param ambiguity: the level of ambiguity to apply, either as an int or an array with one for
+        each longitude (such as the one from :func:`decode_uncompressed_latitude`)
+
+    This returns a tuple of arrays of the longitudes and whether each is valid, with the same values
+    as :func:`aprspy.utils.APRSUtils.decode_uncompressed_longitude`. The longitude of any which
+    aren't valid (including those with an ambiguity level which isn't between 0 and 4) is NaN.
+    """
+    _require_numpy()
+
+    columns = _fixed(columns, 9)
+    (digits, is_digit, is_space) = _digits(columns)
+    ambiguity = np.broadcast_to(np.asarray(ambiguity, dtype=np.int64), (len(columns),))
+
+    valid = (
+        ((columns[:, 0] == ord("0")) | (columns[:, 0] == ord("1"))) &
+        is_digit[:, 1:3].all(axis=1) &
+        (is_digit | is_space)[:, [3, 4, 6, 7]].all(axis=1) &
+        (columns[:, 5] == ord(".")) &
+        ((columns[:, 8] == ord("E")) | (columns[:, 8] == ord("W"))) &
+        (ambiguity >= 0) & (ambiguity <= 4)
+    )
+
+    degrees = digits[:, 0] * 100 + digits[:, 1] * 10 + digits[:, 2]
+    valid &= degrees <= 180
+
+    # The ambiguity replaces the last digits of the minutes and hundredths with zeroes
+    hundredths = digits[:, 3] * 1000 + digits[:, 4] * 100 + digits[:, 6] * 10 + digits[:, 7]
+    hundredths -= hundredths % (10 ** np.clip(ambiguity, 0, 4))
+
+    longitude = degrees + _minutes()[hundredths]
+    longitude = np.where(columns[:, 8] == ord("W"), -longitude, longitude)
+    longitude[~valid] = np.nan
+
+    return (longitude, valid)
+
+
+def decode_uncompressed(fields: Union[bytes, bytearray, memoryview, Iterable[Union[str, bytes]]]
+                        ) -> UncompressedPositionArrays:
+    """
+    Decode the uncompressed positions in a batch of information fields.
+
+    :param iterable fields: an iterable of information fields (each a str or bytes), or a bytes
+        buffer of newline-separated information fields
+
+    As with :func:`decode_compressed`, the information fields with an uncompressed position (see
+    APRS 1.01 C6 P23) are picked out, and the latitude, longitude and ambiguity are decoded, giving
+    the same values as :class:`aprspy.packets.position.PositionPacket`. As with the packet parser,
+    the ambiguity isn't applied to the longitude.
+
+    This returns a :class:`UncompressedPositionArrays`, where ``valid`` is ``False`` for any
+    position which the packet parser would fail to parse, in which case the latitude and longitude
+    are NaN. Only the position is checked, and not any data extensions or comment which follow it.
+    """
+    _require_numpy()
+
+    # Find the information fields which are long enough to hold an uncompressed position (including
+    # the symbol ID), and which have a position data type ID
+    (buffer, index, position) = _positions(fields, 19)
+    blocks = _columns(buffer, position, 19)
+
+    # Pick out those which look like an uncompressed position, as the packet parser does
+    (_, is_digit, is_space) = _digits(blocks)
+    numeric = is_digit | is_space
+    uncompressed = (
+        numeric[:, [0, 1, 2, 3, 5, 6, 9, 10, 11, 12, 13, 15, 16]].all(axis=1) &
+        (blocks[:, 4] == ord(".")) &
+        (blocks[:, 14] == ord(".")) &
+        ((blocks[:, 7] == ord("N")) | (blocks[:, 7] == ord("S"))) &
+        ((blocks[:, 17] == ord("E")) | (blocks[:, 17] == ord("W")))
+    )
+
+    index = index[uncompressed]
+    blocks = blocks[uncompressed]
+
+    (latitude, ambiguity, lat_valid) = decode_uncompressed_latitude(blocks[:, 0:8])
+    (longitude, lng_valid) = decode_uncompressed_longitude(blocks[:, 9:18])
+
+    valid = lat_valid & lng_valid
+    latitude[~valid] = np.nan
+    longitude[~valid] = np.nan
+
+    return UncompressedPositionArrays(
+        index, valid, blocks[:, 8], blocks[:, 18], latitude, longitude, ambiguity
+    )
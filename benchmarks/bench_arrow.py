@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""
+Benchmark exporting parsed packets to Parquet with :mod:`aprspy.arrow`, compared with JSON.
+
+Run from the top-level directory with ``python -m benchmarks.bench_arrow``.
+"""
+
+import tempfile
+import time
+import tracemalloc
+
+from pathlib import Path
+
+from aprspy import APRS
+from aprspy.arrow import ParquetSink
+
+COUNT = 50000
+
+raw = [
+    'XX1XX-{}>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet',
+    'XX1XX-{}>APRS,TCPIP*,qAC,T2TEST:T#005,199,000,255,073,123,01101001',
+    'XX1XX-{}>APRS,TCPIP*,qAC,TEST::YY9YY-9  :This is a test message{{001',
+]
+
+
+def main():
+    packets = list(APRS.parse_many(raw[n % len(raw)].format(n % 16) for n in range(COUNT)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        with open(Path(directory) / "packets.json", "w") as f:
+            for packet in packets:
+                f.write(packet.to_json())
+                f.write("\n")
+        elapsed = time.perf_counter() - start
+
+        print("{:>8}: {:.0f}k packets/s".format("json", COUNT / elapsed / 1000))
+
+        for row_group_size in (1024, 16384):
+            tracemalloc.start()
+            start = time.perf_counter()
+
+            with ParquetSink(Path(directory) / str(row_group_size),
+                             row_group_size=row_group_size) as sink:
+                sink.write_many(packets)
+
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            print("{:>8}: {:.0f}k packets/s, peak {:.1f}MB (row groups of {})".format(
+                "parquet", COUNT / elapsed / 1000, peak / 1e6, row_group_size
+            ))
+
+
+if __name__ == "__main__":
+    main()
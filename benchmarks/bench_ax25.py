@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Benchmark parsing packets from KISS frames directly against converting each frame to TNC2 format
+and parsing that.
+
+Run from the top-level directory with ``python -m benchmarks.bench_ax25``.
+"""
+
+import timeit
+
+from aprspy import APRS
+from aprspy.ax25 import KISSDecoder, decode_kiss, parse
+
+FRAMES = [
+    # XX1XX-9>APRS,XX2XX-10*,WIDE1-1*,WIDE2-1:=5030.50N/10020.30W$221/000/A=005000Test packet
+    bytes.fromhex(
+        "c00082a0a4a6404060b0b062b0b04072b0b064b0b040f4ae92888a6240e2ae92888a64406303f03d353033302e"
+        "35304e2f31303032302e333057243232312f3030302f413d30303530303054657374207061636b6574c0"
+    ),
+    # XX1XX>T2SP0W,WIDE2-2:`(_fn"Oj/"4T}Mic-E
+    bytes.fromhex(
+        "c000a864a6a060ae60b0b062b0b04060ae92888a64406503f060285f666e224f6a2f2234547d4d69632d45c0"
+    ),
+]
+
+NUMBER = 10000
+
+
+def tnc2(frame):
+    frame = decode_kiss(frame)
+
+    return "{}>{},{}:{}".format(
+        frame.source, frame.destination, frame.path, frame.info.decode("utf-8")
+    )
+
+
+def text():
+    for frame in FRAMES:
+        APRS.parse(tnc2(frame))
+
+
+def direct():
+    for frame in FRAMES:
+        parse(frame)
+
+
+def stream(data):
+    decoder = KISSDecoder()
+
+    for i in range(0, len(data), 256):
+        for frame in decoder.feed(data[i:i + 256]):
+            parse(frame)
+
+
+def main():
+    total = NUMBER * len(FRAMES)
+
+    for name, func in (("via TNC2", text), ("direct", direct)):
+        elapsed = min(timeit.repeat(func, number=NUMBER, repeat=3))
+        print("{:>10}: {:.3f}s for {} packets ({:.0f} packets/s)".format(
+            name, elapsed, total, total / elapsed
+        ))
+
+    data = b"".join(FRAMES) * NUMBER
+    elapsed = min(timeit.repeat(lambda: stream(data), number=1, repeat=3))
+    print("{:>10}: {:.3f}s for {} packets ({:.0f} packets/s)".format(
+        "stream", elapsed, total, total / elapsed
+    ))
+
+
+if __name__ == "__main__":
+    main()
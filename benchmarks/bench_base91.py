@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""
+Benchmark decoding compressed position blocks with :mod:`aprspy.base91`.
+
+Run from the top-level directory with ``python -m benchmarks.bench_base91``.
+"""
+
+import random
+import time
+
+from aprspy import base91
+from aprspy.utils import APRSUtils
+
+COUNT = 100000
+
+
+def blocks():
+    for _ in range(COUNT):
+        lat = base91.encode_latitude(random.uniform(-90, 90))
+        lng = base91.encode_longitude(random.uniform(-180, 180))
+
+        yield "/{}{}>7P[".format(lat, lng)
+
+
+def utils(blocks):
+    for block in blocks:
+        APRSUtils.decode_compressed_latitude(block[1:5])
+        APRSUtils.decode_compressed_longitude(block[5:9])
+        (ord(block[10]) - 33, ord(block[11]) - 33, ord(block[12]) - 33)
+
+
+def block(blocks):
+    for block in blocks:
+        base91.decode_block(block)
+
+
+def main():
+    data = list(blocks())
+
+    for (name, decode) in (("utils", utils), ("block", block), ("blocks", base91.decode_blocks)):
+        elapsed = min(timed(decode, data) for _ in range(3))
+
+        print("{:>8}: {:.0f}ns/block".format(name, elapsed / COUNT * 1e9))
+
+
+def timed(decode, data):
+    start = time.perf_counter()
+    decode(data)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+"""
+Benchmark parsing packets given as bytes against decoding them first and parsing the strings.
+
+Run from the top-level directory with ``python -m benchmarks.bench_bytes``.
+"""
+
+import timeit
+
+from aprspy import APRS
+
+PACKETS = [
+    b'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet',
+    b'XX1XX-9>T2SP0W,WIDE1-1,WIDE2-1,qAR,XX2XX-10:`(_fn"Oj/"4T}Mic-E comment',
+    b'XX1XX>APRS,TCPIP*,qAC,T2TEST:>Test status message',
+    b'XX1XX>APRS,TCPIP*,qAC,T2TEST::XX2XX    :Hello there{001',
+    b'XX1XX>APRS,TCPIP*,qAC,T2TEST:T#005,199,000,255,073,123,01101001',
+]
+
+NUMBER = 10000
+
+
+def decoded(lazy):
+    for packet in PACKETS:
+        APRS.parse(packet.decode("utf-8"), lazy=lazy)
+
+
+def raw(lazy):
+    for packet in PACKETS:
+        APRS.parse(packet, lazy=lazy)
+
+
+def main():
+    total = NUMBER * len(PACKETS)
+
+    for lazy in (False, True):
+        for name, func in (("decoded", decoded), ("bytes", raw)):
+            elapsed = min(timeit.repeat(lambda: func(lazy), number=NUMBER, repeat=3))
+            print("{:>16}: {:.3f}s for {} packets ({:.0f} packets/s)".format(
+                "{}{}".format(name, " (lazy)" if lazy else ""), elapsed, total, total / elapsed
+            ))
+
+
+if __name__ == "__main__":
+    main()
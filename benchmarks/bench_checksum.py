@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+Benchmark the checksum types used when parsing packets.
+
+Run from the top-level directory with ``python -m benchmarks.bench_checksum``.
+"""
+
+import timeit
+
+from aprspy import APRS
+from aprspy.checksum import Checksum, get_function
+from aprspy.exceptions import ParseError, UnsupportedError
+
+SOURCE = "XX1XX"
+INFO = "=5030.50N/10020.30W$221/000/A=005000Test packet"
+
+PACKETS = [
+    'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet',
+    'XX1XX-9>T2SP0W,WIDE1-1,WIDE2-1,qAR,XX2XX-10:`(_fn"Oj/"4T}Mic-E comment',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:>Test status message',
+] * 2000
+
+
+def main():
+    for checksum in Checksum:
+        try:
+            function = get_function(checksum)
+        except ImportError:
+            print("{:>8}: not available".format(checksum.value))
+            continue
+
+        if function is not None:
+            n = 100000
+            elapsed = min(timeit.repeat(lambda: function(SOURCE, INFO), number=n, repeat=5))
+            per_checksum = "{:.0f}ns/checksum".format(elapsed / n * 1e9)
+        else:
+            per_checksum = "-"
+
+        elapsed = min(timeit.repeat(
+            lambda: list(APRS.parse_many(PACKETS, checksum=checksum, lazy=True)), number=1, repeat=5
+        ))
+
+        print("{:>8}: {:>16}, {:.0f} packets/s (lazy parse)".format(
+            checksum.value, per_checksum, len(PACKETS) / elapsed
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Benchmark parsing paths with shared (interned) hops against creating new hops for each path,
+finding the q construct of paths by splitting them into hops against scanning the string, and
+counting packets per station using stations as dictionary keys against using their string forms.
+
+Run from the top-level directory with ``python -m benchmarks.bench_components``.
+"""
+
+import timeit
+
+from aprspy import APRS
+from aprspy.components import Path, PathHop, Station, QConstruct
+
+PATHS = [
+    "TCPIP*,qAC,T2TEST",
+    "XX2XX-10*,WIDE1-1*,WIDE2-1,qAR,XX3XX-1",
+    "WIDE1-1,WIDE2-2,qAR,XX4XX",
+    "TCPIP*,qAS,XX5XX",
+]
+
+PACKET = 'XX1XX>APRS,XX2XX-10*,WIDE1-1*,WIDE2-1,qAR,XX3XX-1:>Test status'
+
+NUMBER = 10000
+
+
+def uncached():
+    for path in PATHS:
+        Path([PathHop(hop) for hop in path.split(",")])
+
+
+def interned():
+    for path in PATHS:
+        Path(path).hops
+
+
+def from_hops():
+    for path in PATHS:
+        for hop in Path(path).hops:
+            if type(hop.hop) is QConstruct:
+                break
+
+
+def scanned():
+    for path in PATHS:
+        Path(path).q_construct
+
+
+# Stations as they come from parsed paths, which are shared (see Station.intern)
+STATIONS = [Station.intern("XX{}XX-{}".format(i % 1000, i % 16)) for i in range(10000)]
+
+
+def by_string():
+    counts = {}
+
+    for station in STATIONS:
+        key = str(station)
+        counts[key] = counts.get(key, 0) + 1
+
+
+def by_station():
+    counts = {}
+
+    for station in STATIONS:
+        counts[station] = counts.get(station, 0) + 1
+
+
+def main():
+    total = NUMBER * len(PATHS)
+
+    for name, func in (("uncached", uncached), ("interned", interned), ("from hops", from_hops),
+                       ("scanned", scanned)):
+        elapsed = min(timeit.repeat(func, number=NUMBER, repeat=3))
+        print("{:>10}: {:.3f}s for {} paths ({:.0f} paths/s)".format(
+            name, elapsed, total, total / elapsed
+        ))
+
+    for name, func in (("by string", by_string), ("by station", by_station)):
+        elapsed = min(timeit.repeat(func, number=100, repeat=3))
+        total = 100 * len(STATIONS)
+        print("{:>10}: {:.3f}s for {} stations ({:.0f} stations/s)".format(
+            name, elapsed, total, total / elapsed
+        ))
+
+    elapsed = min(timeit.repeat(lambda: APRS.parse(PACKET), number=NUMBER, repeat=3))
+    print("{:>10}: {:.3f}s for {} packets ({:.0f} packets/s)".format(
+        "parse", elapsed, NUMBER, NUMBER / elapsed
+    ))
+
+
+if __name__ == "__main__":
+    main()
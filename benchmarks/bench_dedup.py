@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+"""
+Benchmark :class:`aprspy.dedup.DuplicateFilter` at a sustained packet rate.
+
+Run from the top-level directory with ``python -m benchmarks.bench_dedup``.
+"""
+
+import random
+import time
+
+from aprspy.dedup import DuplicateFilter
+
+# Simulate a feed of 1,000 packets/s for 10 minutes, where a third of packets are duplicates
+RATE = 1000
+COUNT = RATE * 600
+
+
+def feed():
+    checksums = [random.getrandbits(64) for _ in range(COUNT)]
+
+    for n in range(COUNT):
+        if n > 10 and n % 3 == 0:
+            # A duplicate of a recent packet
+            yield (n / RATE, checksums[n - random.randint(1, 10)])
+        else:
+            yield (n / RATE, checksums[n])
+
+
+def main():
+    packets = list(feed())
+    dupes = DuplicateFilter(window=30)
+
+    start = time.perf_counter()
+    duplicates = sum(dupes.is_duplicate(checksum, now=now) for (now, checksum) in packets)
+    elapsed = time.perf_counter() - start
+
+    print("{} packets, {} duplicates: {:.0f}ns/packet, {} checksums held".format(
+        COUNT, duplicates, elapsed / COUNT * 1e9, len(dupes)
+    ))
+
+
+if __name__ == "__main__":
+    main()
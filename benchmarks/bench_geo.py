@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Benchmark updating a grid index of station positions, and finding the stations within a radius or
+bounding box, against checking every station.
+
+Run from the top-level directory with ``python -m benchmarks.bench_geo``.
+"""
+
+import random
+import timeit
+
+from aprspy.geo import GridIndex, distance
+
+STATIONS = 100000
+QUERIES = 200
+
+rng = random.Random(1)
+
+# Stations clustered around a number of cities, as they are in practice
+CITIES = [(rng.uniform(-60, 70), rng.uniform(-180, 180)) for _ in range(200)]
+POSITIONS = [
+    (
+        "XX{}XX".format(n),
+        max(-90, min(90, city[0] + rng.gauss(0, 1))),
+        (city[1] + rng.gauss(0, 1) + 180) % 360 - 180
+    )
+    for (n, city) in enumerate(rng.choice(CITIES) for _ in range(STATIONS))
+]
+
+CENTRES = [rng.choice(CITIES) for _ in range(QUERIES)]
+
+
+def brute_force(latitude, longitude, radius):
+    return [
+        key for (key, lat, lng) in POSITIONS if distance(latitude, longitude, lat, lng) <= radius
+    ]
+
+
+def main():
+    index = GridIndex()
+
+    elapsed = min(timeit.repeat(
+        lambda: [index.update(*position) for position in POSITIONS], number=1, repeat=3
+    ))
+    print("{:>16}: {:.3f}s for {} updates ({:.0f} updates/s)".format(
+        "update", elapsed, STATIONS, STATIONS / elapsed
+    ))
+
+    # Move each station a short distance, as most updates do
+    moves = [(key, lat, (lng + 180.01) % 360 - 180) for (key, lat, lng) in POSITIONS]
+    elapsed = min(timeit.repeat(
+        lambda: [index.update(*position) for position in moves], number=1, repeat=3
+    ))
+    print("{:>16}: {:.3f}s for {} updates ({:.0f} updates/s)".format(
+        "move", elapsed, STATIONS, STATIONS / elapsed
+    ))
+
+    for radius in (25, 100, 500):
+        found = sum(len(index.within_radius(lat, lng, radius)) for (lat, lng) in CENTRES)
+        elapsed = min(timeit.repeat(
+            lambda: [index.within_radius(lat, lng, radius) for (lat, lng) in CENTRES],
+            number=1, repeat=3
+        ))
+        print("{:>16}: {:.2f}ms per query ({:.0f} stations found on average)".format(
+            "radius {} km".format(radius), elapsed / QUERIES * 1000, found / QUERIES
+        ))
+
+    for size in (1, 10, 90):
+        elapsed = min(timeit.repeat(
+            lambda: [index.within_bbox(lat - size / 2, lng - size, lat + size / 2, lng + size)
+                     for (lat, lng) in CENTRES],
+            number=1, repeat=3
+        ))
+        print("{:>16}: {:.2f}ms per query".format(
+            "bbox {} deg".format(size), elapsed / QUERIES * 1000
+        ))
+
+    elapsed = min(timeit.repeat(
+        lambda: [brute_force(lat, lng, 100) for (lat, lng) in CENTRES[0:5]], number=1, repeat=3
+    ))
+    print("{:>16}: {:.2f}ms per query".format("brute force", elapsed / 5 * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Benchmark reading APRS-IS archives with :mod:`aprspy.io`, and the memory used while doing so.
+
+Run from the top-level directory with ``python -m benchmarks.bench_io``.
+"""
+
+import gzip
+import tempfile
+import time
+import tracemalloc
+
+from pathlib import Path
+
+from aprspy import io
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COUNT = 500000
+
+
+def archive() -> bytes:
+    lines = []
+    for n in range(COUNT):
+        lines.append(
+            "{:.3f} XX1XX-{}>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test "
+            "packet\n".format(1570713845 + n / 1000, n % 16)
+        )
+
+    return "".join(lines).encode()
+
+
+def main():
+    data = archive()
+
+    with tempfile.TemporaryDirectory() as directory:
+        files = [("plain (mmap)", Path(directory) / "aprs.log", data, True),
+                 ("plain", Path(directory) / "aprs.log", data, False),
+                 ("gzip", Path(directory) / "aprs.log.gz", gzip.compress(data, 6), True)]
+
+        if zstandard is not None:
+            files.append(("zstd", Path(directory) / "aprs.log.zst",
+                          zstandard.ZstdCompressor().compress(data), True))
+
+        print("{} lines, {:.1f}MB".format(COUNT, len(data) / 1e6))
+
+        for (name, path, contents, use_mmap) in files:
+            path.write_bytes(contents)
+
+            start = time.perf_counter()
+            for _ in io.read(path, use_mmap=use_mmap):
+                pass
+            elapsed = time.perf_counter() - start
+
+            # Measure the memory separately, since tracing slows everything down
+            tracemalloc.start()
+            for _ in io.read(path, use_mmap=use_mmap):
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            print("{:>14}: {:.0f}k lines/s, peak {:.1f}MB".format(
+                name, COUNT / elapsed / 1000, peak / 1e6
+            ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+Benchmark serializing packets with :func:`aprspy.packets.generic.GenericPacket.to_json`, with and
+without ``orjson``.
+
+Run from the top-level directory with ``python -m benchmarks.bench_json``.
+"""
+
+import time
+
+from aprspy import APRS
+from aprspy.packets import generic
+
+COUNT = 20000
+
+raw = [
+    'XX1XX-{}>APRS,TCPIP*,qAC,FOURTH:@092345z5030.50N/10020.30W$221/000/A=005000Test packet',
+    'XX1XX-{}>APRS,TCPIP*,qAC,FOURTH:=/5L!!<*e7>7P[Test packet',
+    'XX1XX-{}>APRS,TCPIP*,qAC,T2TEST:T#005,199,000,255,073,123,01101001',
+    'XX1XX-{}>APRS,TCPIP*,qAC,TEST::YY9YY-9  :This is a test message{{001',
+]
+
+
+def main():
+    packets = list(APRS.parse_many(raw[n % len(raw)].format(n % 16) for n in range(COUNT)))
+
+    orjson = getattr(generic, "orjson", None)
+
+    for name in ("json", "orjson"):
+        if name == "orjson":
+            if orjson is None:
+                continue
+            generic.orjson = orjson
+        elif orjson is not None:
+            generic.orjson = None
+
+        elapsed = min(timed(packets) for _ in range(3))
+        print("{:>8}: {:.1f}us/packet".format(name, elapsed / COUNT * 1e6))
+
+
+def timed(packets):
+    start = time.perf_counter()
+    for packet in packets:
+        packet.to_json()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
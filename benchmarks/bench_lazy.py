@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+"""
+Benchmark lazy parsing against eager parsing, for a consumer which only reads the header fields.
+
+Run from the top-level directory with ``python -m benchmarks.bench_lazy``.
+"""
+
+import time
+
+from aprspy import APRS
+
+PACKETS = [
+    'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet',
+    'XX1XX-9>T2SP0W,WIDE1-1,WIDE2-1,qAR,XX2XX-10:`(_fn"Oj/"4T}Mic-E comment',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:>Test status message',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST::XX2XX    :Hello there{001',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:@092345z/5L!!<*e7>7P[Compressed',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:T#005,199,000,255,073,123,01101001',
+] * 5000
+
+
+def route(lazy: bool) -> dict:
+    """
+    Count packets by source and data type ID.
+    """
+    counts = {}
+    for packet in APRS.parse_many(PACKETS, lazy=lazy, on_error=lambda failure: None):
+        key = (packet.source, packet.data_type_id)
+        counts[key] = counts.get(key, 0) + 1
+
+    return counts
+
+
+def main():
+    for name, lazy in (("eager", False), ("lazy", True)):
+        start = time.perf_counter()
+        route(lazy)
+        elapsed = time.perf_counter() - start
+        print("{:>6}: {:.3f}s for {} packets ({:.0f} packets/s)".format(
+            name, elapsed, len(PACKETS), len(PACKETS) / elapsed
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""
+Benchmark parsing with debug logging disabled and enabled.
+
+Run from the top-level directory with ``python -m benchmarks.bench_logging``.
+"""
+
+import os
+import logging
+import time
+
+from aprspy import APRS
+
+PACKETS = [
+    'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet',
+    'XX1XX-9>T2SP0W,WIDE1-1,WIDE2-1,qAR,XX2XX-10:`(_fn"Oj/"4T}Mic-E comment',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:>Test status message',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST::XX2XX    :Hello there{001',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:@092345z/5L!!<*e7>7P[Compressed',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:T#005,199,000,255,073,123,01101001',
+] * 2000
+
+
+def run() -> float:
+    start = time.perf_counter()
+    for _ in APRS.parse_many(PACKETS, on_error=lambda failure: None):
+        pass
+
+    return time.perf_counter() - start
+
+
+def main():
+    logger = logging.getLogger("aprspy")
+
+    # Send log records somewhere, so that enabled records are actually formatted
+    with open(os.devnull, "w") as devnull:
+        handler = logging.StreamHandler(devnull)
+        logger.addHandler(handler)
+        logger.propagate = False
+
+        for name, level in (("disabled", logging.WARNING), ("enabled", logging.DEBUG)):
+            logger.setLevel(level)
+            elapsed = run()
+            print("{:>8}: {:.3f}s for {} packets ({:.0f} packets/s)".format(
+                name, elapsed, len(PACKETS), len(PACKETS) / elapsed
+            ))
+
+        logger.removeHandler(handler)
+
+
+if __name__ == "__main__":
+    main()
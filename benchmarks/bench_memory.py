@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""
+Benchmark the memory used by parsed packets which are kept in memory.
+
+Run from the top-level directory with ``python -m benchmarks.bench_memory``.
+"""
+
+import gc
+import tracemalloc
+
+from aprspy import APRS
+
+COUNT = 10000
+
+PACKETS = {
+    "position": 'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet',
+    "mic-e": 'XX1XX-9>T2SP0W,WIDE1-1,WIDE2-1,qAR,XX2XX-10:`(_fn"Oj/"4T}Mic-E comment',
+    "status": 'XX1XX>APRS,TCPIP*,qAC,T2TEST:>Test status message',
+    "message": 'XX1XX>APRS,TCPIP*,qAC,T2TEST::XX2XX    :Hello there{001',
+    "telemetry": 'XX1XX>APRS,TCPIP*,qAC,T2TEST:T#005,199,000,255,073,123,01101001',
+}
+
+
+def measure(packet: str) -> float:
+    """
+    Return the average number of bytes allocated for each parsed packet which is kept.
+    """
+    # Parse once first, so that any caches are populated before measuring
+    APRS.parse(packet)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    packets = [APRS.parse(packet) for _ in range(COUNT)]
+
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Keep the packets alive until after measuring
+    del packets
+
+    return (after - before) / COUNT
+
+
+def main():
+    for name, packet in PACKETS.items():
+        print("{:>10}: {:.0f} bytes/packet".format(name, measure(packet)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""
+Benchmark decoding Mic-E destination fields, with and without the cache.
+
+Run from the top-level directory with ``python -m benchmarks.bench_mice``.
+"""
+
+import random
+import time
+
+from aprspy.packets.mice import MICEPacket
+
+# Simulate a feed from 500 trackers, each of which sends the same destination each time
+TRACKERS = 500
+COUNT = 100000
+
+
+def destination():
+    return (
+        random.choice("012345") + random.choice("0123456789") +
+        "".join(random.choice("0123456789ABCDEFGHIJPQRSTUVWXY") for _ in range(4))
+    )
+
+
+def main():
+    trackers = [destination() for _ in range(TRACKERS)]
+    feed = [random.choice(trackers) for _ in range(COUNT)]
+
+    uncached = MICEPacket._decode_destination.__wrapped__
+
+    for (name, decode) in (("uncached", lambda d: uncached(d[0:6])),
+                           ("cached", MICEPacket._decode_latitude)):
+        elapsed = min(timed(decode, feed) for _ in range(3))
+
+        print("{:>8}: {:.0f}ns/destination".format(name, elapsed / COUNT * 1e9))
+
+
+def timed(decode, feed):
+    start = time.perf_counter()
+    for d in feed:
+        decode(d)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
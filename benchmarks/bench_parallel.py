@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""
+Benchmark :func:`aprspy.parallel.parse_parallel` with different numbers of worker processes.
+
+Run from the top-level directory with ``python -m benchmarks.bench_parallel``. Scaling is limited by
+the number of CPUs available.
+"""
+
+import os
+import time
+
+from aprspy import APRS
+from aprspy.parallel import parse_parallel
+
+PACKETS = [
+    'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet',
+    'XX1XX-9>T2SP0W,WIDE1-1,WIDE2-1,qAR,XX2XX-10:`(_fn"Oj/"4T}Mic-E comment',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:>Test status message',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST::XX2XX    :Hello there{001',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:@092345z/5L!!<*e7>7P[Compressed',
+] * 20000
+
+CHUNK_SIZE = 2000
+
+
+def main():
+    print("{} CPUs available".format(os.cpu_count()))
+
+    start = time.perf_counter()
+    list(APRS.parse_many(PACKETS))
+    baseline = time.perf_counter() - start
+    print("{:>12}: {:.3f}s ({:.0f} packets/s)".format(
+        "parse_many", baseline, len(PACKETS) / baseline
+    ))
+
+    for workers in (1, 2, 4, 8):
+        start = time.perf_counter()
+        count = sum(1 for _ in parse_parallel(PACKETS, workers=workers, chunk_size=CHUNK_SIZE))
+        elapsed = time.perf_counter() - start
+        assert count == len(PACKETS)
+        print("{:>2} worker(s): {:.3f}s ({:.0f} packets/s, {:.2f}x)".format(
+            workers, elapsed, len(PACKETS) / elapsed, baseline / elapsed
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+Benchmark :func:`aprspy.APRS.parse_many` against calling :func:`aprspy.APRS.parse` for each packet.
+
+Run from the top-level directory with ``python -m benchmarks.bench_parse_many``.
+"""
+
+import time
+
+from aprspy import APRS
+from aprspy.exceptions import ParseError, UnsupportedError
+
+PACKETS = [
+    'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet',
+    'XX1XX-9>T2SP0W,WIDE1-1,WIDE2-1,qAR,XX2XX-10:`(_fn"Oj/"4T}Mic-E comment',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:>Test status message',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST::XX2XX    :Hello there{001',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:@092345z/5L!!<*e7>7P[Compressed',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:_10090556c220s004g005t077',
+] * 5000
+
+
+def one_at_a_time():
+    packets = []
+    for packet in PACKETS:
+        try:
+            packets.append(APRS.parse(packet))
+        except (ParseError, UnsupportedError):
+            pass
+
+    return packets
+
+
+def batch():
+    return list(APRS.parse_many(PACKETS, on_error=lambda failure: None))
+
+
+def main():
+    for name, func in (("parse", one_at_a_time), ("parse_many", batch)):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print("{:>10}: {:.3f}s for {} packets ({:.0f} packets/s)".format(
+            name, elapsed, len(PACKETS), len(PACKETS) / elapsed
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Benchmark updating and looking up stations in a station store, the memory used per station, and
+saving and loading snapshots.
+
+Run from the top-level directory with ``python -m benchmarks.bench_store``.
+"""
+
+import os
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+from aprspy import APRS
+from aprspy.store import StationStore
+
+STATIONS = 100000
+
+PACKETS = [
+    APRS.parse('X{}X>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test'.format(i))
+    for i in range(20000)
+] + [
+    APRS.parse('X{}X>APRS,TCPIP*,qAC,FOURTH:>Test status'.format(i)) for i in range(STATIONS)
+]
+
+
+def update(store):
+    now = time.time()
+
+    for packet in PACKETS:
+        store.update(packet, now)
+
+
+def main():
+    for (name, kwargs) in (("no limits", {}), ("ttl", {"ttl": 3600}),
+                           ("max", {"max_stations": STATIONS // 2})):
+        elapsed = min(timeit.repeat(lambda: update(StationStore(**kwargs)), number=1, repeat=3))
+        print("{:>10}: {:.3f}s for {} updates ({:.0f} updates/s)".format(
+            name, elapsed, len(PACKETS), len(PACKETS) / elapsed
+        ))
+
+    store = StationStore()
+    update(store)
+
+    keys = [record.station for record in store]
+    elapsed = min(timeit.repeat(lambda: [store.get(key) for key in keys], number=1, repeat=3))
+    print("{:>10}: {:.3f}s for {} lookups ({:.0f} lookups/s)".format(
+        "lookup", elapsed, len(keys), len(keys) / elapsed
+    ))
+
+    tracemalloc.start()
+    store = StationStore()
+    update(store)
+    (current, _) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("{:>10}: {:.0f} bytes per station".format("memory", current / len(store)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "stations.pickle")
+
+        elapsed = min(timeit.repeat(lambda: store.save(path), number=1, repeat=3))
+        print("{:>10}: {:.3f}s for {} stations ({} bytes)".format(
+            "save", elapsed, len(store), os.path.getsize(path)
+        ))
+
+        elapsed = min(timeit.repeat(lambda: StationStore.load(path), number=1, repeat=3))
+        print("{:>10}: {:.3f}s for {} stations".format("load", elapsed, len(store)))
+
+
+if __name__ == "__main__":
+    main()
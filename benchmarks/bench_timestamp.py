@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+Benchmark :func:`aprspy.utils.APRSUtils.decode_timestamp` on a simulated feed.
+
+Run from the top-level directory with ``python -m benchmarks.bench_timestamp``.
+"""
+
+import random
+import time
+
+from datetime import datetime, timedelta, UTC
+
+from aprspy.utils import APRSUtils
+
+# Simulate 10 minutes of a feed at 1,000 packets/s, with timestamps up to 2 minutes old
+RATE = 1000
+COUNT = RATE * 600
+
+
+def feed():
+    start = datetime(2019, 10, 10, 12, 0, tzinfo=UTC)
+
+    for n in range(COUNT):
+        reference = start + timedelta(seconds=n / RATE)
+        ts = reference - timedelta(seconds=random.randint(0, 120))
+
+        if n % 4 == 0:
+            raw = ts.strftime("%H%M%Sh")
+        else:
+            raw = ts.strftime("%d%H%Mz")
+
+        yield (raw, reference)
+
+
+def main():
+    timestamps = list(feed())
+
+    for (name, decode) in (("uncached", APRSUtils._decode_timestamp),
+                           ("cached", APRSUtils.decode_timestamp)):
+        start = time.perf_counter()
+        for (raw, reference) in timestamps:
+            decode(raw, reference)
+        elapsed = time.perf_counter() - start
+
+        print("{:>8}: {:.0f}ns/timestamp".format(name, elapsed / COUNT * 1e9))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Benchmark the packet header tokenizer against the inline regexes previously used by
+:func:`aprspy.APRS.parse`.
+
+Run from the top-level directory with ``python -m benchmarks.bench_tokenizer``.
+"""
+
+import re
+import timeit
+
+from aprspy.tokenizer import Raw, tokenize, is_valid_destination
+
+PACKETS = [
+    'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet',
+    'XX1XX-9>T2SP0W,WIDE1-1,WIDE2-1,qAR,XX2XX-10:`(_fn"Oj/"4T}Mic-E comment',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:>Test status message',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST::XX2XX    :Hello there{001',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:T#005,199,000,255,073,123,01101001',
+]
+
+NUMBER = 100000
+
+
+def legacy(packet):
+    (source, destination, path, data_type_id, info) = re.match(
+        r'([\w\d\-]+)>([\w\d\-]+),([\w\d\-\*\,]+):(.)(.*)',
+        packet
+    ).groups()
+    re.match(r'^[A-Z0-9]{1,6}(\-[0-9]{1,2})?$', destination)
+    Raw(source=source, destination=destination, path=path, information=info)
+
+
+def current(packet):
+    (raw, data_type_id) = tokenize(packet)
+    is_valid_destination(raw.destination)
+
+
+def main():
+    for name, func in (("legacy", legacy), ("tokenizer", current)):
+        elapsed = timeit.timeit(
+            lambda: [func(packet) for packet in PACKETS], number=NUMBER
+        )
+        total = NUMBER * len(PACKETS)
+        print("{:>10}: {:.3f}s for {} packets ({:.0f} packets/s)".format(
+            name, elapsed, total, total / elapsed
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Benchmark decoding compressed and uncompressed positions with :mod:`aprspy.vector`, compared with
+the packet parser.
+
+Run from the top-level directory with ``python -m benchmarks.bench_vector``.
+"""
+
+import random
+import time
+
+from aprspy import base91, vector
+from aprspy.packets.position import PositionPacket
+from aprspy.utils import APRSUtils
+
+COUNT = 200000
+
+
+def compressed():
+    for _ in range(COUNT):
+        lat = base91.encode_latitude(random.uniform(-90, 90))
+        lng = base91.encode_longitude(random.uniform(-180, 180))
+        cst = random.choice(["7P[", "{?!", "S]S", "  !"])
+
+        yield "={}{}{}>{}Test".format(random.choice("/\\"), lat, lng, cst)
+
+
+def uncompressed():
+    for _ in range(COUNT):
+        lat = APRSUtils.encode_uncompressed_latitude(random.uniform(-90, 90), random.randint(0, 4))
+        lng = APRSUtils.encode_uncompressed_longitude(random.uniform(-180, 180))
+
+        yield "={}/{}-Test".format(lat, lng)
+
+
+def scalar_compressed(data):
+    for field in data:
+        PositionPacket._parse_compressed_position(field[1:14])
+
+
+def scalar_uncompressed(data):
+    for field in data:
+        PositionPacket._parse_uncompressed_position(field[1:20])
+
+
+def main():
+    for (kind, fields, scalar, decode) in (
+        ("compressed", compressed, scalar_compressed, vector.decode_compressed),
+        ("uncompressed", uncompressed, scalar_uncompressed, vector.decode_uncompressed)
+    ):
+        data = list(fields())
+        buffer = "\n".join(data).encode()
+
+        # Build the lookup tables before timing
+        decode(data[:1])
+
+        print("{}:".format(kind))
+
+        for (name, function, arg) in (("scalar", scalar, data), ("list", decode, data),
+                                      ("buffer", decode, buffer)):
+            elapsed = min(timed(function, arg) for _ in range(3))
+
+            print("{:>8}: {:.0f}ns/position".format(name, elapsed / COUNT * 1e9))
+
+
+def timed(decode, arg):
+    start = time.perf_counter()
+    decode(arg)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+import asyncio
+import mock
+import pytest
+
+from aprspy import APRS, ParseFailure
+from aprspy.aio import APRSISClient
+from aprspy.packets.position import PositionPacket
+
+raw = [
+    'XX1XX-{}>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet'.format(n)
+    for n in range(1, 6)
+]
+
+
+class FakeServer:
+    """
+    A minimal APRS-IS server, which records the lines sent by the client and replies with a banner,
+    a login response and the given lines.
+    """
+
+    def __init__(self, lines, close=False):
+        self.lines = lines
+        self.close = close
+        self.received = []
+        self.sent = asyncio.Event()
+        self.server = None
+
+    async def handle(self, reader, writer):
+        writer.write(b"# aprsc 2.1.10-gd72a17c\r\n")
+        await writer.drain()
+
+        login = await reader.readline()
+        self.received.append(login.decode().rstrip("\r\n"))
+
+        writer.write(b"# logresp XX1XX verified, server T2TEST\r\n")
+
+        for line in self.lines:
+            writer.write(line.encode() + b"\r\n")
+            await writer.drain()
+
+        self.sent.set()
+
+        if self.close:
+            writer.close()
+            return
+
+        # Read anything else the client sends until it disconnects
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+
+            self.received.append(line.decode().rstrip("\r\n"))
+
+        writer.close()
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+def run(lines, coro, close=False):
+    async def main():
+        server = FakeServer(lines, close=close)
+        port = await server.start()
+
+        try:
+            return (server, await coro(server, port))
+        finally:
+            await server.stop()
+
+    return asyncio.run(main())
+
+
+def test_client_login():
+    client = APRSISClient("XX1XX", filter="r/50/-100/50")
+
+    assert client.passcode == "17122"
+    assert client.login == "user XX1XX pass 17122 vers aprspy {} filter r/50/-100/50".format(
+        client.version
+    )
+
+    client = APRSISClient("XX1XX", passcode="-1")
+    assert client.login == "user XX1XX pass -1 vers aprspy {}".format(client.version)
+
+
+def test_client_iterate():
+    async def consume(server, port):
+        packets = []
+
+        async with APRSISClient("XX1XX", host="127.0.0.1", port=port,
+                                filter="r/50/-100/50") as client:
+            async for packet in client:
+                packets.append(packet)
+                if len(packets) == len(raw):
+                    break
+
+            assert client.verified is True
+
+        return packets
+
+    (server, packets) = run(raw, consume)
+
+    assert server.received[0].startswith("user XX1XX pass 17122 vers aprspy")
+    assert [p.source for p in packets] == ["XX1XX-{}".format(n) for n in range(1, 6)]
+    assert all(type(p) is PositionPacket for p in packets)
+    assert packets[0].latitude == 50.508333
+    assert packets[0]._ts is not None
+
+
+def test_client_parse_failure():
+    lines = ['XX1XXAPRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$', raw[0]]
+
+    async def consume(server, port):
+        async with APRSISClient("XX1XX", host="127.0.0.1", port=port) as client:
+            return [await client.__anext__(), await client.__anext__()]
+
+    (server, packets) = run(lines, consume)
+
+    assert type(packets[0]) is ParseFailure
+    assert packets[0].packet == lines[0]
+    assert packets[1].source == "XX1XX-1"
+
+
+def test_client_send_filter():
+    async def consume(server, port):
+        async with APRSISClient("XX1XX", host="127.0.0.1", port=port) as client:
+            await client.send_filter("b/XX1XX*")
+            await client.__anext__()
+
+            # Give the server a chance to read the filter command
+            for _ in range(100):
+                if len(server.received) > 1:
+                    break
+                await asyncio.sleep(0.01)
+
+            return client.filter
+
+    (server, result) = run(raw[:1], consume)
+
+    assert result == "b/XX1XX*"
+    assert server.received[1] == "#filter b/XX1XX*"
+
+
+def test_client_backpressure():
+    async def consume(server, port):
+        async with APRSISClient("XX1XX", host="127.0.0.1", port=port, queue_size=2) as client:
+            await server.sent.wait()
+            await asyncio.sleep(0.05)
+
+            # The queue should never hold more than its maximum size
+            assert client._queue.qsize() <= 2
+
+            return [p async for p in _take(client, len(raw))]
+
+    (server, packets) = run(raw, consume)
+
+    assert len(packets) == len(raw)
+
+
+def test_client_connection_closed():
+    async def consume(server, port):
+        async with APRSISClient("XX1XX", host="127.0.0.1", port=port) as client:
+            # The server closes the connection after sending, which should end the iteration
+            return [p async for p in client]
+
+    (server, packets) = run(raw[:2], consume, close=True)
+
+    assert [p.source for p in packets] == ["XX1XX-1", "XX1XX-2"]
+
+
+def test_client_reconnect():
+    async def consume(server, port):
+        client = APRSISClient("XX1XX", host="127.0.0.1", port=port)
+        packets = []
+
+        for _ in range(2):
+            await client.connect()
+
+            # Stop reading once the connection has closed, leaving the marker for it on the queue
+            packets.extend([await client.__anext__(), await client.__anext__()])
+
+            for _ in range(100):
+                if client._closed:
+                    break
+                await asyncio.sleep(0.01)
+
+            await client.close()
+
+        return packets
+
+    (server, packets) = run(raw[:2], consume, close=True)
+
+    assert [p.source for p in packets] == ["XX1XX-1", "XX1XX-2"] * 2
+
+
+def _parse_raising(error, line):
+    """
+    Make a replacement for APRS.parse which raises an error for one line.
+    """
+    parse = APRS.parse
+
+    def wrapper(packet, *args, **kwargs):
+        if packet == line.encode():
+            raise error
+
+        return parse(packet, *args, **kwargs)
+
+    return wrapper
+
+
+def test_client_parse_value_error():
+    async def consume(server, port):
+        async with APRSISClient("XX1XX", host="127.0.0.1", port=port) as client:
+            return [p async for p in client]
+
+    # A ValueError while parsing one line is a failure for that line, rather than the connection
+    with mock.patch("aprspy.aio.APRS.parse", _parse_raising(ValueError("Invalid"), raw[0])):
+        (server, packets) = run(raw[:2], consume, close=True)
+
+    assert type(packets[0]) is ParseFailure
+    assert type(packets[0].error) is ValueError
+    assert packets[1].source == "XX1XX-2"
+
+
+def test_client_unexpected_error():
+    async def consume(server, port):
+        packets = []
+
+        async with APRSISClient("XX1XX", host="127.0.0.1", port=port) as client:
+            with pytest.raises(RuntimeError):
+                async for packet in client:
+                    packets.append(packet)
+
+            # The iteration ends after the error
+            assert [p async for p in client] == []
+
+        return packets
+
+    with mock.patch("aprspy.aio.APRS.parse", _parse_raising(RuntimeError("Bug"), raw[1])):
+        (server, packets) = run(raw[:3], consume)
+
+    assert [p.source for p in packets] == ["XX1XX-1"]
+
+
+def test_client_line_too_long_with_full_queue():
+    async def consume(server, port):
+        async with APRSISClient("XX1XX", host="127.0.0.1", port=port, queue_size=2) as client:
+            await server.sent.wait()
+
+            # Wait for the client to fill the queue and then fail on the overlong line
+            for _ in range(100):
+                if client._closed:
+                    break
+                await asyncio.sleep(0.01)
+
+            # The packets already queued are kept, and then the error is raised
+            packets = [await client.__anext__(), await client.__anext__()]
+
+            with pytest.raises(ValueError):
+                await client.__anext__()
+
+            return packets
+
+    (server, packets) = run(raw[:2] + ["X" * 100000], consume)
+
+    assert [p.source for p in packets] == ["XX1XX-1", "XX1XX-2"]
+
+
+async def _take(client, count):
+    n = 0
+    async for packet in client:
+        yield packet
+        n += 1
+        if n == count:
+            return
@@ -1,6 +1,8 @@
 import pytest
 
-from aprspy import APRS, GenericPacket
+from datetime import datetime, UTC
+
+from aprspy import APRS, GenericPacket, ParseFailure
 from aprspy.utils import APRSUtils
 from aprspy.exceptions import ParseError
 from aprspy.components import Station, Path
@@ -405,3 +407,194 @@ def test_decode_invalid_nrq():
         assert True
     except Exception:
         assert False
+
+
+def test_parse_many():
+    raw = [
+        'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet\n',
+        'XX1XXAPRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet\n',
+        'XX1XX>APRS,TCPIP*,qAC,FOURTH:>Test status\r\n',
+    ]
+
+    packets = list(APRS.parse_many(raw))
+
+    assert len(packets) == 3
+    assert packets[0].latitude == 50.508333
+    assert packets[0].comment == "Test packet"
+
+    # Packets that can't be parsed are returned as failures
+    assert type(packets[1]) is ParseFailure
+    assert packets[1].packet == raw[1].rstrip()
+    assert type(packets[1].error) is ParseError
+
+    assert packets[2].status_message == "Test status"
+
+
+def test_parse_many_on_error():
+    raw = [
+        'XX1XXAPRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet',
+        'XX1XX>APRS,TCPIP*,qAC,FOURTH:>Test status',
+    ]
+    failures = []
+
+    packets = list(APRS.parse_many(raw, on_error=failures.append))
+
+    assert len(packets) == 1
+    assert len(failures) == 1
+    assert failures[0].packet == raw[0]
+
+
+def test_parse_many_with_timestamps():
+    arrived = datetime(2019, 10, 10, 12, 0, tzinfo=UTC)
+    raw = [
+        ('XX1XX>APRS,TCPIP*,qAC,FOURTH:@302345z5030.50N/10020.30W$', arrived),
+        'XX1XX>APRS,TCPIP*,qAC,FOURTH:@092345z5030.50N/10020.30W$',
+    ]
+
+    packets = list(APRS.parse_many(raw, timestamp=datetime(2019, 1, 10, 12, 0)))
+
+    # The arrival timestamp is used as the reference time, so the packet is from last month
+    assert packets[0]._ts == arrived
+    assert packets[0].timestamp == datetime(2019, 9, 30, 23, 45, tzinfo=UTC)
+
+    assert packets[1].timestamp == datetime(2019, 1, 9, 23, 45, tzinfo=UTC)
+
+
+def test_parse_bytes():
+    raw = 'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Café'
+
+    packet = APRS.parse(raw.encode())
+
+    assert packet.source == "XX1XX"
+    assert packet.latitude == 50.508333
+    assert packet.comment == "Café"
+    assert packet.to_json() == APRS.parse(raw).to_json()
+
+    packet = APRS.parse(memoryview(raw.encode()))
+
+    assert packet.to_json() == APRS.parse(raw).to_json()
+
+
+def test_parse_bytes_latin1():
+    raw = 'XX1XX>APRS,TCPIP*,qAC,FOURTH:>Café'
+
+    packet = APRS.parse(raw.encode("latin-1"))
+
+    # Anything which isn't valid UTF-8 is decoded as Latin-1
+    assert packet.status_message == "Café"
+    assert packet.checksum == APRS.parse(raw).checksum
+
+
+@pytest.mark.parametrize("checksum", ["md5", "blake2b", "hash"])
+def test_parse_bytes_checksum(checksum):
+    raw = 'XX1XX>APRS,TCPIP*,qAC,FOURTH:>Café'
+
+    assert APRS.parse(raw.encode(), checksum=checksum).checksum == \
+        APRS.parse(raw, checksum=checksum).checksum
+
+
+def test_parse_bytes_lazy():
+    raw = b'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet'
+
+    packet = APRS.parse(raw, lazy=True)
+
+    assert packet.source == "XX1XX"
+    assert packet._lazy is True
+    assert packet.latitude == 50.508333
+
+
+def test_parse_bytes_invalid():
+    with pytest.raises(ParseError):
+        APRS.parse(b'XX1XXAPRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$')
+
+    assert type(APRS.parse(b'XX1XX>APRS,TCPIP*,qAC,FOURTH', strict_mode=False)) is GenericPacket
+
+
+def test_parse_many_bytes():
+    raw = [
+        b'XX1XX>APRS,TCPIP*,qAC,FOURTH:>Test status\r\n',
+        memoryview(b'XX1XX>APRS,TCPIP*,qAC,FOURTH:>Test status\n'),
+        b'XX1XXAPRS,TCPIP*,qAC,FOURTH:>Test status\n',
+    ]
+
+    packets = list(APRS.parse_many(raw))
+
+    assert packets[0].status_message == "Test status"
+    assert packets[1].status_message == "Test status"
+    assert type(packets[2]) is ParseFailure
+    assert packets[2].packet == raw[2].rstrip()
+
+
+def test_parse_lazy():
+    raw = 'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet'
+
+    packet = APRS.parse(raw, lazy=True)
+
+    # The header fields are available without decoding the information field
+    assert packet.source == "XX1XX"
+    assert packet.data_type_id == "="
+    assert packet._lazy is True
+
+    # Reading a decoded field decodes the packet
+    assert packet.latitude == 50.508333
+    assert packet._lazy is None
+    assert packet.comment == "Test packet"
+
+    assert packet.to_json() == APRS.parse(raw).to_json()
+
+
+def test_parse_lazy_telemetry_definition():
+    raw = 'XX1XX>APRS,TCPIP*,qAC,T2TEST::XX1XX-123:PARM.Battery,Btemp,ATemp'
+
+    packet = APRS.parse(raw, lazy=True)
+
+    assert packet.a1 == "Battery"
+    assert packet.a3 == "ATemp"
+
+    with pytest.raises(AttributeError):
+        packet.b1
+
+
+def test_parse_lazy_error():
+    raw = 'XX1XX>APRS,TCPIP*,qAC,T2TEST:=ab'
+
+    # The error is raised when a decoded field is first read
+    packet = APRS.parse(raw, lazy=True)
+
+    with pytest.raises(ParseError):
+        packet.latitude
+
+    # Unless strict mode is disabled
+    packet = APRS.parse(raw, strict_mode=False, lazy=True)
+
+    assert packet.comment is None
+
+
+def test_parse_invalid_path():
+    # Invalid paths are rejected when the packet is parsed, even though the path is split later
+    with pytest.raises(ParseError):
+        APRS.parse("XX1XX>APRS,TCPIP*0qAC:>Test status")
+
+    packets = list(APRS.parse_many(["XX1XX>APRS,TCPIP,,qAC:>Test status"]))
+
+    assert type(packets[0]) is ParseFailure
+    assert type(packets[0].error) is ParseError
+
+
+def test_parse_lazy_error_matches_eager():
+    raw = 'XX1XX>APRS,TCPIP*,qAC,T2TEST:=5030.50N/10020.30W'
+
+    # A position packet which can't be decoded has no position, rather than the defaults
+    lazy = APRS.parse(raw, strict_mode=False, lazy=True)
+    eager = APRS.parse(raw, strict_mode=False)
+
+    assert type(eager) is GenericPacket
+    assert lazy.latitude is None
+    assert lazy.longitude is None
+
+    # The fields set when parsing eagerly are the same, and the rest are unset
+    lazy = lazy.to_dict()
+    eager = eager.to_dict()
+
+    assert {key: lazy[key] for key in eager} == eager
+    assert all(lazy[key] is None for key in lazy if key not in eager)
@@ -1,7 +1,7 @@
 import pytest
 import mock
 
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, timezone, UTC
 
 from aprspy.utils import APRSUtils
 from aprspy.exceptions import ParseError
@@ -442,6 +442,66 @@ def test_decode_timestamp_in_previous_year():
         assert timestamp.year == 2018
 
 
+
+def test_decode_timestamp_cached():
+    reference = datetime(2019, 10, 10, 12, 30, 15, tzinfo=UTC)
+
+    first = APRSUtils.decode_timestamp("101229z", reference=reference)
+
+    # The same timestamp later in the same minute returns the cached result
+    assert APRSUtils.decode_timestamp("101229z", reference=reference.replace(second=59)) is first
+    assert first == (datetime(2019, 10, 10, 12, 29, tzinfo=UTC), "zulu")
+
+    # The same timestamp in a later minute is decoded again
+    assert APRSUtils.decode_timestamp("101229z", reference=datetime(2019, 11, 1, tzinfo=UTC)) == \
+        (datetime(2019, 10, 10, 12, 29, tzinfo=UTC), "zulu")
+
+
+def test_decode_timestamp_hms_in_reference_minute():
+    # HMS timestamps within the reference minute depend on the seconds of the reference time
+    timestamp, _ = APRSUtils.decode_timestamp(
+        "123030h", reference=datetime(2019, 10, 10, 12, 30, 45, tzinfo=UTC)
+    )
+    assert timestamp == datetime(2019, 10, 10, 12, 30, 30, tzinfo=UTC)
+
+    timestamp, _ = APRSUtils.decode_timestamp(
+        "123030h", reference=datetime(2019, 10, 10, 12, 30, 15, tzinfo=UTC)
+    )
+    assert timestamp == datetime(2019, 10, 9, 12, 30, 30, tzinfo=UTC)
+
+
+def test_decode_timestamp_non_utc_reference():
+    # Reference times in other timezones are compared in UTC, both for HMS timestamps within the
+    # reference minute and for cached results
+    offset = timezone(timedelta(hours=5))
+
+    timestamp, _ = APRSUtils.decode_timestamp(
+        "123030h", reference=datetime(2019, 10, 10, 17, 30, 45, tzinfo=offset)
+    )
+    assert timestamp == datetime(2019, 10, 10, 12, 30, 30, tzinfo=UTC)
+
+    timestamp, _ = APRSUtils.decode_timestamp(
+        "123030h", reference=datetime(2019, 10, 10, 17, 30, 15, tzinfo=offset)
+    )
+    assert timestamp == datetime(2019, 10, 9, 12, 30, 30, tzinfo=UTC)
+
+    # It's still the 9th in UTC, so the 10th is last month
+    timestamp, _ = APRSUtils.decode_timestamp(
+        "100429z", reference=datetime(2019, 10, 10, 2, 0, tzinfo=offset)
+    )
+    assert timestamp == datetime(2019, 9, 10, 4, 29, tzinfo=UTC)
+
+
+def test_decode_timestamp_invalid_type_cached(caplog):
+    reference = datetime(2019, 10, 10, 12, 30, tzinfo=UTC)
+
+    # The warning for an invalid timestamp type is logged for cached results too
+    for _ in range(2):
+        assert APRSUtils.decode_timestamp("101229x", reference=reference) == \
+            (datetime(2019, 10, 10, 12, 29, tzinfo=UTC), "zulu")
+
+    assert caplog.text.count("x is an invalid timestamp type") == 2
+
 # Passcode tests
 
 def test_generate_passcode():
@@ -0,0 +1,95 @@
+import pytest
+
+from aprspy import APRS, ParseFailure, MICEPacket, PositionPacket
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from aprspy.arrow import ParquetSink, schema  # noqa: E402
+
+packets = [
+    'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet',
+    r'XX1XX-1>U1PRSS-1,WIDE1-1,WIDE2-2,qAR,CALGRY:`*\Fl"Bk/]"?l}Test Mic-E packet',
+    'XX1XX-1>APRS,TCPIP*,qAC,TEST::YY9YY-9  :This is a test message{001',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:>Test status',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:T#005,199,000,255,073,123,01101001',
+    'XX1XX>APRS,TCPIP*,qAC,T2TEST:<IGATE,MSG_CNT=10',
+    'XX1XXAPRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$',
+]
+
+
+def test_schema():
+    (position, getters) = schema(PositionPacket)
+
+    assert position.names[0:5] == ["received", "source", "destination", "path", "data_type_id"]
+    assert "latitude" in position.names
+    assert len(getters) == len(position.names)
+
+    # Subclasses use their base class's schema
+    assert schema(MICEPacket)[0] == position
+
+    with pytest.raises(TypeError):
+        schema(str)
+
+
+def test_write(tmp_path):
+    with ParquetSink(tmp_path) as sink:
+        assert sink.write_many(APRS.parse_many(packets)) == 6
+        assert sink.write(ParseFailure(packet=packets[-1], error=None)) is False
+
+    assert sink.rows == {
+        "PositionPacket": 1, "MICEPacket": 1, "MessagePacket": 1, "StatusPacket": 1,
+        "TelemetryPacket": 1, "StationCapabilityPacket": 1
+    }
+
+    position = pq.read_table(tmp_path / "PositionPacket.parquet").to_pylist()[0]
+    assert position["source"] == "XX1XX"
+    assert position["path"] == "TCPIP*,qAC,FOURTH"
+    assert position["latitude"] == 50.508333
+    assert position["course"] == 221
+    assert position["altitude"] == 5000
+    assert position["comment"] == "Test packet"
+
+    mice = pq.read_table(tmp_path / "MICEPacket.parquet").to_pylist()[0]
+    assert mice["latitude"] == 51.038833
+    assert mice["altitude"] == 1086
+
+    message = pq.read_table(tmp_path / "MessagePacket.parquet").to_pylist()[0]
+    assert (message["addressee"], message["message_id"]) == ("YY9YY-9", "001")
+
+    telemetry = pq.read_table(tmp_path / "TelemetryPacket.parquet").to_pylist()[0]
+    assert [telemetry["av{}".format(n)] for n in range(1, 6)] == [199, 0, 255, 73, 123]
+    assert telemetry["dv"] == 0b01101001
+
+    capabilities = pq.read_table(tmp_path / "StationCapabilityPacket.parquet").to_pylist()[0]
+    assert capabilities["capabilities"] == ["IGATE", "MSG_CNT=10"]
+
+
+def test_row_groups(tmp_path):
+    sink = ParquetSink(tmp_path / "output", row_group_size=4)
+
+    sink.write_many(APRS.parse_many(packets[0:1] * 10))
+
+    # Full row groups are written as they fill, and the rest is held until the sink is closed
+    assert sink.rows == {"PositionPacket": 8}
+    assert len(sink._columns[PositionPacket][0]) == 2
+
+    sink.close()
+
+    metadata = pq.ParquetFile(tmp_path / "output" / "PositionPacket.parquet").metadata
+    assert metadata.num_rows == 10
+    assert [metadata.row_group(n).num_rows for n in range(metadata.num_row_groups)] == [4, 4, 2]
+
+
+def test_invalid_row_group_size(tmp_path):
+    with pytest.raises(ValueError):
+        ParquetSink(tmp_path, row_group_size=0)
+
+
+def test_lazy(tmp_path):
+    with ParquetSink(tmp_path) as sink:
+        sink.write_many(APRS.parse_many(packets[0:1], lazy=True))
+
+    assert pq.read_table(tmp_path / "PositionPacket.parquet").column("latitude").to_pylist() == [
+        50.508333
+    ]
@@ -0,0 +1,210 @@
+import io
+import pytest
+
+from aprspy import APRS, ParseFailure
+from aprspy.ax25 import Frame, KISSDecoder, decode_ax25, decode_kiss, unescape, read_frames, \
+    parse, parse_stream
+from aprspy.components import Station, Path
+from aprspy.exceptions import ParseError
+from aprspy.packets.position import PositionPacket
+from aprspy.packets.status import StatusPacket
+from aprspy.packets.mice import MICEPacket
+
+# Captured KISS frames
+# XX1XX-9>APRS,XX2XX-10,WIDE1-1*,WIDE2-1:=5030.50N/10020.30W$221/000/A=005000Test packet
+position = bytes.fromhex(
+    "c00082a0a4a6404060b0b062b0b04072b0b064b0b040f4ae92888a6240e2ae92888a64406303f03d353033302e35"
+    "304e2f31303032302e333057243232312f3030302f413d30303530303054657374207061636b6574c0"
+)
+
+# XX1XX>APRS:>Test \xc0\xdb status (on port 1, with no path and escaped characters)
+status = bytes.fromhex(
+    "c01082a0a4a6404060b0b062b0b0406103f03e5465737420dbdcdbdd20737461747573c0"
+)
+
+# XX1XX>T2SP0W,WIDE2-2:`(_fn"Oj/"4T}Mic-E
+mice = bytes.fromhex(
+    "c000a864a6a060ae60b0b062b0b04060ae92888a64406503f060285f666e224f6a2f2234547d4d69632d45c0"
+)
+
+
+def test_decode_kiss():
+    frame = decode_kiss(position)
+
+    assert type(frame) is Frame
+    assert type(frame.source) is Station
+    assert str(frame.source) == "XX1XX-9"
+    assert str(frame.destination) == "APRS"
+    assert frame.port == 0
+    assert frame.info == b"=5030.50N/10020.30W$221/000/A=005000Test packet"
+
+    # As in TNC2 format, only the last hop with the H bit set is marked as used
+    assert type(frame.path) is Path
+    assert [str(hop.hop) for hop in frame.path.hops] == ["XX2XX-10", "WIDE1-1", "WIDE2-1"]
+    assert [hop.used for hop in frame.path.hops] == [False, True, False]
+
+
+def test_decode_kiss_escaped():
+    frame = decode_kiss(status)
+
+    assert frame.port == 1
+    assert frame.path.hops == ()
+    assert frame.info == b">Test \xc0\xdb status"
+
+
+def test_decode_kiss_invalid():
+    # Not a data frame
+    with pytest.raises(ParseError):
+        decode_kiss(b"\xc0\x01\x20\xc0")
+
+    with pytest.raises(ParseError):
+        decode_kiss(b"\xc0\xc0")
+
+    # Truncated in the address field
+    with pytest.raises(ParseError):
+        decode_kiss(position[0:20])
+
+
+def test_decode_ax25_not_ui():
+    frame = bytearray(unescape(position[2:-1]))
+
+    # An I frame
+    frame[35] = 0x00
+
+    with pytest.raises(ParseError):
+        decode_ax25(frame)
+
+
+def test_unescape():
+    assert unescape(b"\xdb\xdc\xdb\xdd") == b"\xc0\xdb"
+    assert unescape(b"\xdb\xdd\xdc") == b"\xdb\xdc"
+    assert unescape(b"Test") == b"Test"
+
+
+def test_kiss_decoder():
+    decoder = KISSDecoder()
+    data = position + b"\xc0\x01\x20\xc0" + status + mice
+
+    frames = []
+
+    # Feed the data in small pieces, as it would be received
+    for i in range(0, len(data), 7):
+        frames.extend(decoder.feed(data[i:i + 7]))
+
+    assert [str(frame.source) for frame in frames] == ["XX1XX-9", "XX1XX", "XX1XX"]
+    assert decoder.skipped == 1
+
+
+def test_kiss_decoder_overflow():
+    decoder = KISSDecoder()
+
+    # Noise with no FEND is discarded once there's more than a frame's worth, rather than buffered
+    for _ in range(100):
+        assert decoder.feed(b"\x55" * 100) == []
+        assert len(decoder._buffer) <= decoder.max_frame_size
+
+    assert decoder.skipped == 1
+
+    # The rest of the noise is discarded up to the next FEND, and then decoding carries on
+    frames = decoder.feed(b"\x55" * 10 + position + mice[0:10])
+    frames += decoder.feed(mice[10:])
+
+    assert [str(frame.source) for frame in frames] == ["XX1XX-9", "XX1XX"]
+    assert decoder.skipped == 1
+
+
+def test_kiss_decoder_max_frame_size():
+    decoder = KISSDecoder(max_frame_size=len(status))
+
+    # Frames longer than the maximum are skipped, whether they're received at once or in pieces
+    assert [str(frame.source) for frame in decoder.feed(position + status)] == ["XX1XX"]
+    assert decoder.skipped == 1
+
+    assert decoder.feed(position[0:-1]) == []
+    assert decoder.feed(position[-1:] + status) != []
+    assert decoder.skipped == 2
+
+    with pytest.raises(ValueError):
+        KISSDecoder(max_frame_size=0)
+
+
+def test_read_frames():
+    frames = list(read_frames(io.BytesIO(position + mice), buffer_size=16))
+
+    assert len(frames) == 2
+    assert str(frames[1].destination) == "T2SP0W"
+
+
+class SerialPort(io.RawIOBase):
+    """
+    A stream like a pyserial port, without read1, which only allows what is waiting to be read.
+    """
+    def __init__(self, data):
+        self._data = data
+
+    @property
+    def in_waiting(self):
+        return min(len(self._data), 8)
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        assert 0 < size <= self.in_waiting or size == 1
+        (data, self._data) = (self._data[:size], self._data[size:])
+        return data
+
+
+def test_read_frames_serial():
+    frames = list(read_frames(SerialPort(position + mice)))
+
+    assert len(frames) == 2
+    assert str(frames[0].source) == "XX1XX-9"
+
+
+def test_parse():
+    packet = parse(position)
+
+    assert type(packet) is PositionPacket
+    assert packet.source == "XX1XX-9"
+    assert packet.latitude == 50.508333
+    assert packet.comment == "Test packet"
+
+    # The path is the one decoded from the frame
+    assert packet.path is not None
+    assert packet.path.hops[1].used is True
+    assert packet.raw == "XX1XX-9>APRS:XX2XX-10,WIDE1-1*,WIDE2-1:" \
+        "5030.50N/10020.30W$221/000/A=005000Test packet"
+
+    packet = parse(decode_kiss(status))
+
+    assert type(packet) is StatusPacket
+    assert packet.status_message == "Test \xc0\xdb status"
+
+
+def test_parse_mice():
+    packet = parse(mice)
+
+    assert type(packet) is MICEPacket
+    assert packet.destination == "T2SP0W"
+    assert packet.to_json() == APRS.parse('XX1XX>T2SP0W,WIDE2-2:`(_fn"Oj/"4T}Mic-E').to_json()
+
+
+def test_parse_stream():
+    data = position + mice + bytes.fromhex("c00082a0a4a6404060b0b062b0b0406103f0c0")
+    failures = []
+
+    packets = list(parse_stream(io.BytesIO(data)))
+
+    assert len(packets) == 3
+    assert type(packets[0]) is PositionPacket
+    assert packets[0]._ts is not None
+
+    # A frame with no information field
+    assert type(packets[2]) is ParseFailure
+    assert type(packets[2].packet) is Frame
+
+    packets = list(parse_stream(io.BytesIO(data), on_error=failures.append))
+
+    assert len(packets) == 2
+    assert len(failures) == 1
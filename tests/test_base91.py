@@ -0,0 +1,156 @@
+import math
+import pytest
+
+from aprspy import APRS, base91
+from aprspy.exceptions import ParseError
+from aprspy.utils import APRSUtils
+
+
+def test_decode():
+    assert base91.decode("!!!!") == 0
+    assert base91.decode("{{{{") == 91 ** 4 - 1
+    assert base91.decode("5L!!") == 20 * 91 ** 3 + 43 * 91 ** 2
+    assert base91.decode("!") == 0
+    assert base91.decode("{{") == 91 ** 2 - 1
+
+
+def test_decode_invalid():
+    with pytest.raises(ParseError):
+        base91.decode("5L!|")
+
+    with pytest.raises(ParseError):
+        base91.decode("5 ")
+
+
+def test_encode():
+    assert base91.encode(0) == "!!!!"
+    assert base91.encode(91 ** 4 - 1) == "{{{{"
+    assert base91.encode(90, length=1) == "{"
+
+    for n in (0, 1, 90, 91, 12345, 91 ** 3, 91 ** 4 - 1):
+        assert base91.decode(base91.encode(n)) == n
+
+
+def test_encode_invalid():
+    with pytest.raises(ValueError):
+        base91.encode(-1)
+
+    with pytest.raises(ValueError):
+        base91.encode(91 ** 4)
+
+    with pytest.raises(ValueError):
+        base91.encode(91, length=1)
+
+
+def test_latitude_longitude():
+    assert base91.decode_latitude("5L!!") == 49.5
+    assert base91.decode_longitude("<*e7") == -72.750004
+    assert base91.encode_latitude(49.5) == "5L!!"
+    assert base91.encode_longitude(-72.75) == "<*e7"
+
+
+def test_latitude_longitude_invalid():
+    with pytest.raises(ParseError):
+        base91.decode_latitude("{{{{")
+
+    with pytest.raises(ParseError):
+        base91.decode_longitude("{{{{")
+
+
+def test_decode_block():
+    block = base91.decode_block("/5L!!<*e7>7P[")
+
+    assert block.symbol_table == "/"
+    assert block.latitude == 49.5
+    assert block.longitude == -72.750004
+    assert block.symbol_id == ">"
+    assert (block.c, block.s, block.t) == (22, 47, 58)
+
+    # A blank c byte is decoded as -1
+    assert base91.decode_block("/5L!!<*e7>  [").c == -1
+
+
+def test_decode_block_matches_utils():
+    for block in ("/5L!!<*e7>7P[", "/5L!!<*e7OS]S", "\\H/4.Bq,)x#J1", "/!!!!!!!!>!!!"):
+        decoded = base91.decode_block(block)
+
+        assert decoded.latitude == APRSUtils.decode_compressed_latitude(block[1:5])
+        assert decoded.longitude == APRSUtils.decode_compressed_longitude(block[5:9])
+
+
+def test_decode_block_invalid():
+    with pytest.raises(ParseError):
+        base91.decode_block("/5L!!<*e7>7P")
+
+    with pytest.raises(ParseError):
+        base91.decode_block("/5L! <*e7>7P[")
+
+    with pytest.raises(ParseError):
+        base91.decode_block("/{{{{<*e7>7P[")
+
+
+def test_decode_blocks():
+    blocks = ["/5L!!<*e7>7P[", "\\H/4.Bq,)x#J1", "/5L! <*e7>7P[", "/{{{{<*e7>7P["]
+    decoded = base91.decode_blocks(blocks)
+
+    assert decoded.symbol_table == "/\\//"
+    assert decoded.symbol_id == ">x>>"
+    assert list(decoded.c) == [22, 2, 22, 22]
+    assert list(decoded.s) == [47, 41, 47, 47]
+    assert list(decoded.t) == [58, 16, 58, 58]
+
+    for n in range(2):
+        block = base91.decode_block(blocks[n])
+        assert round(decoded.latitude[n], 6) == block.latitude
+        assert round(decoded.longitude[n], 6) == block.longitude
+
+    # Blocks which can't be decoded have a NaN latitude and longitude
+    for n in range(2, 4):
+        assert math.isnan(decoded.latitude[n])
+        assert math.isnan(decoded.longitude[n])
+
+
+def test_decode_blocks_any_character():
+    # The c, s and T values of any character can be held, rather than failing the whole batch
+    decoded = base91.decode_blocks(["/5L!!<*e7>\U0001f600P[", "/5L!!<*e7>7P["])
+
+    assert list(decoded.c) == [0x1f600 - 33, 22]
+    assert decoded.latitude[1] == 49.5
+
+
+def test_decode_blocks_invalid_length():
+    with pytest.raises(ParseError):
+        base91.decode_blocks(["/5L!!<*e7>7P"])
+
+    with pytest.raises(ParseError):
+        base91.decode_blocks(b"/5L!!<*e7>7P[/5L!!")
+
+
+def test_decode_block_bytes():
+    for block in (b"/5L!!<*e7>7P[", bytearray(b"/5L!!<*e7>7P["), memoryview(b"x/5L!!<*e7>7P[")[1:]):
+        assert base91.decode_block(block) == base91.decode_block("/5L!!<*e7>7P[")
+
+    with pytest.raises(ParseError):
+        base91.decode_block(b"/5L!\xff<*e7>7P[")
+
+
+def test_decode_blocks_bytes():
+    blocks = ["/5L!!<*e7>7P[", "\\H/4.Bq,)x#J1"]
+    expected = base91.decode_blocks(blocks)
+
+    # Blocks can be given one after another in a single buffer, or as separate bytes
+    for data in (
+        "".join(blocks).encode(), memoryview("".join(blocks).encode()),
+        [block.encode() for block in blocks]
+    ):
+        assert base91.decode_blocks(data) == expected
+
+
+def test_decode_outside_digits():
+    # Characters outside '!' to '{' were previously decoded from their ASCII values, but aren't
+    # base-91 digits, so are now rejected
+    with pytest.raises(ParseError):
+        APRSUtils.decode_compressed_latitude("5L!|")
+
+    with pytest.raises(ParseError):
+        APRS.parse("XX1XX>APRS,TCPIP*:=/5L!|<*e7>7P[")
@@ -0,0 +1,76 @@
+import pytest
+
+from aprspy import APRS
+from aprspy.checksum import Checksum, get_default, set_default, get_function
+
+raw = 'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet'
+
+
+@pytest.fixture
+def restore_default():
+    default = get_default()
+    yield
+    set_default(default)
+
+
+def test_md5_default():
+    packet = APRS.parse(raw)
+
+    assert packet.checksum == "5cb62e3adf46abeb6c2e9bc5d479ca7b"
+
+
+def test_none():
+    packet = APRS.parse(raw, checksum=Checksum.NONE)
+
+    assert packet.checksum is None
+
+
+def test_blake2b():
+    packet = APRS.parse(raw, checksum=Checksum.BLAKE2B)
+
+    assert type(packet.checksum) is int
+    assert 0 <= packet.checksum < 2 ** 64
+
+    # The checksum only covers the source and information field
+    other = APRS.parse('XX1XX>APZ001,WIDE1-1:=5030.50N/10020.30W$221/000/A=005000Test packet',
+                       checksum="blake2b")
+
+    assert other.checksum == packet.checksum
+
+
+def test_xxh64():
+    pytest.importorskip("xxhash")
+
+    packet = APRS.parse(raw, checksum=Checksum.XXH64)
+
+    assert type(packet.checksum) is int
+    assert packet.checksum == get_function(Checksum.XXH64)("XX1XX", raw[30:])
+
+
+def test_hash():
+    packet = APRS.parse(raw, checksum=Checksum.HASH)
+
+    assert packet.checksum == hash(("XX1XX", raw[30:]))
+
+
+def test_set_default(restore_default):
+    APRS.set_default_checksum(Checksum.BLAKE2B)
+
+    assert get_default() is Checksum.BLAKE2B
+    assert type(APRS.parse(raw).checksum) is int
+    assert all(type(p.checksum) is int for p in APRS.parse_many([raw, raw]))
+
+    # The default can be overridden per call
+    assert APRS.parse(raw, checksum=Checksum.MD5).checksum == "5cb62e3adf46abeb6c2e9bc5d479ca7b"
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        APRS.parse(raw, checksum="crc32")
+
+
+def test_xxh64_not_installed(monkeypatch):
+    monkeypatch.setattr("aprspy.checksum.xxhash", None)
+
+    with pytest.raises(ImportError):
+        APRS.parse(raw, checksum=Checksum.XXH64)
@@ -1,6 +1,7 @@
 import pytest # noqa
 
-from aprspy.components import Station, Path, PathHop
+from aprspy.components import Station, Path, PathHop, QConstruct
+from aprspy.exceptions import ParseError
 
 
 def test_station_with_ssid():
@@ -135,7 +136,11 @@ def test_path_hop():
     assert str(ph) == "XX1XX-1"
     assert repr(ph) == "<PathHop: XX1XX-1>"
 
-    ph.used = True
+    # Path hops are immutable
+    with pytest.raises(AttributeError):
+        ph.used = True
+
+    ph = PathHop(hop="XX1XX-1", used=True)
 
     assert str(ph.hop) == "XX1XX-1"
     assert ph.used is True
@@ -188,3 +193,135 @@ def test_invalid_path():
         assert True
     except Exception:
         assert False
+
+
+def test_path_pickle():
+    import pickle
+
+    p = pickle.loads(pickle.dumps(Path(path="TCPIP*,qAR,T2TEST")))
+
+    assert str(p) == "TCPIP*,qAR,T2TEST"
+    assert p.hops[0].used is True
+    assert p.hops[2].hop.callsign == "T2TEST"
+
+
+def test_station_intern():
+    s = Station.intern("XX1XX-10")
+
+    assert s.callsign == "XX1XX"
+    assert s.ssid == 10
+
+    # The same station is returned each time
+    assert Station.intern("XX1XX-10") is s
+    assert Station.intern("XX1XX") is not s
+
+    with pytest.raises(ValueError):
+        Station.intern("XX1_X")
+
+
+def test_path_hop_intern():
+    ph = PathHop.intern("WIDE1-1*")
+
+    assert ph.used is True
+    assert str(ph) == "WIDE1-1*"
+    assert PathHop.intern("WIDE1-1*") is ph
+
+    # Used and unused hops are separate, but share the station
+    assert PathHop.intern("WIDE1-1").used is False
+    assert PathHop.intern("WIDE1-1").hop is ph.hop
+
+
+def test_path_shared_hops():
+    p = Path(path="TCPIP*,qAR,T2TEST")
+    q = Path(path="XX1XX*,qAR,T2TEST")
+
+    assert p.hops[1] is q.hops[1]
+    assert p.hops[2] is q.hops[2]
+
+
+def test_station_equality():
+    s = Station(callsign="XX1XX", ssid=10)
+
+    assert s == Station(callsign="XX1XX-10")
+    assert s != Station(callsign="XX1XX")
+    assert s != "XX1XX-10"
+
+    # Stations can be used as dictionary keys
+    counts = {s: 1}
+    counts[Station.intern("XX1XX-10")] += 1
+
+    assert counts == {s: 2}
+
+    with pytest.raises(AttributeError):
+        s.callsign = "XX2XX"
+
+
+def test_station_pickle():
+    import pickle
+
+    s = pickle.loads(pickle.dumps(Station(callsign="XX1XX", ssid="ZZ")))
+
+    assert s == Station(callsign="XX1XX-ZZ")
+    assert hash(s) == hash(Station(callsign="XX1XX-ZZ"))
+
+
+def test_path_equality():
+    p = Path(path="TCPIP*,qAR,T2TEST")
+
+    assert p == Path(path="TCPIP*,qAR,T2TEST")
+    assert p == Path(path=[PathHop("TCPIP", used=True), PathHop("qAR"), PathHop("T2TEST")])
+    assert p != Path(path="TCPIP,qAR,T2TEST")
+    assert len({p, Path(path="TCPIP*,qAR,T2TEST")}) == 1
+
+    assert PathHop("WIDE1-1*") == PathHop(Station("WIDE1", 1), used=True)
+
+    with pytest.raises(AttributeError):
+        p.path = "TCPIP*"
+
+
+def test_path_lazy():
+    p = Path(path="TCPIP*,qAC,T2TEST")
+
+    # The path isn't split until the hops are read
+    assert p._path_hops is None
+    assert p.hop_count == 3
+    assert p._path_hops is None
+
+    assert len(p.hops) == 3
+    assert p.hops[1].hop is QConstruct.qAC
+
+
+@pytest.mark.parametrize("path", [
+    "TCPIP*0qAC", "TCPIP,,qAC", "TCP*P*", "WIDE1-1*,qAQ,T2TEST", "TCPIP*,qAC*", "WIDE1-123", ","
+])
+def test_path_invalid(path):
+    # Paths are checked when they're created, even though they're split later
+    with pytest.raises(ParseError):
+        Path(path=path)
+
+
+@pytest.mark.parametrize("path, q_construct, igate, is_rf", [
+    ("TCPIP*,qAC,T2TEST", QConstruct.qAC, "T2TEST", False),
+    ("XX2XX-10*,WIDE1-1*,WIDE2-1,qAR,XX3XX-1", QConstruct.qAR, "XX3XX-1", True),
+    ("WIDE2-1,qAo,XX3XX", QConstruct.qAo, "XX3XX", True),
+    ("TCPXX*,qAX,T2TEST", QConstruct.qAX, "T2TEST", False),
+    ("TCPIP*,qAR,XX3XX", QConstruct.qAR, "XX3XX", False),
+    ("qAS,T2TEST", QConstruct.qAS, "T2TEST", False),
+    ("WIDE1-1*,WIDE2-1", None, None, True),
+    ("WIDE2-1,qAR", QConstruct.qAR, None, True),
+])
+def test_path_accessors(path, q_construct, igate, is_rf):
+    p = Path(path=path)
+
+    assert p.q_construct is q_construct
+    assert p.igate == igate
+    assert p.is_rf is is_rf
+    assert p.hop_count == len(path.split(","))
+
+
+def test_path_accessors_empty():
+    p = Path(path=None)
+
+    assert p.hop_count == 0
+    assert p.q_construct is None
+    assert p.is_rf is True
@@ -0,0 +1,124 @@
+import pytest
+
+from datetime import datetime, timedelta, UTC
+
+from aprspy import APRS, ParseFailure
+from aprspy.checksum import Checksum
+from aprspy.dedup import DuplicateFilter
+
+raw = 'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet'
+
+# The same packet, received via a different path
+raw_via_rf = 'XX1XX>APRS,WIDE1-1,qAR,XX2XX-10:=5030.50N/10020.30W$221/000/A=005000Test packet'
+
+
+def test_is_duplicate():
+    dupes = DuplicateFilter()
+
+    assert dupes.is_duplicate(APRS.parse(raw), now=0) is False
+    assert dupes.is_duplicate(APRS.parse(raw_via_rf), now=5) is True
+    assert len(dupes) == 1
+    assert APRS.parse(raw) in dupes
+
+
+def test_window():
+    dupes = DuplicateFilter(window=30)
+
+    assert dupes.is_duplicate("a", now=0) is False
+    assert dupes.is_duplicate("b", now=10) is False
+    assert dupes.is_duplicate("a", now=29) is True
+
+    # The window runs from when the packet was first seen
+    assert dupes.is_duplicate("a", now=30) is False
+    assert dupes.is_duplicate("b", now=35) is True
+    assert dupes.is_duplicate("b", now=40) is False
+
+    assert len(dupes) == 2
+
+
+def test_max_size():
+    dupes = DuplicateFilter(max_size=2)
+
+    for (n, key) in enumerate("abc"):
+        assert dupes.is_duplicate(key, now=n) is False
+
+    assert len(dupes) == 2
+    assert "a" not in dupes
+    assert dupes.is_duplicate("a", now=4) is False
+
+
+def test_filter():
+    packets = APRS.parse_many([raw, raw_via_rf, 'XX1XX>APRS,TCPIP*:>Status', 'invalid'])
+
+    packets = list(DuplicateFilter().filter(packets))
+
+    assert len(packets) == 3
+    assert str(packets[0].path) == "TCPIP*,qAC,FOURTH"
+    assert packets[1].status_message == "Status"
+    assert type(packets[2]) is ParseFailure
+
+
+def test_filter_replay():
+    # Replayed packets are compared by their timestamps, rather than the time they're replayed
+    received = datetime(2019, 10, 10, 12, 0, tzinfo=UTC)
+
+    packets = APRS.parse_many([
+        (raw, received),
+        (raw_via_rf, received + timedelta(seconds=10)),
+        (raw, received + timedelta(hours=2)),
+    ])
+
+    packets = list(DuplicateFilter().filter(packets))
+
+    assert len(packets) == 2
+    assert packets[1]._ts == received + timedelta(hours=2)
+
+
+def test_mixed_timestamps():
+    dupes = DuplicateFilter(window=30)
+
+    # Packets with and without timestamps are compared on the same clock
+    old = APRS.parse(raw, timestamp=datetime.now(UTC) - timedelta(seconds=60))
+
+    assert dupes.is_duplicate(old) is False
+    assert dupes.is_duplicate("a") is False
+
+    assert old not in dupes
+    assert len(dupes) == 1
+
+
+def test_out_of_order():
+    dupes = DuplicateFilter(window=30)
+
+    assert dupes.is_duplicate("a", now=0) is False
+    assert dupes.is_duplicate("b", now=100) is False
+
+    # A late packet counts as being seen at the latest time, so the queue stays in order
+    assert dupes.is_duplicate("c", now=10) is False
+    assert [seen for (seen, _) in dupes._queue] == [100, 100]
+
+    assert dupes.is_duplicate("c", now=125) is True
+    assert dupes.is_duplicate("d", now=131) is False
+    assert len(dupes) == 1
+
+
+def test_clear():
+    dupes = DuplicateFilter()
+    dupes.is_duplicate("a")
+    dupes.clear()
+
+    assert len(dupes) == 0
+    assert dupes.is_duplicate("a") is False
+
+
+def test_no_checksum():
+    with pytest.raises(ValueError):
+        DuplicateFilter().is_duplicate(APRS.parse(raw, checksum=Checksum.NONE))
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        DuplicateFilter(window=0)
+
+    with pytest.raises(ValueError):
+        DuplicateFilter(max_size=0)
@@ -0,0 +1,100 @@
+import pytest
+
+from aprspy import APRS, GenericPacket, PositionPacket, BeaconPacket
+from aprspy.dispatch import PacketRegistry, Dispatch, registry
+from aprspy.packets.telemetry_definition import TelemetryParameterNamePacket
+from aprspy.exceptions import UnsupportedError
+
+
+class WeatherPacket(GenericPacket):
+    def _parse(self) -> bool:
+        self.report = self._info
+        return True
+
+
+def test_dispatch_data_type():
+    dispatch = registry.dispatch("APRS", "=", "5030.50N/10020.30W$")
+
+    assert type(dispatch) is Dispatch
+    assert type(dispatch.packet) is PositionPacket
+    assert dispatch.data_type_id == "="
+    assert dispatch.info == "5030.50N/10020.30W$"
+
+
+def test_dispatch_beacon_hook():
+    dispatch = registry.dispatch("BEACON", "=", "5030.50N/10020.30W$")
+
+    assert type(dispatch.packet) is BeaconPacket
+
+
+def test_dispatch_telemetry_definition_hook():
+    dispatch = registry.dispatch("APRS", ":", "XX1XX-13 :PARM.Vin,Rx1h,Dg1h,Eff1h,Rx10m")
+
+    assert type(dispatch.packet) is TelemetryParameterNamePacket
+
+
+def test_dispatch_offset_position_hook():
+    dispatch = registry.dispatch("APRS", "X", "EST!5030.50N/10020.30W$")
+
+    assert type(dispatch.packet) is PositionPacket
+    assert dispatch.packet._offset == 3
+    assert dispatch.data_type_id == "!"
+    assert dispatch.info == "XEST!5030.50N/10020.30W$"
+
+
+def test_dispatch_unsupported():
+    with pytest.raises(UnsupportedError):
+        registry.dispatch("APRS", "_", "10090556c220s004g005t077")
+
+    with pytest.raises(UnsupportedError):
+        registry.dispatch("APRS", "%", "Unknown")
+
+
+def test_register_data_type():
+    r = PacketRegistry()
+    r.register_unsupported("_", "Positionless Weather Report")
+
+    with pytest.raises(UnsupportedError):
+        r.dispatch("APRS", "_", "10090556c220s004g005t077")
+
+    r.register_data_type("_", WeatherPacket)
+
+    assert type(r.dispatch("APRS", "_", "10090556c220s004g005t077").packet) is WeatherPacket
+
+
+def test_register_invalid_data_type():
+    with pytest.raises(TypeError):
+        PacketRegistry().register_data_type("_", str)
+
+
+def test_register_hook():
+    def hook(destination, data_type_id, info):
+        if destination == "APWX":
+            return Dispatch(WeatherPacket(), data_type_id, info)
+
+    r = PacketRegistry()
+    r.register_data_type(">", GenericPacket)
+    r.register_hook(hook)
+
+    assert type(r.dispatch("APWX", ">", "Test").packet) is WeatherPacket
+    assert type(r.dispatch("APRS", ">", "Test").packet) is GenericPacket
+
+    r.unregister_hook(hook)
+
+    assert type(r.dispatch("APWX", ">", "Test").packet) is GenericPacket
+
+    with pytest.raises(ValueError):
+        r.unregister_hook(hook)
+
+
+def test_parse_registered_data_type():
+    APRS.register_data_type("_", WeatherPacket)
+
+    try:
+        packet = APRS.parse("XX1XX>APRS,TCPIP*,qAC,T2TEST:_10090556c220s004g005t077")
+
+        assert type(packet) is WeatherPacket
+        assert packet.report == "10090556c220s004g005t077"
+
+    finally:
+        registry.register_unsupported("_", "Positionless Weather Report")
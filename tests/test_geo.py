@@ -0,0 +1,142 @@
+import random
+import pytest
+
+from geopy.distance import great_circle
+
+from aprspy import APRS
+from aprspy.geo import GridIndex, distance
+from aprspy.store import StationStore
+
+
+def test_distance():
+    assert distance(50.5, -100.3, 50.5, -100.3) == 0
+    assert distance(0, 0, 0, 180) == pytest.approx(20015.1, abs=0.1)
+
+    # The same as geopy's great circle distance (which uses the same radius)
+    assert distance(50.5, -100.3, 49.2, -123.1) == \
+        pytest.approx(great_circle((50.5, -100.3), (49.2, -123.1)).km)
+
+
+def test_update():
+    index = GridIndex()
+
+    index.update("XX1XX", 50.5, -100.3)
+    index.update("XX2XX", 50.6, -100.3)
+
+    assert len(index) == 2
+    assert "XX1XX" in index
+    assert index.get("XX1XX") == (50.5, -100.3)
+
+    # Move to another cell
+    index.update("XX1XX", 10.0, 10.0)
+
+    assert index.get("XX1XX") == (10.0, 10.0)
+    assert index.within_bbox(50, -101, 51, -100) == ["XX2XX"]
+    assert len(index._cells) == 2
+
+    assert index.remove("XX2XX") is True
+    assert index.remove("XX2XX") is False
+    assert index.get("XX2XX") is None
+
+    # Empty cells aren't kept
+    assert len(index._cells) == 1
+
+    with pytest.raises(ValueError):
+        index.update("XX3XX", 91, 0)
+
+    with pytest.raises(ValueError):
+        index.update("XX3XX", 0, -181)
+
+
+def test_within_bbox_antimeridian():
+    index = GridIndex()
+
+    index.update("east", -17.7, 178.4)
+    index.update("west", -17.7, -178.4)
+    index.update("elsewhere", -17.7, 170.0)
+
+    assert sorted(index.within_bbox(-20, 175, -15, -175)) == ["east", "west"]
+
+
+def test_within_radius():
+    index = GridIndex()
+
+    index.update("XX1XX", 50.508333, -100.338333)
+    index.update("XX2XX", 50.6, -100.3)
+    index.update("XX3XX", 51.5, -100.3)
+
+    found = index.within_radius(50.5, -100.3, 20)
+
+    assert [key for (key, _) in found] == ["XX1XX", "XX2XX"]
+    assert found[0][1] == pytest.approx(distance(50.5, -100.3, 50.508333, -100.338333))
+
+
+def test_within_radius_antimeridian_and_pole():
+    index = GridIndex()
+
+    index.update("east", 0, 179.9)
+    index.update("west", 0, -179.9)
+    index.update("pole", 89.9, 45)
+    index.update("other side", 89.9, -135)
+
+    assert sorted(key for (key, _) in index.within_radius(0, 180, 50)) == ["east", "west"]
+    assert sorted(key for (key, _) in index.within_radius(89.95, 0, 50)) == ["other side", "pole"]
+
+
+@pytest.mark.parametrize("cell_size", [0.1, 0.5, 5])
+def test_matches_brute_force(cell_size):
+    rng = random.Random(1)
+    index = GridIndex(cell_size=cell_size)
+
+    positions = {n: (rng.uniform(-90, 90), rng.uniform(-180, 180)) for n in range(2000)}
+
+    for (key, (latitude, longitude)) in positions.items():
+        index.update(key, latitude, longitude)
+
+    for _ in range(20):
+        (latitude, longitude) = (rng.uniform(-90, 90), rng.uniform(-180, 180))
+        radius = rng.uniform(10, 3000)
+
+        expected = {
+            key for (key, position) in positions.items()
+            if distance(latitude, longitude, *position) <= radius
+        }
+
+        assert {key for (key, _) in index.within_radius(latitude, longitude, radius)} == expected
+
+
+def test_invalid_cell_size():
+    with pytest.raises(ValueError):
+        GridIndex(cell_size=0)
+
+
+def test_station_store_index():
+    index = GridIndex()
+    store = StationStore(ttl=60, index=index)
+
+    store.update(APRS.parse(
+        'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet'
+    ), now=0)
+    store.update(APRS.parse('XX2XX>APRS,TCPIP*,qAC,FOURTH:>Test status'), now=30)
+
+    # Only stations with positions are indexed
+    assert index.within_bbox(50, -101, 51, -100) == ["XX1XX"]
+    assert len(index) == 1
+
+    # Stations are removed from the index as they expire
+    store.update(APRS.parse('XX2XX>APRS,TCPIP*,qAC,FOURTH:>Test status'), now=61)
+
+    assert len(index) == 0
+
+
+def test_station_store_load(tmp_path):
+    store = StationStore()
+
+    store.update(APRS.parse(
+        'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet'
+    ), now=0)
+    store.save(tmp_path / "stations.pickle")
+
+    loaded = StationStore.load(tmp_path / "stations.pickle", index=GridIndex())
+
+    assert [key for (key, _) in loaded.index.within_radius(50.5, -100.3, 10)] == ["XX1XX"]
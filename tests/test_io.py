@@ -0,0 +1,144 @@
+import io
+import gzip
+import pytest
+
+from datetime import datetime, UTC
+
+from aprspy import ParseFailure
+from aprspy.io import read, read_lines, parse, split_prefix
+from aprspy.packets.position import PositionPacket
+
+raw = 'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet'
+
+lines = [
+    "# aprsc 2.1.10-gd72a17c",
+    raw,
+    "1570713845 " + raw,
+    "1570713845.5: " + raw,
+    "2019-10-10T13:24:05Z " + raw,
+    "2019-10-10 13:24:05.250000+00:00: " + raw,
+    "",
+    "2019-10-10T13:24:05Z # logresp XX1XX verified, server T2TEST",
+    "XX1XX>APRS,TCPIP*,qAC,FOURTH:>Caf\xe9",
+]
+
+expected = [
+    (raw, None),
+    (raw, datetime(2019, 10, 10, 13, 24, 5, tzinfo=UTC)),
+    (raw, datetime(2019, 10, 10, 13, 24, 5, 500000, tzinfo=UTC)),
+    (raw, datetime(2019, 10, 10, 13, 24, 5, tzinfo=UTC)),
+    (raw, datetime(2019, 10, 10, 13, 24, 5, 250000, tzinfo=UTC)),
+    ("XX1XX>APRS,TCPIP*,qAC,FOURTH:>Caf\xe9", None),
+]
+
+
+def data(encoding="utf-8"):
+    return "\r\n".join(lines).encode(encoding) + b"\r\n"
+
+
+def test_split_prefix():
+    assert split_prefix(raw) == (raw, None)
+    assert split_prefix("1570713845 " + raw) == (raw, expected[1][1])
+    assert split_prefix("2019-10-10T13:24:05+01:00 " + raw) == (
+        raw, datetime(2019, 10, 10, 12, 24, 5, tzinfo=UTC)
+    )
+
+    # Callsigns can start with a digit, and invalid dates are left alone
+    assert split_prefix("2E0XXX>APRS:>Test") == ("2E0XXX>APRS:>Test", None)
+    assert split_prefix("2019-13-10T13:24:05Z " + raw) == ("2019-13-10T13:24:05Z " + raw, None)
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_read_plain(tmp_path, use_mmap):
+    path = tmp_path / "aprs.log"
+    path.write_bytes(data())
+
+    assert list(read(path, use_mmap=use_mmap)) == expected
+    assert list(read(str(path), use_mmap=use_mmap)) == expected
+
+
+def test_read_gzip(tmp_path):
+    path = tmp_path / "aprs.log.gz"
+
+    # Rotated logs may have been appended to, giving several gzip members
+    with gzip.open(path, "wb") as f:
+        f.write(data()[0:100])
+    with gzip.open(path, "ab") as f:
+        f.write(data()[100:])
+
+    assert list(read(path, buffer_size=16)) == expected
+
+
+def test_read_zstd(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+
+    path = tmp_path / "aprs.log.zst"
+    path.write_bytes(zstandard.ZstdCompressor().compress(data()))
+
+    assert list(read(path)) == expected
+
+
+def test_read_file_objects():
+    assert list(read(io.BytesIO(data()))) == expected
+    assert list(read(io.BytesIO(gzip.compress(data())))) == expected
+
+    # Unbuffered streams can't be peeked at
+    assert list(read(Unbuffered(data()))) == expected
+    assert list(read(Unbuffered(gzip.compress(data())))) == expected
+
+
+def test_read_latin_1():
+    assert list(read(io.BytesIO(data("latin-1")))) == expected
+
+
+def test_read_empty(tmp_path):
+    path = tmp_path / "empty.log"
+    path.write_bytes(b"")
+
+    assert list(read_lines(path)) == []
+    assert list(read(io.BytesIO(b""))) == []
+
+
+def test_read_lines_closes(tmp_path):
+    path = tmp_path / "aprs.log"
+    path.write_bytes(data())
+
+    f = open(path, "rb")
+    lines = read_lines(f)
+    next(lines)
+    lines.close()
+
+    # Files which are passed in are left open
+    assert not f.closed
+    f.close()
+
+
+def test_parse(tmp_path):
+    path = tmp_path / "aprs.log.gz"
+    path.write_bytes(gzip.compress(data()))
+
+    packets = list(parse(path, strict_mode=False))
+
+    assert len(packets) == 6
+    assert all(type(p) is PositionPacket for p in packets[0:5])
+    assert packets[0]._ts is None
+    assert packets[1]._ts == expected[1][1]
+    assert packets[5].source == "XX1XX"
+
+
+def test_parse_failure():
+    packets = list(parse(io.BytesIO(b"1570713845 XX1XXAPRS:>Test\n")))
+
+    assert type(packets[0]) is ParseFailure
+    assert packets[0].packet == "XX1XXAPRS:>Test"
+
+
+class Unbuffered(io.RawIOBase):
+    def __init__(self, data):
+        self.data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self.data.readinto(b)
@@ -2,6 +2,7 @@ import pytest
 
 from aprspy import APRS, MICEPacket
 from aprspy.exceptions import ParseError
+from aprspy.utils import APRSUtils
 
 # Input packet
 raw = r'XX1XX-1>U1PRSS-1,WIDE1-1,WIDE2-2,qAR,CALGRY:`*\Fl"Bk/]"?l}Test Mic-E packet'
@@ -167,6 +168,41 @@ def test_packets_klz_destination_bit():
         assert p.latitude == 51.033333
 
 
+def test_decode_latitude():
+    assert MICEPacket._decode_latitude("U1PRSS-1") == (
+        51.038833, 0, True, "W", 1, 0, 1, False
+    )
+    assert MICEPacket._decode_latitude("F1P2KK") == (
+        -51.033333, 2, True, "W", 1, 0, 1, True
+    )
+
+    # The result should be the same as decoding the equivalent uncompressed latitude
+    for (destination, latitude) in (("5LKZZZ", "5 0 .  N"), ("9KLLLL", "9   .  N"),
+                                    ("90PZZZ", "900 .  N"), ("4903L5", "4903. 5S")):
+        try:
+            expected = APRSUtils.decode_uncompressed_latitude(latitude)
+        except (ParseError, ValueError):
+            with pytest.raises(ParseError):
+                MICEPacket._decode_latitude(destination)
+        else:
+            assert MICEPacket._decode_latitude(destination)[0:2] == expected
+
+
+def test_decode_latitude_invalid():
+    for destination in ("U1PRS", "U1PRSa", "91PRSS", "K1PRSS"):
+        with pytest.raises(ParseError):
+            MICEPacket._decode_latitude(destination)
+
+
+def test_decode_latitude_cached():
+    MICEPacket._decode_destination.cache_clear()
+
+    first = MICEPacket._decode_latitude("U1PRSS-1")
+    assert MICEPacket._decode_latitude("U1PRSS-2") is first
+
+    assert MICEPacket._decode_destination.cache_info().hits == 1
+
+
 def test_packet_with_invalid_destination_bit():
     with pytest.raises(ParseError):
         APRS.parse(r'XX1XX-1>M1PRSS-1,WIDE1-1,WIDE2-2,qAR,CALGRY:`*\Fl"Bk/]"?l}Test Mic-E packet')
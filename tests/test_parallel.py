@@ -0,0 +1,82 @@
+import pytest
+
+from aprspy import APRS, ParseFailure
+from aprspy.checksum import Checksum, get_default, set_default
+from aprspy.parallel import parse_parallel, parse_file
+
+raw = [
+    'XX1XX-{}>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet'.format(n)
+    for n in range(1, 16)
+] + ['XX1XXAPRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$']
+
+
+def test_parse_parallel_ordered():
+    packets = list(parse_parallel(raw, workers=2, chunk_size=3))
+
+    assert len(packets) == len(raw)
+    assert [p.source for p in packets[:-1]] == ["XX1XX-{}".format(n) for n in range(1, 16)]
+    assert packets[0].latitude == 50.508333
+    assert str(packets[0].path) == "TCPIP*,qAC,FOURTH"
+
+    assert type(packets[-1]) is ParseFailure
+    assert packets[-1].packet == raw[-1]
+
+
+def test_parse_parallel_unordered():
+    packets = list(parse_parallel(raw, workers=2, chunk_size=3, ordered=False))
+
+    assert len(packets) == len(raw)
+    assert sorted(p.source for p in packets if type(p) is not ParseFailure) == \
+        sorted("XX1XX-{}".format(n) for n in range(1, 16))
+
+
+def test_parse_parallel_invalid_arguments():
+    with pytest.raises(ValueError):
+        list(parse_parallel(raw, workers=0))
+
+    with pytest.raises(ValueError):
+        list(parse_parallel(raw, chunk_size=0))
+
+
+def test_parse_file(tmp_path):
+    path = tmp_path / "packets.txt"
+    path.write_text("\n".join(raw[:-1]) + "\n")
+
+    packets = list(parse_file(path, workers=1, chunk_size=4))
+
+    assert [p.source for p in packets] == ["XX1XX-{}".format(n) for n in range(1, 16)]
+
+
+def test_parse_file_not_utf8(tmp_path):
+    # Lines which aren't valid UTF-8 are decoded as Latin-1, as with APRS.parse
+    lines = [raw[0].encode(), 'XX1XX>APRS,TCPIP*:>Caf\xe9'.encode("latin-1")]
+
+    path = tmp_path / "packets.txt"
+    path.write_bytes(b"\n".join(lines) + b"\n")
+
+    packets = list(parse_file(path, workers=1))
+
+    assert [p.to_json() for p in packets] == [p.to_json() for p in APRS.parse_many(lines)]
+    assert packets[1].status_message == "Caf\xe9"
+
+
+def test_parse_parallel_options():
+    packets = list(parse_parallel(raw[:2], workers=1, lazy=True, checksum=Checksum.BLAKE2B))
+
+    assert all(p._lazy is not None for p in packets)
+    assert [p.checksum for p in packets] == \
+        [p.checksum for p in APRS.parse_many(raw[:2], checksum=Checksum.BLAKE2B)]
+    assert packets[0].latitude == 50.508333
+
+
+def test_parse_parallel_default_checksum():
+    default = get_default()
+
+    try:
+        # The default set in this process is used by the workers
+        APRS.set_default_checksum(Checksum.BLAKE2B)
+        packets = list(parse_parallel(raw[:2], workers=1))
+    finally:
+        set_default(default)
+
+    assert all(type(p.checksum) is int for p in packets)
@@ -1,9 +1,12 @@
+import json
 import pytest
 
 from geopy import Point
-from datetime import datetime
+from datetime import datetime, UTC
 
 from aprspy import APRS
+from aprspy.packets import generic
+from aprspy.packets.generic import PacketJSONEncoder
 from aprspy.packets.position import PositionPacket, CompressionFix, CompressionSource, \
     CompressionOrigin
 from aprspy.exceptions import ParseError
@@ -504,3 +507,92 @@ def test_generate_with_radio_range(generated_packet):
     output = generated_packet.generate()
 
     assert output == "XX1XX>APRS,TCPIP:!5130.00N/10000.00WkRNG0050Test comment"
+
+
+def test_slots():
+    packet = APRS.parse(
+        'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet'
+    )
+
+    assert not hasattr(packet, '__dict__')
+
+    with pytest.raises(AttributeError):
+        packet.not_a_field = True
+
+
+def test_to_json():
+    packet = APRS.parse(
+        'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet'
+    )
+
+    j = json.loads(packet.to_json())
+
+    assert j["source"] == "XX1XX"
+    assert j["point"] == {"latitude": 50.508333, "longitude": -100.338333, "altitude": 5000}
+    assert j["course"] == 221
+    assert j["comment"] == "Test packet"
+
+    # Unset slots are omitted
+    assert "offset" not in j
+
+
+def test_to_json_fields():
+    packet = APRS.parse(
+        'XX1XX>APRS,TCPIP*,qAC,FOURTH:@092345z/5L!!<*e7>7P[Test packet',
+        timestamp=datetime(2019, 10, 10, 12, 0, tzinfo=UTC)
+    )
+
+    j = json.loads(packet.to_json())
+
+    # Timestamps are in ISO 8601 format, and stations, paths and enums are strings
+    assert j["timestamp"] == "2019-10-09T23:45:00+00:00"
+    assert j["ts"] == "2019-10-10T12:00:00+00:00"
+    assert j["path"] == "TCPIP*,qAC,FOURTH"
+    assert j["compression_fix"] == "OLD"
+    assert j["compression_origin"] == "COMPRESSED"
+
+    # Internal state isn't included
+    assert "lazy" not in j
+
+    assert packet.to_dict() == json.loads(json.dumps(packet, cls=PacketJSONEncoder))
+
+
+def test_to_json_orjson(monkeypatch):
+    pytest.importorskip("orjson")
+
+    packet = APRS.parse(
+        'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet \xe9'
+    )
+    j = packet.to_json()
+
+    # The output should be the same with or without orjson
+    monkeypatch.setattr(generic, "orjson", None)
+    assert packet.to_json() == j
+
+def test_dumps_orjson_differences(monkeypatch):
+    pytest.importorskip("orjson")
+
+    d = {"big": 1e16, "small": 1e-7, "nan": float("nan"), "latitude": 50.508333}
+    j = generic._dumps(d)
+
+    monkeypatch.setattr(generic, "orjson", None)
+    k = generic._dumps(d)
+
+    # Floats with an exponent are formatted differently, but have the same value
+    assert '"big":1e16' in j and '"big":1e+16' in k
+    assert '"small":1e-7' in j and '"small":1e-07' in k
+
+    # NaN is written as null by orjson
+    assert '"nan":null' in j and '"nan":NaN' in k
+
+    # Otherwise the values are the same
+    assert json.loads(j)["big"] == json.loads(k)["big"]
+    assert json.loads(j)["small"] == json.loads(k)["small"]
+    assert json.loads(j)["latitude"] == json.loads(k)["latitude"]
+
+
+def test_dumps_orjson_wide_int():
+    pytest.importorskip("orjson")
+
+    # orjson can't serialize ints wider than 64 bits, so the json module is used instead
+    assert generic._dumps({"wide": 2 ** 70}) == '{"wide":1180591620717411303424}'
@@ -0,0 +1,179 @@
+import pytest
+
+from datetime import datetime, UTC
+
+from aprspy import APRS, ParseFailure
+from aprspy.components import Station
+from aprspy.geo import GridIndex
+from aprspy.store import StationStore, StationRecord
+
+position = 'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet'
+status = 'XX1XX>APRS,WIDE1-1,qAR,XX2XX-10:>Test status'
+telemetry = 'XX2XX>APRS,TCPIP*,qAC,T2TEST:T#005,199,000,255,073,123,01101001'
+
+
+def test_update():
+    store = StationStore()
+
+    record = store.update(APRS.parse(position), now=100)
+
+    assert type(record) is StationRecord
+    assert record.station == "XX1XX"
+    assert record.latitude == 50.508333
+    assert record.altitude == 5000
+    assert record.comment == "Test packet"
+    assert record.position_heard == 100
+
+    # Each type of packet updates its own fields
+    store.update(APRS.parse(status), now=200)
+
+    assert record.status == "Test status"
+    assert record.latitude == 50.508333
+    assert record.last_heard == 200
+    assert record.path == "WIDE1-1,qAR,XX2XX-10"
+    assert record.packets == 2
+
+    store.update(APRS.parse(telemetry), now=300)
+
+    assert store.get("XX2XX").telemetry == (199.0, 0.0, 255.0, 73.0, 123.0, 0b01101001)
+
+    assert len(store) == 2
+    assert "XX1XX" in store
+    assert Station("XX2XX") in store
+    assert store["XX1XX"] is record
+    assert store.get("XX3XX") is None
+
+
+def test_update_timestamp():
+    store = StationStore()
+    arrived = datetime(2019, 10, 10, 12, 0, tzinfo=UTC)
+
+    record = store.update(APRS.parse(position, timestamp=arrived))
+
+    assert record.last_heard == arrived.timestamp()
+
+
+def test_update_many():
+    store = StationStore()
+
+    packets = [APRS.parse(position), ParseFailure(packet="", error=None), APRS.parse(telemetry)]
+
+    assert store.update_many(packets) == 2
+    assert [record.station for record in store] == ["XX1XX", "XX2XX"]
+
+
+def test_ttl():
+    store = StationStore(ttl=60)
+
+    store.update(APRS.parse(position), now=0)
+    store.update(APRS.parse(telemetry), now=30)
+    store.update(APRS.parse(status), now=50)
+
+    # XX1XX was heard again, so XX2XX is the first to expire
+    store.update(APRS.parse(status), now=95)
+
+    assert [record.station for record in store] == ["XX1XX"]
+
+    assert store.expire(now=200) == 1
+    assert len(store) == 0
+
+
+def test_out_of_order():
+    store = StationStore(ttl=60)
+
+    store.update(APRS.parse(position), now=0)
+    store.update(APRS.parse(telemetry), now=50)
+
+    # An older packet still updates the record, but last_heard doesn't go backwards
+    record = store.update(APRS.parse(status), now=40)
+
+    assert record.status_heard == 40
+    assert record.last_heard == 50
+    assert [record.station for record in store] == ["XX2XX", "XX1XX"]
+
+    # So the records stay in order, and expire in order
+    assert store.expire(now=111) == 2
+    assert len(store) == 0
+
+    # Packets older than the TTL have already expired, so are ignored
+    store.update(APRS.parse(position), now=200)
+
+    assert store.update(APRS.parse(telemetry), now=140) is None
+    assert "XX2XX" not in store
+
+
+def test_out_of_order_position():
+    store = StationStore(index=GridIndex())
+    south = position.replace("5030.50N", "4030.50N")
+
+    store.update(APRS.parse(position), now=110)
+
+    # A late packet doesn't replace the newer position, in the record or the index
+    record = store.update(APRS.parse(south), now=100)
+
+    assert record.latitude == 50.508333
+    assert record.position_heard == 110
+    assert record.last_heard == 110
+    assert record.packets == 2
+    assert store.index.get("XX1XX") == (50.508333, -100.338333)
+
+    # But other fields which haven't been heard since are still updated
+    store.update(APRS.parse(status), now=105)
+
+    assert record.status == "Test status"
+    assert record.status_heard == 105
+
+
+def test_update_lazy_error():
+    store = StationStore()
+    store.update(APRS.parse(position), now=100)
+
+    # Packets which can't be decoded are ignored, without changing the record
+    packets = [APRS.parse('XX1XX>APRS,TCPIP*,qAC,T2TEST:=5030.50N/10020.30W', lazy=True)]
+
+    assert store.update_many(packets) == 0
+    assert store["XX1XX"].packets == 1
+    assert store["XX1XX"].latitude == 50.508333
+
+    # When not in strict mode they have no position, so only the other fields are updated
+    packet = APRS.parse('XX1XX>APRS,TCPIP*,qAC,T2TEST:=5030.50N/10020.30W', strict_mode=False,
+                        lazy=True)
+
+    assert store.update(packet, now=200).latitude == 50.508333
+    assert store["XX1XX"].packets == 2
+
+
+def test_max_stations():
+    store = StationStore(max_stations=2)
+
+    for (n, callsign) in enumerate(["XX1XX", "XX2XX", "XX1XX", "XX3XX"]):
+        store.update(APRS.parse("{}>APRS,TCPIP*:>Test".format(callsign)), now=n)
+
+    # The station heard least recently is removed
+    assert [record.station for record in store] == ["XX1XX", "XX3XX"]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        StationStore(ttl=0)
+
+    with pytest.raises(ValueError):
+        StationStore(max_stations=0)
+
+
+def test_save_load(tmp_path):
+    store = StationStore(ttl=3600, max_stations=10)
+
+    store.update(APRS.parse(position), now=100)
+    store.update(APRS.parse(telemetry), now=200)
+
+    store.save(tmp_path / "stations.pickle")
+    loaded = StationStore.load(tmp_path / "stations.pickle")
+
+    assert loaded.ttl == 3600
+    assert loaded.max_stations == 10
+    assert [record.station for record in loaded] == ["XX1XX", "XX2XX"]
+    assert loaded["XX1XX"].latitude == 50.508333
+    assert loaded["XX2XX"].telemetry_heard == 200
+
+    assert [p.name for p in tmp_path.iterdir()] == ["stations.pickle"]
@@ -0,0 +1,55 @@
+import pytest
+
+from aprspy import APRS, GenericPacket
+from aprspy.tokenizer import Raw, tokenize, decode_text, is_valid_destination
+from aprspy.exceptions import ParseError
+
+
+def test_tokenize():
+    raw, data_type_id = tokenize(
+        'XX1XX>APRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$221/000/A=005000Test packet'
+    )
+
+    assert type(raw) is Raw
+    assert raw.source == "XX1XX"
+    assert raw.destination == "APRS"
+    assert raw.path == "TCPIP*,qAC,FOURTH"
+    assert data_type_id == "="
+    assert raw.information == "5030.50N/10020.30W$221/000/A=005000Test packet"
+
+
+def test_tokenize_information_with_colons():
+    raw, data_type_id = tokenize('XX1XX>APRS,TCPIP*,qAC,T2TEST::XX2XX    :Hello:there')
+
+    assert raw.path == "TCPIP*,qAC,T2TEST"
+    assert data_type_id == ":"
+    assert raw.information == "XX2XX    :Hello:there"
+
+
+def test_tokenize_invalid_packet():
+    with pytest.raises(ParseError):
+        # Missing > after source
+        tokenize('XX1XXAPRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$')
+
+    with pytest.raises(ParseError):
+        # Missing information field
+        tokenize('XX1XX>APRS,TCPIP*,qAC,FOURTH:')
+
+
+def test_decode_text():
+    assert decode_text("Café".encode()) == "Café"
+    assert decode_text("Café".encode("latin-1")) == "Café"
+    assert decode_text(memoryview(b"Test")) == "Test"
+
+
+def test_is_valid_destination():
+    assert is_valid_destination("APRS") is True
+    assert is_valid_destination("APRS-1") is True
+    assert is_valid_destination("aprs") is False
+    assert is_valid_destination("APRS-XX") is False
+
+
+def test_parse_invalid_header_non_strict():
+    packet = APRS.parse('XX1XXAPRS,TCPIP*,qAC,FOURTH:=5030.50N/10020.30W$', strict_mode=False)
+
+    assert type(packet) is GenericPacket
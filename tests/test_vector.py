@@ -0,0 +1,227 @@
+import math
+import random
+import pytest
+
+from aprspy import APRS, base91
+from aprspy.exceptions import ParseError
+from aprspy.packets.position import PositionPacket
+from aprspy.utils import APRSUtils
+
+np = pytest.importorskip("numpy")
+
+from aprspy import vector  # noqa: E402
+
+fields = [
+    "=/5L!!<*e7>7P[comment",
+    "!/5L!!<*e7>{?!",
+    "@092345z/5L!!<*e7>S]S",
+    "/092345z\\5L!!<*e7>  !",
+    "=4903.50N/07201.75W-Test",
+    ">status",
+    "=/5L!",
+    "!/5L! <*e7>7P[",
+    "!/5L!!<*e7>|P[",
+]
+
+
+def scalar(field):
+    """
+    Parse a compressed position with the packet parser, returning None if it can't be parsed.
+    """
+    offset = 8 if field[0] in "/@" else 1
+
+    try:
+        return PositionPacket._parse_compressed_position(field[offset:offset + 13])
+    except (ParseError, ValueError):
+        return None
+
+
+def assert_matches(fields, decoded):
+    for (n, i) in enumerate(decoded.index):
+        expected = scalar(fields[i])
+
+        if expected is None:
+            assert not decoded.valid[n]
+            assert math.isnan(decoded.latitude[n])
+            continue
+
+        assert decoded.valid[n]
+
+        (latitude, longitude, altitude, course, speed, radio_range) = expected[0:6]
+        for (value, array) in ((latitude, decoded.latitude), (longitude, decoded.longitude),
+                               (altitude, decoded.altitude), (course, decoded.course),
+                               (speed, decoded.speed), (radio_range, decoded.radio_range)):
+            if value is None:
+                assert math.isnan(array[n])
+            else:
+                assert array[n] == value
+
+
+def test_decode_compressed():
+    decoded = vector.decode_compressed(fields)
+
+    # Only the compressed positions are picked out
+    assert list(decoded.index) == [0, 1, 2, 3, 7, 8]
+    assert list(decoded.valid) == [True, True, True, True, False, False]
+
+    assert decoded.latitude[0] == 49.5
+    assert decoded.longitude[0] == -72.750004
+    assert decoded.course[0] == 88
+    assert decoded.speed[0] == 36.2
+    assert math.isnan(decoded.altitude[0])
+
+    assert decoded.radio_range[1] == 20.13
+    assert decoded.altitude[2] == 10004.52
+    assert math.isnan(decoded.course[3])
+
+    assert bytes(decoded.symbol_table) == b"///\\//"
+    assert bytes(decoded.symbol_id) == b">>>>>>"
+
+    assert_matches(fields, decoded)
+
+
+def test_decode_compressed_buffer():
+    buffer = "\n".join(fields).encode()
+
+    decoded = vector.decode_compressed(buffer)
+
+    assert list(decoded.index) == [0, 1, 2, 3, 7, 8]
+    assert_matches(fields, decoded)
+
+
+def test_decode_compressed_empty():
+    for empty in ([], b""):
+        decoded = vector.decode_compressed(empty)
+        assert len(decoded.index) == 0
+
+
+def test_decode_compressed_random():
+    random.seed(1)
+    data = []
+
+    for _ in range(5000):
+        lat = base91.encode_latitude(random.uniform(-90, 90))
+        lng = base91.encode_longitude(random.uniform(-180, 180))
+        (c, s, t) = (chr(random.randint(32, 126)) for _ in range(3))
+        data.append("{}/{}{}>{}{}{}".format(random.choice("!=/@"), lat, lng, c, s, t))
+
+        if data[-1][0] in "/@":
+            data[-1] = data[-1][0] + "092345z" + data[-1][1:]
+
+    decoded = vector.decode_compressed(data)
+
+    assert len(decoded.index) == len(data)
+    assert_matches(data, decoded)
+
+
+def test_decode_compressed_matches_packets():
+    packets = [APRS.parse("XX1XX>APRS,WIDE1-1:{}".format(f), strict_mode=False) for f in fields]
+    decoded = vector.decode_compressed(fields)
+
+    for (n, i) in enumerate(decoded.index):
+        if decoded.valid[n]:
+            assert packets[i].latitude == decoded.latitude[n]
+            assert packets[i].longitude == decoded.longitude[n]
+
+
+def test_decode_uncompressed_latitude():
+    latitudes = ["4903.50N", "4903.5 N", "4903.  N", "490 .  S", "49  .  S", "9100.00N", "49O3.50N",
+                 "4903,50N", "4903.50X"]
+
+    (latitude, ambiguity, valid) = vector.decode_uncompressed_latitude(latitudes)
+
+    assert list(valid) == [True] * 5 + [False] * 4
+    assert list(ambiguity) == [0, 1, 2, 3, 4, 0, 0, 0, 0]
+
+    for (n, raw) in enumerate(latitudes[0:5]):
+        assert (latitude[n], ambiguity[n]) == APRSUtils.decode_uncompressed_latitude(raw)
+
+    assert all(math.isnan(lat) for lat in latitude[5:])
+
+    # A buffer, or an array of bytes, gives the same result
+    buffer = "".join(latitudes).encode()
+    assert list(vector.decode_uncompressed_latitude(buffer)[2]) == list(valid)
+
+    columns = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, 8)
+    assert list(vector.decode_uncompressed_latitude(columns)[1]) == list(ambiguity)
+
+
+def test_decode_uncompressed_longitude():
+    longitudes = ["07201.75W", "07201.7 W", "07201.  E", "0720 .  E", "072  .  W", "18100.00W",
+                  "27201.75W", "07201.75X"]
+
+    (longitude, valid) = vector.decode_uncompressed_longitude(longitudes)
+
+    assert list(valid) == [True] * 5 + [False] * 3
+
+    for (n, raw) in enumerate(longitudes[0:5]):
+        assert longitude[n] == APRSUtils.decode_uncompressed_longitude(raw)
+
+    # The ambiguity can be applied to all of the longitudes, or to each
+    for level in range(5):
+        (longitude, valid) = vector.decode_uncompressed_longitude(longitudes[0:1], level)
+        assert longitude[0] == APRSUtils.decode_uncompressed_longitude(longitudes[0], level)
+
+    (longitude, valid) = vector.decode_uncompressed_longitude(longitudes[0:1] * 6,
+                                                              np.arange(6))
+    assert list(valid) == [True] * 5 + [False]
+    assert list(longitude[0:5]) == [
+        APRSUtils.decode_uncompressed_longitude(longitudes[0], level) for level in range(5)
+    ]
+
+
+def test_decode_uncompressed_invalid_width():
+    with pytest.raises(ValueError):
+        vector.decode_uncompressed_latitude(b"4903.50N4903")
+
+    with pytest.raises(ValueError):
+        vector.decode_uncompressed_longitude(np.zeros((2, 8), dtype=np.uint8))
+
+
+def test_decode_uncompressed():
+    data = fields + [
+        "!4903.5 N/07201.75W-Test",
+        "@092345z4903.50S\\07201.75E>",
+        "=9903.50N/07201.75W-",
+        "=4903.50N/07201.75W",
+    ]
+
+    decoded = vector.decode_uncompressed(data)
+
+    assert list(decoded.index) == [4, 9, 10, 11]
+    assert list(decoded.valid) == [True, True, True, False]
+    assert list(decoded.ambiguity) == [0, 1, 0, 0]
+    assert bytes(decoded.symbol_table) == b"//\\/"
+    assert bytes(decoded.symbol_id) == b"-->-"
+
+    for (n, i) in enumerate(decoded.index):
+        packet = APRS.parse("XX1XX>APRS,WIDE1-1:{}".format(data[i]), strict_mode=False)
+
+        if decoded.valid[n]:
+            assert packet.latitude == decoded.latitude[n]
+            assert packet.longitude == decoded.longitude[n]
+            assert packet.ambiguity == decoded.ambiguity[n]
+        else:
+            assert type(packet) is not PositionPacket
+            assert math.isnan(decoded.latitude[n])
+
+
+def test_decode_uncompressed_random():
+    random.seed(2)
+    data = []
+
+    for _ in range(5000):
+        lat = APRSUtils.encode_uncompressed_latitude(random.uniform(-90, 90),
+                                                     random.randint(0, 4))
+        lng = APRSUtils.encode_uncompressed_longitude(random.uniform(-180, 180))
+        data.append("!{}/{}-".format(lat, lng))
+
+    decoded = vector.decode_uncompressed(data)
+
+    assert decoded.valid.all()
+
+    for (n, field) in enumerate(data):
+        (lat, lng, ambiguity) = PositionPacket._parse_uncompressed_position(field[1:])[0:3]
+
+        assert (decoded.latitude[n], decoded.longitude[n], decoded.ambiguity[n]) == \
+            (lat, lng, ambiguity)